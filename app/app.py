@@ -1,14 +1,79 @@
+import hashlib
 import os
-import streamlit as st
+import sys
 import pandas as pd
+import streamlit as st
+
+# Put optimizer/ on the path, as optimizer/app.py runs with it, so `optimizer` is the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "optimizer"))
+
 from optimizer.builder import optimize_lineup
-from optimizer.opto_utils import preprocess_player_pool, display_player_exposures, ROSTER_REQUIREMENTS
+from optimizer.constants import ROSTER_REQUIREMENTS
+from optimizer.opto_utils import calculate_player_exposures, preprocess_player_pool
 from sidebar import render_sidebar
 from build_overview_tab import render_build_overview_tab
 from lineup_details_tab import render_lineup_details_tab
 from load_projections_table import show_initial_table
 
 
+@st.cache_data(max_entries=4)
+def file_hash(path, mtime_ns, size):
+    """
+    Returns the SHA-256 of a file's content, rehashing only when its stat changes.
+
+    Args:
+        path (str): Path to the file.
+        mtime_ns (int): Modification time of the file, part of the cache key.
+        size (int): Size of the file in bytes, part of the cache key.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@st.cache_data(max_entries=4)
+def load_player_pool(projections_path, pool_hash):
+    """
+    Loads and preprocesses the player pool once per distinct file content.
+
+    Args:
+        projections_path (str): Path to the merged projections CSV.
+        pool_hash (str): Content hash of the file, the part of the cache key that matters.
+
+    Returns:
+        pd.DataFrame: The preprocessed player pool.
+    """
+    return preprocess_player_pool(pd.read_csv(projections_path))
+
+
+@st.cache_data(max_entries=16)
+def build_lineups(_player_pool, pool_hash, num_lineups, min_salary, max_salary, min_uniques):
+    """
+    Runs the optimizer once per distinct pool and settings; reruns return the cached build.
+
+    Args:
+        _player_pool (pd.DataFrame): The preprocessed player pool (not hashed, see `pool_hash`).
+        pool_hash (str): Content hash of the projections file.
+        num_lineups (int): Number of lineups to generate.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        min_uniques (int): Minimum unique players across lineups.
+
+    Returns:
+        list of pd.DataFrame: The optimized lineups.
+    """
+    return optimize_lineup(
+        player_pool=_player_pool.copy(),
+        roster_requirements=ROSTER_REQUIREMENTS,
+        num_lineups=num_lineups,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        min_uniques=min_uniques,
+    )
+
+
 def main():
     # Set the page configuration
     st.set_page_config(page_title="NFL Lineup Optimizer", layout="wide")
@@ -23,11 +88,14 @@ def main():
     base_dir = os.path.dirname(os.path.abspath(__file__))
     projections_path = os.path.join(base_dir, "../data/merged_projections.csv")
 
+    # Load and preprocess player pool, reparsing only when the file content changes
+    stat = os.stat(projections_path)
+    pool_hash = file_hash(projections_path, stat.st_mtime_ns, stat.st_size)
+    st.session_state.player_pool = load_player_pool(projections_path, pool_hash)
+    st.session_state.pool_hash = pool_hash
+
     # Session state initialization
-    if "player_pool" not in st.session_state:
-        # Load and preprocess player pool
-        st.session_state.player_pool = pd.read_csv(projections_path)
-        st.session_state.player_pool = preprocess_player_pool(st.session_state.player_pool)
+    if "all_lineups" not in st.session_state:
         st.session_state.all_lineups = None
         st.session_state.player_exposures = None
 
@@ -42,9 +110,9 @@ def main():
     if build_settings["optimize_button"]:
         # Run optimization
         st.info("Running optimizer...")
-        all_lineups = optimize_lineup(
-            player_pool=st.session_state.player_pool,
-            roster_requirements=ROSTER_REQUIREMENTS,
+        all_lineups = build_lineups(
+            st.session_state.player_pool,
+            st.session_state.pool_hash,
             num_lineups=build_settings["num_lineups"],
             min_salary=build_settings["min_salary"],
             max_salary=build_settings["max_salary"],
@@ -53,7 +121,7 @@ def main():
 
         # Store the results in session state
         st.session_state.all_lineups = all_lineups
-        st.session_state.player_exposures = display_player_exposures(all_lineups)
+        st.session_state.player_exposures = calculate_player_exposures(all_lineups)
 
         # Display success notification
         st.success("Optimization Complete!")
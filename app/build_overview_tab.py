@@ -25,11 +25,15 @@ def summarize_lineups(all_lineups):
     Summarizes the lineups by calculating aggregate stats.
 
     Args:
-        all_lineups (list): List of DataFrames representing the lineups.
+        all_lineups (list): List of DataFrames representing the lineups, or a LineupSet.
 
     Returns:
         pd.DataFrame: Summary of the build.
     """
+    # A LineupSet computes the totals straight from its lineup matrix
+    if hasattr(all_lineups, "summary"):
+        return all_lineups.summary()
+
     total_salary = [lineup["Salary"].sum() for lineup in all_lineups]
     total_proj_score = [lineup["ProjPts"].sum() for lineup in all_lineups]
     total_proj_ownership = [lineup["ProjOwn"].sum() for lineup in all_lineups]
@@ -40,11 +40,15 @@ def format_lineups_as_rows(all_lineups):
     Format the lineups for a condensed single-row display in a DataFrame.
 
     Args:
-        all_lineups (list): List of DataFrames representing generated lineups.
+        all_lineups (list): List of DataFrames representing generated lineups, or a LineupSet.
 
     Returns:
         pd.DataFrame: DataFrame with lineups formatted as rows.
     """
+    # A LineupSet formats every lineup straight from its lineup matrix
+    if hasattr(all_lineups, "format_rows"):
+        return all_lineups.format_rows()
+
     formatted_lineups = []
 
     for i, lineup in enumerate(all_lineups):
@@ -1,8 +1,29 @@
+import argparse
+import json
 import os
+import sqlite3
+import sys
+import time
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import shutil
 
+# Make the optimizer package importable for the columnar writer
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "optimizer"))
+from optimizer.columnar import update_columnar, write_columnar
+from optimizer.matching import match_players
+
+# Output and watcher files, relative to the directory the script runs in
+MERGED_FILE = 'merged_projections.csv'
+HISTORY_FILE = 'projection_history.sqlite'
+STATUS_FILE = 'ingest_status.json'
+MATCH_REPORT_FILE = 'merge_report.csv'
+POLL_SECONDS = 2.0
+
+# Projection columns versioned in the history store, and their fill for unprojected players
+PROJECTION_DEFAULTS = {'ProjPts': 0, 'ProjOwn': 0}
+
 def find_csv_with_keywords(*keywords):
     """
     Search the current directory for a CSV file containing all specified keywords in its name.
@@ -18,25 +39,85 @@ def find_csv_with_keywords(*keywords):
             return file
     raise FileNotFoundError(f"No CSV file found with keywords: {', '.join(keywords)}.")
 
-def merge_dk_ftn(dk_file, ftn_file):
+def id_strings(ids):
     """
-    Merge the DraftKings CSV with the FTN projections CSV based on the 'Id' column.
+    Convert an Id column to strings, keeping integer ids integral when some are missing.
 
     Args:
-        dk_file (str): Path to the DraftKings CSV file.
-        ftn_file (str): Path to the FTN projections CSV file.
+        ids (pd.Series): Ids as read from a CSV.
 
     Returns:
-        pd.DataFrame: Merged DataFrame.
+        pd.Series: Ids as strings, "" where missing.
     """
-    # Load the DraftKings and FTN projections files
-    dk_df = pd.read_csv(dk_file)
-    ftn_df = pd.read_csv(ftn_file)
+    if pd.api.types.is_float_dtype(ids):
+        ids = ids.astype('Int64')
+    return ids.astype(str).where(ids.notna(), '')
+
+def standardize_ids(dk_df, ftn_df):
+    """
+    Copy both files with a string 'Id' column, adding an empty one to projections that lack ids.
+
+    Args:
+        dk_df (pd.DataFrame): DraftKings salaries, as read from the CSV.
+        ftn_df (pd.DataFrame): FTN projections, as read from the CSV.
+
+    Returns:
+        tuple: (dk_df, ftn_df) copies.
+    """
+    dk_df = dk_df.rename(columns={'ID': 'Id'})
+    ftn_df = ftn_df.copy()
+    dk_df['Id'] = id_strings(dk_df['Id'])
+    ftn_df['Id'] = id_strings(ftn_df['Id']) if 'Id' in ftn_df.columns else ''
+    return dk_df, ftn_df
+
+def attach_dk_ids(dk_df, ftn_df):
+    """
+    Fill in DraftKings ids for projection rows whose Id doesn't match, by name, team and position.
+
+    Args:
+        dk_df (pd.DataFrame): DraftKings salaries with string ids, see `standardize_ids`.
+        ftn_df (pd.DataFrame): Projections with string ids, see `standardize_ids`.
+
+    Returns:
+        tuple: (ftn_df with the matched ids filled in, matches, report), see
+            `optimizer.matching.match_players`.
+    """
+    has_id = ftn_df['Id'].isin(dk_df['Id'])
+    unmatched_dk = ~dk_df['Id'].isin(ftn_df.loc[has_id, 'Id'])
+    matches, report = match_players(dk_df[unmatched_dk], ftn_df[~has_id])
+
+    ftn_df = ftn_df.copy()
+    ftn_df.loc[matches['source_index'], 'Id'] = dk_df.loc[matches['dk_index'], 'Id'].to_numpy()
+    print(
+        f"Matched {has_id.sum()} projections by Id and {len(matches)} by name "
+        f"({(matches['method'] == 'fuzzy').sum()} fuzzy); "
+        f"{(report['status'] == 'ambiguous').sum()} ambiguous and "
+        f"{(report['status'] == 'unmatched').sum()} unmatched rows reported"
+    )
+    return ftn_df, matches, report
+
+def merge_frames(dk_df, ftn_df, report_file=None):
+    """
+    Merge DraftKings salaries with FTN projections on the 'Id' column.
+
+    Projection rows without a matching Id fall back to a name, team and position
+    match, see `attach_dk_ids`.
+
+    Args:
+        dk_df (pd.DataFrame): DraftKings salaries, as read from the CSV.
+        ftn_df (pd.DataFrame): FTN projections, as read from the CSV.
+        report_file (str): Where to write the unmatched and ambiguous rows, if anywhere.
 
+    Returns:
+        pd.DataFrame: Merged DataFrame.
+    """
     # Standardize headers for merge consistency
-    dk_df.rename(columns={'ID': 'Id'}, inplace=True)
-    dk_df['Id'] = dk_df['Id'].astype(str)
-    ftn_df['Id'] = ftn_df['Id'].astype(str)
+    dk_df, ftn_df = standardize_ids(dk_df, ftn_df)
+
+    # Give projections from sources without DraftKings ids the id of their player
+    ftn_df, _, report = attach_dk_ids(dk_df, ftn_df)
+    if report_file:
+        report.to_csv(report_file, index=False)
 
     # Merge the files (left join to retain all DraftKings players)
     merged_df = dk_df.merge(ftn_df, on='Id', how='left')
@@ -51,6 +132,348 @@ def merge_dk_ftn(dk_file, ftn_file):
 
     return merged_df
 
+def merge_dk_ftn(dk_file, ftn_file, report_file=None):
+    """
+    Merge the DraftKings CSV with the FTN projections CSV based on the 'Id' column.
+
+    Args:
+        dk_file (str): Path to the DraftKings CSV file.
+        ftn_file (str): Path to the FTN projections CSV file.
+        report_file (str): Where to write the unmatched and ambiguous rows, if anywhere.
+
+    Returns:
+        pd.DataFrame: Merged DataFrame.
+    """
+    # Load the DraftKings and FTN projections files
+    dk_df = pd.read_csv(dk_file)
+    ftn_df = pd.read_csv(ftn_file)
+
+    return merge_frames(dk_df, ftn_df, report_file)
+
+def update_projections(merged_df, ftn_df):
+    """
+    Apply a new FTN projections file to an existing merge, touching only changed rows.
+
+    The result matches a full `merge_frames` of the same DraftKings file with `ftn_df`:
+    players missing from the new file fall back to the default projections, and FTN
+    columns the merge doesn't have yet are added. Only the changed rows get a new
+    'merge_time', so it records when each player's projections last changed.
+
+    Args:
+        merged_df (pd.DataFrame): The current merge, as returned by `merge_frames`.
+        ftn_df (pd.DataFrame): The new FTN projections, with string ids attached
+            (see `attach_dk_ids`).
+
+    Returns:
+        tuple: (merged DataFrame, list of the Ids whose FTN columns changed).
+    """
+    ftn_df = ftn_df[ftn_df['Id'] != ''].drop_duplicates('Id', keep='last').set_index('Id')
+
+    # FTN columns that collided with DraftKings columns carry the merge's "_y" suffix
+    columns = {
+        column: f"{column}_y" if f"{column}_y" in merged_df.columns else column
+        for column in ftn_df.columns
+    }
+    update = ftn_df.reindex(merged_df['Id']).rename(columns=columns).reset_index(drop=True)
+    update.index = merged_df.index
+    for column, default in PROJECTION_DEFAULTS.items():
+        update[column] = update[column].fillna(default)
+
+    # Columns the new file brings start out empty, so their filled rows count as changed
+    merged_df = merged_df.copy()
+    for column in update.columns.difference(merged_df.columns):
+        merged_df[column] = update[column].iloc[:0].reindex(merged_df.index)
+
+    # A row changed when any FTN column differs, treating missing values as equal
+    current = merged_df[update.columns]
+    changed = ((current != update) & ~(current.isna() & update.isna())).any(axis=1).to_numpy()
+
+    if changed.any():
+        for column in update.columns:
+            merged_df.loc[changed, column] = update.loc[changed, column]
+        merged_df.loc[changed, 'merge_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return merged_df, merged_df.loc[changed, 'Id'].tolist()
+
+def changed_ids(previous_df, merged_df):
+    """
+    List the Ids whose projections differ between two merges.
+
+    Args:
+        previous_df (pd.DataFrame): The earlier merge, or None.
+        merged_df (pd.DataFrame): The new merge.
+
+    Returns:
+        list: Ids that are new or whose projection columns changed.
+    """
+    columns = list(PROJECTION_DEFAULTS)
+    current = merged_df.drop_duplicates('Id').set_index('Id')[columns]
+    if previous_df is None:
+        return current.index.tolist()
+    previous = previous_df.drop_duplicates('Id').set_index('Id')[columns].reindex(current.index)
+    return current.index[(current != previous).any(axis=1)].tolist()
+
+def changed_cells(previous_df, merged_df):
+    """
+    Find the rows and columns where a merge differs from the one written before it.
+
+    Args:
+        previous_df (pd.DataFrame): The merge last written, or None.
+        merged_df (pd.DataFrame): The new merge.
+
+    Returns:
+        tuple: (boolean row mask, list of changed columns), or None when the two merges
+            don't share the same rows, columns and dtypes and can't be compared cell by cell.
+    """
+    if (
+        previous_df is None
+        or not previous_df.index.equals(merged_df.index)
+        or list(previous_df.columns) != list(merged_df.columns)
+        or not previous_df.dtypes.equals(merged_df.dtypes)
+    ):
+        return None
+    same = (previous_df == merged_df) | (previous_df.isna() & merged_df.isna())
+    return ~same.all(axis=1).to_numpy(), merged_df.columns[~same.all(axis=0)].tolist()
+
+def write_merged(merged_df, output, previous_df=None):
+    """
+    Save a merge as CSV plus its columnar bundle, rewriting only what changed since the last save.
+
+    When `previous_df` is the merge last written to `output` and differs only cell by cell,
+    just the changed rows are rendered and spliced between the saved lines of the others,
+    and just the changed columns are re-encoded into the bundle. Both files are still
+    replaced through a rename, so readers never see a partial write. Anything else, such
+    as a new column or a quoted line break, writes both files from scratch.
+
+    Args:
+        merged_df (pd.DataFrame): The merge to save.
+        output (str): Path of the merged projections CSV.
+        previous_df (pd.DataFrame): The merge last written to `output`, if any.
+
+    Returns:
+        int: Number of rows rendered into the CSV.
+    """
+    diff = changed_cells(previous_df, merged_df) if os.path.exists(output) else None
+    if diff is not None:
+        rows, columns = diff
+        with open(output, 'rb') as f:
+            lines = f.read().splitlines(keepends=True)
+        rendered = merged_df[rows].to_csv(index=False, header=False, lineterminator=os.linesep)
+        rendered = rendered.encode().splitlines(keepends=True)
+        if len(lines) == len(merged_df) + 1 and len(rendered) == rows.sum():
+            for position, line in zip(np.flatnonzero(rows) + 1, rendered):
+                lines[position] = line
+            temp_path = output + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(b''.join(lines))
+            os.replace(temp_path, output)
+            update_columnar(merged_df, output, columns)
+            return int(rows.sum())
+
+    temp_path = output + '.tmp'
+    merged_df.to_csv(temp_path, index=False, lineterminator=os.linesep)
+    os.replace(temp_path, output)
+    write_columnar(merged_df, output)
+    return len(merged_df)
+
+class ProjectionHistory:
+    """
+    Versioned projection snapshots in one SQLite file.
+
+    Each version stores only the players whose projections changed, so a Sunday of
+    news updates costs a few rows per update. Any past version is rebuilt by taking
+    each player's latest row at or before it.
+    """
+
+    def __init__(self, path=HISTORY_FILE):
+        """
+        Args:
+            path (str): SQLite file holding the history. Created if missing.
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS versions (
+                version INTEGER PRIMARY KEY,
+                created TEXT NOT NULL,
+                source TEXT NOT NULL,
+                players_changed INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS projections (
+                Id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                ProjPts REAL NOT NULL,
+                ProjOwn REAL NOT NULL,
+                PRIMARY KEY (Id, version)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def latest_version(self):
+        """Returns the newest version number, or 0 for an empty history."""
+        return self.connection.execute("SELECT COALESCE(MAX(version), 0) FROM versions").fetchone()[0]
+
+    def record(self, merged_df, ids, source):
+        """
+        Saves the projections of the changed players as a new version.
+
+        Args:
+            merged_df (pd.DataFrame): The merge the changes come from.
+            ids (list): Ids of the players whose projections changed.
+            source (str): File that triggered the version.
+
+        Returns:
+            int: The new version number.
+        """
+        version = self.latest_version() + 1
+        rows = merged_df.drop_duplicates('Id').set_index('Id').loc[ids, list(PROJECTION_DEFAULTS)]
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO versions VALUES (?, ?, ?, ?)",
+                (version, datetime.now().isoformat(timespec='seconds'), source, len(ids)),
+            )
+            self.connection.executemany(
+                "INSERT INTO projections VALUES (?, ?, ?, ?)",
+                [(player_id, version, float(pts), float(own)) for player_id, pts, own in rows.itertuples()],
+            )
+        return version
+
+    def snapshot(self, version=None):
+        """
+        Rebuilds the projections as they stood at a version.
+
+        Args:
+            version (int): Version to rebuild. Defaults to the latest.
+
+        Returns:
+            pd.DataFrame: Id, ProjPts and ProjOwn for every player seen up to `version`.
+        """
+        version = self.latest_version() if version is None else version
+        query = """
+            SELECT p.Id, p.ProjPts, p.ProjOwn FROM projections p
+            JOIN (SELECT Id, MAX(version) AS version FROM projections WHERE version <= ? GROUP BY Id) latest
+            ON p.Id = latest.Id AND p.version = latest.version
+        """
+        return pd.read_sql_query(query, self.connection, params=(version,))
+
+    def versions(self):
+        """Returns one row per version: number, creation time, source file and players changed."""
+        return pd.read_sql_query("SELECT * FROM versions ORDER BY version", self.connection)
+
+def file_stamp(path):
+    """(mtime_ns, size) of a file, used to notice rewrites in place."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def write_status(status, path=STATUS_FILE):
+    """Atomically publishes the latest ingest for running optimizer sessions to pick up."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(status, f)
+    os.replace(temp_path, path)
+
+class MergeWatcher:
+    """
+    Keeps the merged projections current while DraftKings and FTN files arrive.
+
+    A new or rewritten DraftKings file triggers a full merge. A new FTN projections
+    file only updates the rows whose projections changed. Each ingest rewrites only
+    the changed rows of the merged CSV and the changed columns of its columnar bundle
+    (see `write_merged`), records a history version and publishes a status file that
+    running optimizer sessions poll.
+    """
+
+    def __init__(self, output=MERGED_FILE, history=None, status_file=STATUS_FILE):
+        """
+        Args:
+            output (str): Path of the merged projections CSV.
+            history (ProjectionHistory): Snapshot store. Defaults to `HISTORY_FILE`.
+            status_file (str): Path of the status file read by the optimizer app.
+        """
+        self.output = output
+        self.history = history or ProjectionHistory()
+        self.status_file = status_file
+        self.dk_stamp = None
+        self.dk_df = None
+        self.ftn_df = None
+        self.merged_df = None
+        self.output_stamp = None
+
+    def poll(self):
+        """
+        Ingests whatever changed since the last poll.
+
+        Returns:
+            int: The new history version, or None if nothing changed.
+        """
+        try:
+            dk_file = find_csv_with_keywords('DK', 'Salaries')
+        except FileNotFoundError:
+            return None
+        try:
+            ftn_file = find_csv_with_keywords('ftn', 'projections')
+        except FileNotFoundError:
+            ftn_file = None
+
+        # Only splice into the output while it is still the file the last merge wrote
+        previous_df = self.merged_df
+        written_df = previous_df
+        if not os.path.exists(self.output) or file_stamp(self.output) != self.output_stamp:
+            written_df = None
+
+        # Full merge when the salaries change; incremental update when only projections do
+        if (dk_file, file_stamp(dk_file)) != self.dk_stamp:
+            ftn_df = pd.read_csv(ftn_file) if ftn_file else self.ftn_df
+            if ftn_df is None:
+                return None
+            start = time.perf_counter()
+            self.dk_stamp = (dk_file, file_stamp(dk_file))
+            self.dk_df = pd.read_csv(dk_file)
+            self.merged_df = merge_frames(self.dk_df, ftn_df, MATCH_REPORT_FILE)
+            ids = changed_ids(previous_df, self.merged_df)
+            source = dk_file
+        elif ftn_file:
+            start = time.perf_counter()
+            ftn_df = pd.read_csv(ftn_file)
+            dk_df, matched_df = standardize_ids(self.dk_df, ftn_df)
+            matched_df, _, report = attach_dk_ids(dk_df, matched_df)
+            report.to_csv(MATCH_REPORT_FILE, index=False)
+            self.merged_df, ids = update_projections(self.merged_df, matched_df)
+            source = ftn_file
+        else:
+            return None
+
+        self.ftn_df = ftn_df
+        write_merged(self.merged_df, self.output, written_df)
+        self.output_stamp = file_stamp(self.output)
+        version = self.history.record(self.merged_df, ids, source)
+        if ftn_file:
+            move_ftn_to_previous(ftn_file)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        write_status(
+            {
+                "version": version,
+                "updated": datetime.now().isoformat(timespec='seconds'),
+                "source": source,
+                "players_changed": len(ids),
+                "changed_ids": ids[:50],
+                "ingest_ms": round(elapsed_ms, 1),
+            },
+            self.status_file,
+        )
+        print(f"Version {version}: {len(ids)} players changed from {source} ({elapsed_ms:.0f} ms)")
+        return version
+
+    def run(self, poll_seconds=POLL_SECONDS):
+        """Polls the directory until interrupted."""
+        print(f"Watching for DraftKings and FTN files every {poll_seconds}s (Ctrl+C to stop)...")
+        try:
+            while True:
+                self.poll()
+                time.sleep(poll_seconds)
+        except KeyboardInterrupt:
+            print("Stopped watching.")
+
 def move_ftn_to_previous(ftn_file, target_dir='data/ftn_previous/'):
     """
     Move the processed FTN file to the ftn_previous subdirectory.
@@ -64,6 +487,15 @@ def move_ftn_to_previous(ftn_file, target_dir='data/ftn_previous/'):
     shutil.move(ftn_file, os.path.join(target_dir, os.path.basename(ftn_file)))
 
 def main():
+    parser = argparse.ArgumentParser(description="Merge DraftKings salaries with FTN projections.")
+    parser.add_argument('--watch', action='store_true', help="Keep merging as new projection files arrive.")
+    parser.add_argument('--interval', type=float, default=POLL_SECONDS, help="Seconds between polls in watch mode.")
+    args = parser.parse_args()
+
+    if args.watch:
+        MergeWatcher().run(args.interval)
+        return
+
     try:
         # Dynamically locate the CSV files
         dk_file = find_csv_with_keywords('DK', 'Salaries')
@@ -73,7 +505,7 @@ def main():
         print(f"FTN Projections CSV found: {ftn_file}")
 
         # Merge the files
-        merged_df = merge_dk_ftn(dk_file, ftn_file)
+        merged_df = merge_dk_ftn(dk_file, ftn_file, MATCH_REPORT_FILE)
 
         # Print results to terminal for verification
         print("Merged Data:")
@@ -82,6 +514,11 @@ def main():
         # Save the merged file
         merged_df.to_csv('merged_projections.csv', index=False)
         print("\nMerged projections saved as 'merged_projections.csv'.")
+        print(f"Unmatched and ambiguous projection rows saved as '{MATCH_REPORT_FILE}'.")
+
+        # Save a typed copy the loaders read instead of re-parsing the CSV
+        write_columnar(merged_df, 'merged_projections.csv')
+        print("Typed projections saved as 'merged_projections.npz'.")
 
         # Move the FTN file to the ftn_previous directory
         move_ftn_to_previous(ftn_file)
@@ -94,4 +531,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
@@ -1,5 +1,8 @@
+import json
 import os
 import sys
+import time
+import numpy as np
 import streamlit as st
 import pandas as pd
 
@@ -7,7 +10,23 @@ import pandas as pd
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 # Import from optimizer module
-from optimizer.main_opto import run_optimizer_workflow
+from optimizer.cache import RESULT_CACHE, load_player_pool, result_key
+from optimizer.constants import ROSTER_REQUIREMENTS
+from optimizer.jobs import OptimizerJob
+from optimizer.late_swap import late_swap, slate_now
+from optimizer.lineups import LineupSet
+from optimizer.opto_utils import calculate_player_exposures
+from optimizer.store import ResultStore, build_key
+from app.build_overview_tab import render_build_overview_tab
+from app.lineup_details_tab import render_lineup_details_tab
+from app.performance_tab import render_performance_tab
+
+# Seconds between reruns while a background build is in progress
+JOB_POLL_SECONDS = 0.5
+
+# Status file published by `data/merge_dk_ftn.py --watch`, and how often to check it
+INGEST_STATUS_FILE = os.path.join("data", "ingest_status.json")
+INGEST_POLL_SECONDS = 5
 
 
 def main():
@@ -23,7 +42,12 @@ def main():
         "Variance Range (%)", min_value=0, max_value=50, value=10, step=1,
         help="Adjust the maximum percentage variance applied to projections (e.g., 10% = ±10%)."
     )
+    seed = st.sidebar.number_input(
+        "Seed", min_value=0, value=None, step=1, placeholder="Random",
+        help="Fix the projection draws. Every build is saved, so rerunning a seed with the same settings is instant."
+    )
     st.sidebar.write("---")
+    watch_projections()
 
     # Run Optimizer button
     if "optimize_button_clicked" not in st.session_state:
@@ -34,12 +58,15 @@ def main():
 
     # Define projections file path
     projections_path = os.path.join("data", "merged_projections.csv")
+    store = ResultStore()
 
     # Initialize session state variables
     if "all_lineups" not in st.session_state:
         st.session_state["all_lineups"] = None
     if "player_exposures" not in st.session_state:
         st.session_state["player_exposures"] = None
+    if "telemetry" not in st.session_state:
+        st.session_state["telemetry"] = None
 
     # Debug: Show session state at the start
     st.write("Debug: Initial session state")
@@ -47,43 +74,192 @@ def main():
 
     # Main Page Content
     st.title("NFL Lineup Optimizer")
+    tabs = st.tabs(["Projections", "Build Overview", "Lineup Details", "Performance"])
+    job_running = False
 
     # Load projections table
     try:
         st.write("Debug: Loading projections table")
-        player_pool = pd.read_csv(projections_path)
+        player_pool, pool_hash = load_player_pool(projections_path)
         st.write("Debug: Projections file loaded successfully")
-        st.dataframe(player_pool, use_container_width=True)
+        with tabs[0]:
+            st.dataframe(player_pool, use_container_width=True)
+
+        # Past builds of this projections file can be reloaded without solving
+        saved_builds = store.list_builds()
+        saved_builds = saved_builds[saved_builds["pool_hash"] == pool_hash]
+        if len(saved_builds):
+            st.sidebar.write("Saved Builds")
+            saved_key = st.sidebar.selectbox(
+                "Build", saved_builds["key"],
+                format_func=lambda key: _describe_build(saved_builds.set_index("key").loc[key]),
+            )
+            if st.sidebar.button("Load Build"):
+                all_lineups = store.load(saved_key, player_pool)
+                st.session_state["all_lineups"] = all_lineups
+                st.session_state["player_exposures"] = calculate_player_exposures(all_lineups)
+                st.session_state["telemetry"] = None
+                st.sidebar.success(f"Loaded {len(all_lineups)} lineups")
+
+        # Re-optimize the open slots of the current build once early games have locked
+        if isinstance(st.session_state["all_lineups"], LineupSet):
+            st.sidebar.write("Late Swap")
+            now = slate_now()
+            lock_date = st.sidebar.date_input("Lock Date", value=now.date())
+            lock_time = st.sidebar.time_input("Lock Time (ET)", value=now.time().replace(second=0, microsecond=0))
+            if st.sidebar.button("Late Swap"):
+                all_lineups = st.session_state["all_lineups"]
+
+                # Swap against the latest projections, matched to the build's players by id
+                current = player_pool.set_index("Id")["ProjPts"]
+                projections = current.reindex(all_lineups.pool.ids).fillna(0).to_numpy()
+                swapped, swap_summary = late_swap(
+                    all_lineups, pd.Timestamp.combine(lock_date, lock_time), min_salary=min_salary,
+                    max_salary=max_salary, min_uniques=min_uniques, projections=projections,
+                )
+                st.session_state["all_lineups"] = swapped
+                st.session_state["player_exposures"] = calculate_player_exposures(swapped)
+                st.success(f"Late swap changed {(swap_summary['Swapped'] > 0).sum()} of {len(swapped)} lineups.")
+                st.dataframe(swap_summary, use_container_width=True)
 
-        # Run optimizer workflow if button clicked
+        # Start a background build if button clicked
         if st.session_state["optimize_button_clicked"]:
             st.write("Debug: Optimize button clicked")
-            try:
-                all_lineups, player_exposures = run_optimizer_workflow(
-                    player_pool, num_lineups, min_salary, max_salary, min_uniques, variance_range / 100
-                )
+            st.session_state["optimize_button_clicked"] = False
+
+            # Unseeded runs get a fresh seed, so every build is reproducible from its saved settings
+            build_seed = int(seed) if seed is not None else int(np.random.SeedSequence().entropy % 2**32)
+            key = result_key(
+                pool_hash, ROSTER_REQUIREMENTS, num_lineups, min_salary, max_salary, min_uniques,
+                variance_range / 100, build_seed,
+            )
+            settings = {
+                "roster": ROSTER_REQUIREMENTS,
+                "num_lineups": num_lineups,
+                "min_salary": min_salary,
+                "max_salary": max_salary,
+                "min_uniques": min_uniques,
+                "variance_range": variance_range / 100,
+                "seed": build_seed,
+            }
+            store_key = build_key(pool_hash, settings)
+
+            # Identical settings reuse the cached result, then a saved build, before solving
+            cached = RESULT_CACHE.get(key)
+            if cached is None and store_key in store:
+                st.write("Debug: Loaded results from the build store")
+                all_lineups = store.load(store_key, player_pool)
+                cached = (all_lineups, calculate_player_exposures(all_lineups))
+                RESULT_CACHE.put(key, cached)
+            if cached is not None:
+                st.write("Debug: Loaded results from cache")
+                st.session_state["all_lineups"], st.session_state["player_exposures"] = cached
+                st.session_state["telemetry"] = None
+                st.success("Optimization completed successfully!")
+                st.dataframe(st.session_state["player_exposures"], use_container_width=True)
+            else:
+                st.session_state["job"] = OptimizerJob(
+                    player_pool, num_lineups, min_salary, max_salary, min_uniques, variance_range / 100,
+                    seed=build_seed,
+                ).start()
+                st.session_state["job_key"] = key
+                st.session_state["telemetry"] = st.session_state["job"].telemetry
+                st.session_state["job_store"] = (store_key, pool_hash, settings)
 
-                # Update session state with results
+        # Poll the running build, streaming its lineups into session state
+        job = st.session_state.get("job")
+        if job is not None and job.running:
+            st.progress(
+                job.progress,
+                text=f"{len(job.lineups)} lineups from {job.completed}/{job.total} projection sets "
+                f"({job.rate:.1f} lineups/sec)",
+            )
+            if st.button("Cancel"):
+                job.cancel()
+
+            partial_lineups = job.snapshot()
+            if partial_lineups:
+                st.session_state["all_lineups"] = partial_lineups
+                st.session_state["player_exposures"] = calculate_player_exposures(partial_lineups)
+                st.dataframe(st.session_state["player_exposures"], use_container_width=True)
+            job_running = True
+
+        elif job is not None:
+            del st.session_state["job"]
+            if job.status == "failed":
+                st.error(f"An error occurred during optimization: {job.error}")
+                st.write(f"Debug: Exception - {job.error}")
+            else:
+                all_lineups, player_exposures = job.result
                 st.session_state["all_lineups"] = all_lineups
                 st.session_state["player_exposures"] = player_exposures
 
-                st.success("Optimization completed successfully!")
+                if job.status == "cancelled":
+                    st.warning(f"Optimization cancelled after {len(all_lineups)} lineups.")
+                elif not len(all_lineups):
+                    st.warning("No feasible lineup found. Check the salary range and minimum unique players.")
+                else:
+                    RESULT_CACHE.put(st.session_state["job_key"], job.result)
+                    store_key, build_pool_hash, settings = st.session_state["job_store"]
+                    store.save(store_key, all_lineups, build_pool_hash, settings)
+                    st.success(f"Optimization completed successfully in {job.elapsed:.1f}s!")
                 st.write("Debug: Results updated in session state")
                 st.dataframe(player_exposures, use_container_width=True)
 
-                # Reset optimize button state
-                st.session_state["optimize_button_clicked"] = False
-
-            except Exception as e:
-                st.error(f"An error occurred during optimization: {e}")
-                st.write(f"Debug: Exception - {e}")
-
     except FileNotFoundError:
         st.error("Projections file not found. Please ensure the file exists in the 'data/' directory.")
     except Exception as e:
         st.error(f"An error occurred: {e}")
         st.write(f"Debug: Exception - {e}")
 
+    with tabs[1]:
+        render_build_overview_tab()
+    with tabs[2]:
+        render_lineup_details_tab()
+    with tabs[3]:
+        render_performance_tab()
+
+    # Poll the running build only once every tab has rendered its partial lineups
+    if job_running:
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+
+
+def read_ingest_status(path=INGEST_STATUS_FILE):
+    """Returns the merge watcher's latest status, or None when it isn't running."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@st.fragment(run_every=INGEST_POLL_SECONDS)
+def watch_projections():
+    """Reruns the app when the merge watcher publishes a new projections version."""
+    status = read_ingest_status()
+    if status is None:
+        return
+
+    # The projections file changed on disk; a full rerun reloads it through the pool cache
+    seen_version = st.session_state.get("projections_version")
+    st.session_state["projections_version"] = status["version"]
+    if seen_version is not None and seen_version != status["version"]:
+        st.rerun()
+
+    st.caption(
+        f"Projections v{status['version']} · updated {status['updated'][11:]} · "
+        f"{status['players_changed']} players changed"
+    )
+
+
+def _describe_build(build):
+    """Sidebar label for a saved build."""
+    return (
+        f"{build['created']:%m/%d %H:%M} · {build['lineups']} lineups · "
+        f"${build['min_salary']}-{build['max_salary']} · seed {build['seed']}"
+    )
+
 
 if __name__ == "__main__":
     main()
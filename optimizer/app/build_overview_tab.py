@@ -1,5 +1,10 @@
+import io
+
 import streamlit as st
 
+from optimizer.export import write_dk_upload
+from optimizer.lineups import LineupSet
+
 
 def render_build_overview_tab():
     """
@@ -13,3 +18,16 @@ def render_build_overview_tab():
         st.dataframe(st.session_state["player_exposures"], use_container_width=True)
     else:
         st.warning("No player exposures available. Please optimize lineups first.")
+
+    # Offer the build as a DraftKings bulk upload file
+    all_lineups = st.session_state.get("all_lineups")
+    if isinstance(all_lineups, LineupSet) and len(all_lineups):
+        upload = io.StringIO()
+        try:
+            write_dk_upload(all_lineups, upload)
+        except ValueError as e:
+            st.warning(f"Can't export this build for upload: {e}")
+        else:
+            st.download_button(
+                "Download DK Upload CSV", upload.getvalue(), file_name="dk_upload.csv", mime="text/csv"
+            )
@@ -0,0 +1,35 @@
+import streamlit as st
+
+
+def render_performance_tab():
+    """
+    Renders the Performance tab with the latest build's stage times and per-solve telemetry.
+    """
+    st.markdown("### Performance")
+
+    telemetry = st.session_state.get("telemetry")
+    if telemetry is None:
+        st.warning("No telemetry available. Run the optimizer to record a build; loaded builds aren't timed.")
+        return
+
+    # Headline numbers for the run
+    summary = telemetry.summary()
+    columns = st.columns(4)
+    columns[0].metric("Wall Time", f"{summary['wall_seconds']:.2f}s")
+    columns[1].metric("Lineups", summary["lineups"])
+    columns[2].metric("Failed Solves", summary["failed_solves"])
+    mean_solve = summary["mean_solve_seconds"]
+    columns[3].metric("Mean Solve", "-" if mean_solve is None else f"{mean_solve * 1000:.0f} ms")
+
+    # Where the time went; solve stages are summed over workers in a parallel build
+    st.markdown("#### Time by Stage")
+    st.caption(f"Backend: {summary['backend']}")
+    stages = telemetry.stages_frame()
+    st.bar_chart(stages.set_index("Stage")["Seconds"])
+    st.dataframe(stages, use_container_width=True)
+
+    st.markdown("#### Solves")
+    st.dataframe(telemetry.solves_frame(), use_container_width=True)
+    st.download_button(
+        "Download Telemetry JSON", telemetry.to_json(), file_name="build_telemetry.json", mime="application/json"
+    )
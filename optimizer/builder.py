@@ -1,5 +1,74 @@
+import numpy as np
 import pandas as pd
-from pulp import LpMaximize, LpProblem, LpVariable, lpSum
+from pulp import LpAffineExpression, LpMaximize, LpProblem, LpVariable
+
+
+def compile_player_pool(player_pool, roster_requirements):
+    """
+    Compiles the player pool into the NumPy arrays the lineup model is built from.
+
+    Args:
+        player_pool (pd.DataFrame): The player pool with projections and salary data.
+        roster_requirements (dict): Position constraints for the lineup.
+
+    Returns:
+        dict: Player index, salary and projection vectors, the position eligibility
+            matrix (one row per roster requirement) and the sense of each row.
+    """
+    positions = player_pool["Position"].astype(str)
+
+    # One eligibility row per roster requirement; FLEX and WR are minimums, the rest exact
+    eligibility = np.empty((len(roster_requirements), len(player_pool)), dtype=bool)
+    senses = []
+    for row, pos in enumerate(roster_requirements):
+        eligibility[row] = positions.str.contains(pos, regex=False).to_numpy()
+        senses.append(">=" if pos in ("FLEX", "WR") else "==")
+
+    return {
+        "index": player_pool.index,
+        "salary": player_pool["Salary"].to_numpy(dtype=float),
+        "projections": player_pool["ProjPts"].to_numpy(dtype=float),
+        "eligibility": eligibility,
+        "senses": senses,
+        "requirements": list(roster_requirements.values()),
+        "roster_size": sum(roster_requirements.values()),
+    }
+
+
+def build_lineup_model(compiled, min_salary, max_salary, name="DraftKings_NFL_Lineup_Optimization"):
+    """
+    Emits the lineup MILP from a compiled player pool, one bulk expression per row.
+
+    Args:
+        compiled (dict): Output of `compile_player_pool`.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        name (str): Name of the optimization problem.
+
+    Returns:
+        tuple: (problem, player_vars) where player_vars is a list aligned to the pool.
+    """
+    problem = LpProblem(name, LpMaximize)
+    player_vars = [LpVariable(f"player_{i}", cat="Binary") for i in compiled["index"]]
+
+    # Objective: Maximize total projected points
+    problem += LpAffineExpression(zip(player_vars, compiled["projections"].tolist()))
+
+    # Add salary constraints
+    salary_constraint = LpAffineExpression(zip(player_vars, compiled["salary"].tolist()))
+    problem += salary_constraint <= max_salary
+    problem += salary_constraint >= min_salary
+
+    # Add position constraints from the eligibility matrix
+    for eligible, sense, req in zip(compiled["eligibility"], compiled["senses"], compiled["requirements"]):
+        position_sum = LpAffineExpression((player_vars[j], 1) for j in np.flatnonzero(eligible))
+        problem += position_sum >= req if sense == ">=" else position_sum == req
+
+    # Total number of players in the lineup
+    problem += LpAffineExpression((var, 1) for var in player_vars) == compiled["roster_size"]
+
+    return problem, player_vars
+
 
 def optimize_lineup(player_pool, roster_requirements, min_salary, max_salary, num_lineups, min_uniques):
     """
@@ -20,58 +89,31 @@ def optimize_lineup(player_pool, roster_requirements, min_salary, max_salary, nu
     player_pool["IsFLEX"] = player_pool["Position"].str.contains("FLEX")
     player_pool["IsWR"] = player_pool["Position"].str.contains("WR")
 
+    # Compile the pool once; every lineup reuses the same arrays
+    compiled = compile_player_pool(player_pool, roster_requirements)
+
     # Initialize list to store generated lineups
     lineups = []
+    selections = []
 
     for lineup_num in range(num_lineups):
-        # Define the optimization problem
-        problem = LpProblem(f"DraftKings_NFL_Lineup_Optimization_{lineup_num}", LpMaximize)
-
-        # Define variables
-        player_vars = {i: LpVariable(f"player_{i}", cat="Binary") for i in player_pool.index}
-
-        # Objective: Maximize total projected points
-        problem += lpSum(player_pool.loc[i, "ProjPts"] * player_vars[i] for i in player_pool.index)
-
-        # Add salary constraints
-        salary_constraint = lpSum(player_pool.loc[i, "Salary"] * player_vars[i] for i in player_pool.index)
-        problem += salary_constraint <= max_salary
-        problem += salary_constraint >= min_salary
-
-        # Add position constraints
-        for pos, req in roster_requirements.items():
-            if pos == "FLEX":
-                problem += lpSum(
-                    player_vars[i]
-                    for i in player_pool.index
-                    if player_pool.loc[i, "IsFLEX"]
-                ) >= req
-            elif pos == "WR":
-                problem += lpSum(
-                    player_vars[i]
-                    for i in player_pool.index
-                    if player_pool.loc[i, "IsWR"]
-                ) >= req
-            else:
-                problem += lpSum(
-                    player_vars[i]
-                    for i in player_pool.index
-                    if pos in player_pool.loc[i, "Position"]
-                ) == req
-
-        # Total number of players in the lineup
-        problem += lpSum(player_vars[i] for i in player_pool.index) == sum(roster_requirements.values())
+        problem, player_vars = build_lineup_model(
+            compiled, min_salary, max_salary, name=f"DraftKings_NFL_Lineup_Optimization_{lineup_num}"
+        )
 
         # Enforce minimum unique players across lineups
-        for prev_lineup in lineups:
-            prev_player_indices = prev_lineup.index
-            problem += lpSum(player_vars[i] for i in prev_player_indices) <= (len(prev_player_indices) - min_uniques)
+        for prev_selected in selections:
+            problem += LpAffineExpression((player_vars[j], 1) for j in prev_selected) <= (
+                len(prev_selected) - min_uniques
+            )
 
         # Solve the problem
         problem.solve()
 
         # Extract the optimal lineup
-        optimal_lineup = player_pool.loc[[i for i in player_pool.index if player_vars[i].value() == 1]].copy()
+        values = np.array([var.value() or 0 for var in player_vars])
+        selected = np.flatnonzero(values > 0.5)
+        optimal_lineup = player_pool.iloc[selected].copy()
 
         # If no valid lineup is found, stop generating further lineups
         if optimal_lineup.empty:
@@ -80,5 +122,6 @@ def optimize_lineup(player_pool, roster_requirements, min_salary, max_salary, nu
 
         # Add lineup to the list
         lineups.append(optimal_lineup)
+        selections.append(selected)
 
     return lineups
@@ -1,23 +1,29 @@
 import os
-import pandas as pd
-from opto_utils import (
-    preprocess_player_pool,
-    generate_projection_sets,
-    display_player_exposures,ROSTER_REQUIREMENTS,
-)
-from builder import optimize_lineup
+import numpy as np
+from opto_utils import preprocess_player_pool
+from optimizer.cache import file_hash
+from optimizer.columnar import read_projections
+from optimizer.constants import ROSTER_REQUIREMENTS
+from optimizer.export import write_dk_upload
+from optimizer.lineups import ExposureCounter, LineupSet
+from optimizer.main_opto import iter_optimizer_workflow
+from optimizer.store import ResultStore, build_key
+from optimizer.telemetry import Telemetry
 
 
 # Set up base directory dynamically
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 MERGED_PROJECTIONS_FILE = os.path.join(DATA_DIR, "merged_projections.csv")
+LINEUPS_OUTPUT_FILE = os.path.join(DATA_DIR, "optimized_lineups.csv")
+DK_UPLOAD_FILE = os.path.join(DATA_DIR, "dk_upload.csv")
+TELEMETRY_FILE = os.path.join(DATA_DIR, "build_telemetry.json")
 
 def main():
     # Load the merged projections
     print("Loading merged projections...")
     try:
-        player_pool = pd.read_csv(MERGED_PROJECTIONS_FILE)
+        player_pool = read_projections(MERGED_PROJECTIONS_FILE)
     except FileNotFoundError:
         print(f"Error: File not found at {MERGED_PROJECTIONS_FILE}")
         return
@@ -27,36 +33,97 @@ def main():
     player_pool = preprocess_player_pool(player_pool)
 
     # Set user parameters
-    num_lineups = 10  # Number of lineups to generate
+    num_lineups = 10  # Number of lineups to generate per projection set
     num_projection_sets = 10  # Number of unique projection sets
     variance_range = 0.1  # Variance range for projections (e.g., ±10%)
     min_salary = 49500  # Minimum salary for a lineup
     max_salary = 50000  # Maximum salary for a lineup
     min_uniques = 2  # Minimum unique players between lineups
+    max_workers = 1  # Worker processes for solving projection sets (1 = sequential)
+    seed = None  # Seed for the projection draws (None = a fresh seed, printed and saved with the build)
+    backend = "cbc"  # Solver backend ("cbc", the in-process "highs", or the NumPy "bnb" engine)
+    prune = None  # Drop players that can never make an optimal lineup (None = only where it can)
 
-    # Generate projection sets with variance
-    print(f"Generating {num_projection_sets} projection sets with ±{variance_range * 100}% variance...")
-    projection_sets = generate_projection_sets(
-        player_pool, num_sets=num_projection_sets, variance_range=variance_range
+    # Unseeded runs get a fresh seed, so every saved build can be reproduced from its settings
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % 2**32)
+        print(f"Drawing projection sets with seed {seed}")
+
+    # A build that was already run is loaded from the build store instead of solved
+    store = ResultStore()
+    pool_hash = file_hash(MERGED_PROJECTIONS_FILE)
+    settings = {
+        "roster": ROSTER_REQUIREMENTS,
+        "num_lineups": num_lineups,
+        "num_projection_sets": num_projection_sets,
+        "min_salary": min_salary,
+        "max_salary": max_salary,
+        "min_uniques": min_uniques,
+        "variance_range": variance_range,
+        "max_workers": max_workers,
+        "seed": seed,
+        "backend": backend,
+        "prune": prune,
+    }
+    key = build_key(pool_hash, settings)
+    if key in store:
+        all_lineups = store.load(key, player_pool)
+        print(f"Loaded {len(all_lineups)} lineups from saved build {key}")
+        print(f"Wrote {write_dk_upload(all_lineups, DK_UPLOAD_FILE)} lineups to {DK_UPLOAD_FILE}")
+        print("\n=== Player Exposures ===")
+        print(all_lineups.exposures())
+        return
+
+    # Stream each lineup to disk and into the exposure count as soon as it is solved
+    print(f"Solving {num_projection_sets} projection sets with ±{variance_range * 100}% variance...")
+    exposure_counter = ExposureCounter()
+    telemetry = Telemetry()
+    selections = []
+    selected_projections = []
+    lineups = iter_optimizer_workflow(
+        player_pool,
+        num_projection_sets,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        min_uniques=min_uniques,
+        variance_range=variance_range,
+        max_workers=max_workers,
+        backend=backend,
+        prune=prune,
+        seed=seed,
+        lineups_per_set=num_lineups,
+        telemetry=telemetry,
     )
+    with open(LINEUPS_OUTPUT_FILE, "w", newline="") as f:
+        for lineup_num, (lineup, info) in enumerate(lineups, start=1):
+            lineup = lineup.assign(Lineup=lineup_num, Set=info["set"] + 1)
+            lineup.to_csv(f, header=lineup_num == 1, index=False)
+            exposure_counter.add(lineup)
+            selections.append(info["selected"])
+            selected_projections.append(info["projections"])
+            print(
+                f"Lineup {lineup_num} (set {info['sets_done']}/{info['num_sets']}): "
+                f"{info['points']:.2f} pts, ${info['salary']}, solved in {info['solve_seconds'] * 1000:.0f} ms"
+            )
+    print(f"Wrote {exposure_counter.num_lineups} lineups to {LINEUPS_OUTPUT_FILE}")
+    if not selections:
+        print("No feasible lineup found. Check the salary range and minimum unique players.")
+        return
 
-    # Optimize lineups for each projection set
-    all_lineups = []
-    for i, projections in enumerate(projection_sets, start=1):
-        print(f"Optimizing lineup set {i}/{num_projection_sets}...")
-        lineups = optimize_lineup(
-            projections,
-            ROSTER_REQUIREMENTS,
-            min_salary=min_salary,
-            max_salary=max_salary,
-            num_lineups=num_lineups,
-            min_uniques=min_uniques,
-        )
-        all_lineups.extend(lineups)
+    # Save the build so it can be reloaded in the app
+    all_lineups = LineupSet.from_selections(player_pool, selections, selected_projections)
+    print(f"Saved build {key} to {store.save(key, all_lineups, pool_hash, settings)}")
+    print(f"Wrote {write_dk_upload(all_lineups, DK_UPLOAD_FILE)} lineups to {DK_UPLOAD_FILE}")
 
     # Display player exposures across all lineups
-    print("\nPlayer Exposures:")
-    display_player_exposures(all_lineups)
+    print("\n=== Player Exposures ===")
+    print(exposure_counter.exposures())
+
+    # Show where the build spent its time
+    print("\n=== Performance ===")
+    print(telemetry.stages_frame().to_string(index=False))
+    telemetry.to_json(TELEMETRY_FILE)
+    print(f"Wrote solver telemetry to {TELEMETRY_FILE}")
 
 if __name__ == "__main__":
     main()
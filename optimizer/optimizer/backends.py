@@ -0,0 +1,240 @@
+import time
+
+import numpy as np
+from pulp import PULP_CBC_CMD, LpAffineExpression, LpMaximize, LpProblem, LpStatus, LpStatusOptimal, LpVariable
+
+from optimizer.branch_bound import BranchBoundBackend
+from optimizer.telemetry import solve_stats
+
+
+def build_lineup_model(compiled, min_salary, max_salary, name="DraftKings_NFL_Lineup_Optimization"):
+    """
+    Emits the lineup MILP from a compiled player pool, one bulk expression per row.
+
+    Args:
+        compiled (dict): Output of `compile_player_pool`.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        name (str): Name of the optimization problem.
+
+    Returns:
+        tuple: (problem, player_vars) where player_vars is a list aligned to the pool.
+    """
+    problem = LpProblem(name, LpMaximize)
+    player_vars = [LpVariable(f"player_{i}", cat="Binary") for i in compiled["index"]]
+
+    # Objective: Maximize total projected points
+    problem += LpAffineExpression(zip(player_vars, compiled["projections"].tolist()))
+
+    # Add salary constraints
+    salary_constraint = LpAffineExpression(zip(player_vars, compiled["salary"].tolist()))
+    problem += salary_constraint <= max_salary
+    problem += salary_constraint >= min_salary
+
+    # Add position constraints from the eligibility matrix
+    for eligible, sense, req in zip(compiled["eligibility"], compiled["senses"], compiled["requirements"]):
+        position_sum = LpAffineExpression((player_vars[j], 1) for j in np.flatnonzero(eligible))
+        problem += position_sum >= req if sense == ">=" else position_sum == req
+
+    # Total number of players in the lineup
+    problem += LpAffineExpression((var, 1) for var in player_vars) == compiled["roster_size"]
+
+    return problem, player_vars
+
+
+class CbcBackend:
+    """
+    Solves the lineup model through PuLP and the CBC command-line solver.
+
+    CBC runs as a subprocess reading a model file, so every solve pays process startup
+    and file I/O. It needs nothing beyond PuLP and is the default backend.
+    """
+
+    name = "cbc"
+
+    def __init__(self, compiled, min_salary, max_salary, solver=None):
+        """
+        Args:
+            compiled (dict): Output of `compile_player_pool`.
+            min_salary (int): Minimum salary cap.
+            max_salary (int): Maximum salary cap.
+            solver (pulp.LpSolver): Solver to use. Defaults to a quiet CBC.
+        """
+        self.solver = solver or PULP_CBC_CMD(msg=False)
+        self.problem, self.player_vars = build_lineup_model(compiled, min_salary, max_salary)
+        self.fixed = []
+        self.stats = None
+
+    def set_objective(self, projections):
+        """Replaces the objective coefficients with `projections`."""
+        self.problem.setObjective(LpAffineExpression(zip(self.player_vars, projections.tolist())))
+
+    def fix_players(self, included, excluded):
+        """Forces the `included` players into the lineup and the `excluded` ones out, replacing earlier fixes."""
+        for j in self.fixed:
+            self.player_vars[j].lowBound, self.player_vars[j].upBound = 0, 1
+        for j in included:
+            self.player_vars[j].lowBound = 1
+        for j in excluded:
+            self.player_vars[j].upBound = 0
+        self.fixed = list(included) + list(excluded)
+
+    def add_cut(self, selected, max_shared, name):
+        """Adds the row `sum(x[selected]) <= max_shared` under `name`."""
+        self.problem += LpAffineExpression((self.player_vars[j], 1) for j in selected) <= max_shared, name
+
+    def remove_cuts(self, names):
+        """Removes the cut rows with the given names."""
+        for name in names:
+            del self.problem.constraints[name]
+
+    def solve(self):
+        """
+        Returns:
+            np.ndarray: Positional indices of the selected players, or None if infeasible.
+        """
+        solve_start = time.perf_counter()
+        self.problem.solve(self.solver)
+        solve_seconds = time.perf_counter() - solve_start
+        if self.problem.status != LpStatusOptimal:
+            self.stats = solve_stats(LpStatus[self.problem.status], solve_seconds=solve_seconds)
+            return None
+
+        # CBC runs without a gap tolerance, so an optimal status is a proven optimum
+        extract_start = time.perf_counter()
+        values = np.array([var.value() or 0 for var in self.player_vars])
+        selected = np.flatnonzero(values > 0.5)
+        self.stats = solve_stats(
+            "Optimal", self.problem.objective.value(), 0.0, solve_seconds, time.perf_counter() - extract_start
+        )
+        return selected
+
+
+class HighsBackend:
+    """
+    Solves the lineup model in-process with the HiGHS MIP solver (`pip install highspy`).
+
+    The model lives in solver memory for the whole session. The objective is swapped
+    and cuts are added or deleted in place, so no files or subprocesses are involved.
+    """
+
+    name = "highs"
+
+    def __init__(self, compiled, min_salary, max_salary):
+        """
+        Args:
+            compiled (dict): Output of `compile_player_pool`.
+            min_salary (int): Minimum salary cap.
+            max_salary (int): Maximum salary cap.
+        """
+        try:
+            import highspy
+        except ImportError as e:
+            raise ImportError("The 'highs' backend requires highspy: pip install highspy") from e
+
+        self.highspy = highspy
+        self.highs = highspy.Highs()
+        self.highs.setOptionValue("output_flag", False)
+        self.highs.setOptionValue("mip_rel_gap", 0.0)
+        self.cut_rows = {}
+        self.stats = None
+
+        # Binary columns, one per player
+        num_players = len(compiled["salary"])
+        columns = np.arange(num_players, dtype=np.int32)
+        self.columns = columns
+        self.highs.addVars(num_players, np.zeros(num_players), np.ones(num_players))
+        self.highs.changeColsIntegrality(
+            num_players, columns, np.full(num_players, highspy.HighsVarType.kInteger)
+        )
+        self.highs.changeObjectiveSense(highspy.ObjSense.kMaximize)
+
+        # Salary window, position rows and roster size, emitted as one CSR block
+        inf = highspy.kHighsInf
+        eligibility = compiled["eligibility"]
+        requirements = np.asarray(compiled["requirements"], dtype=float)
+        at_least = np.array([sense == ">=" for sense in compiled["senses"]])
+        lower = np.concatenate([[min_salary], requirements, [compiled["roster_size"]]])
+        upper = np.concatenate([[max_salary], np.where(at_least, inf, requirements), [compiled["roster_size"]]])
+
+        rows = [columns] + [np.flatnonzero(eligible).astype(np.int32) for eligible in eligibility] + [columns]
+        values = [compiled["salary"]] + [np.ones(len(row)) for row in rows[1:]]
+        starts = np.cumsum([0] + [len(row) for row in rows[:-1]]).astype(np.int32)
+        self.highs.addRows(
+            len(rows), lower, upper, int(starts[-1] + len(rows[-1])), starts,
+            np.concatenate(rows), np.concatenate(values).astype(float),
+        )
+
+    def set_objective(self, projections):
+        """Replaces the objective coefficients with `projections`."""
+        self.highs.changeColsCost(len(self.columns), self.columns, np.asarray(projections, dtype=float))
+
+    def fix_players(self, included, excluded):
+        """Forces the `included` players into the lineup and the `excluded` ones out, replacing earlier fixes."""
+        lower = np.zeros(len(self.columns))
+        upper = np.ones(len(self.columns))
+        lower[np.asarray(included, dtype=np.int64)] = 1
+        upper[np.asarray(excluded, dtype=np.int64)] = 0
+        self.highs.changeColsBounds(len(self.columns), self.columns, lower, upper)
+
+    def add_cut(self, selected, max_shared, name):
+        """Adds the row `sum(x[selected]) <= max_shared` under `name`."""
+        self.cut_rows[name] = self.highs.getNumRow()
+        self.highs.addRow(
+            -self.highspy.kHighsInf, max_shared, len(selected),
+            np.asarray(selected, dtype=np.int32), np.ones(len(selected)),
+        )
+
+    def remove_cuts(self, names):
+        """Removes the cut rows with the given names."""
+        rows = sorted(self.cut_rows.pop(name) for name in names)
+        if rows:
+            self.highs.deleteRows(len(rows), np.array(rows, dtype=np.int32))
+            # Rows after a deleted row shift down
+            for name, row in self.cut_rows.items():
+                self.cut_rows[name] = row - int(np.searchsorted(rows, row))
+
+    def solve(self):
+        """
+        Returns:
+            np.ndarray: Positional indices of the selected players, or None if infeasible.
+        """
+        solve_start = time.perf_counter()
+        self.highs.run()
+        solve_seconds = time.perf_counter() - solve_start
+        model_status = self.highs.getModelStatus()
+        if model_status != self.highspy.HighsModelStatus.kOptimal:
+            self.stats = solve_stats(self.highs.modelStatusToString(model_status), solve_seconds=solve_seconds)
+            return None
+
+        extract_start = time.perf_counter()
+        values = np.asarray(self.highs.getSolution().col_value)
+        selected = np.flatnonzero(values > 0.5)
+        info = self.highs.getInfo()
+        self.stats = solve_stats(
+            "Optimal", info.objective_function_value, info.mip_gap, solve_seconds, time.perf_counter() - extract_start
+        )
+        return selected
+
+
+SOLVER_BACKENDS = {
+    CbcBackend.name: CbcBackend,
+    HighsBackend.name: HighsBackend,
+    BranchBoundBackend.name: BranchBoundBackend,
+}
+
+
+def get_backend(name):
+    """
+    Looks up a solver backend class by name.
+
+    Args:
+        name (str): One of the keys of `SOLVER_BACKENDS`.
+
+    Returns:
+        type: The backend class.
+    """
+    try:
+        return SOLVER_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown solver backend '{name}'. Choose from: {', '.join(SOLVER_BACKENDS)}.")
@@ -0,0 +1,271 @@
+import heapq
+import math
+import time
+
+import numpy as np
+
+from optimizer.model import compile_position_classes
+from optimizer.telemetry import solve_stats
+
+# Largest salary grid (max salary / common salary unit) the engine will allocate
+MAX_SALARY_STEPS = 5000
+
+
+def _class_table(weights, points, max_count, budget):
+    """
+    Knapsack DP over one position class.
+
+    Args:
+        weights (np.ndarray): Player salaries in salary units.
+        points (np.ndarray): Player projections.
+        max_count (int): Most players of this class a lineup can hold.
+        budget (int): Salary cap in salary units.
+
+    Returns:
+        tuple: (best, take) where best[n, s] is the most points from exactly n players
+            costing exactly s units, and take[k, n, s] marks states improved by player k.
+    """
+    best = np.full((max_count + 1, budget + 1), -np.inf)
+    best[0, 0] = 0.0
+    take = np.zeros((len(weights), max_count + 1, budget + 1), dtype=bool)
+
+    for k, (weight, point) in enumerate(zip(weights, points)):
+        if max_count == 0 or weight > budget:
+            continue
+        # Both sides are read before the write, so each player is used at most once
+        candidate = best[:-1, : budget + 1 - weight] + point
+        improved = candidate > best[1:, weight:]
+        best[1:, weight:] = np.where(improved, candidate, best[1:, weight:])
+        take[k, 1:, weight:] = improved
+
+    return best, take
+
+
+def _reconstruct(take, weights, count, units):
+    """Walks a class table back from (count, units) to the players chosen."""
+    chosen = []
+    for k in range(len(weights) - 1, -1, -1):
+        if count == 0:
+            break
+        if take[k, count, units]:
+            chosen.append(k)
+            count -= 1
+            units -= weights[k]
+    return chosen
+
+
+def _combine(acc, row):
+    """
+    Max-plus convolution of two salary curves.
+
+    Returns:
+        tuple: (combined, row_units) where row_units[s] is the salary given to `row` in
+            the best split of total s.
+    """
+    size = len(acc)
+    combined = np.full(size, -np.inf)
+    row_units = np.zeros(size, dtype=np.int64)
+    acc_support = np.flatnonzero(acc > -np.inf)
+    row_support = np.flatnonzero(row > -np.inf)
+
+    # Loop over whichever curve has fewer reachable salaries
+    if len(row_support) <= len(acc_support):
+        for units in row_support:
+            candidate = acc[: size - units] + row[units]
+            better = candidate > combined[units:]
+            combined[units:][better] = candidate[better]
+            row_units[units:][better] = units
+    else:
+        offsets = np.arange(size)
+        for units in acc_support:
+            candidate = row[: size - units] + acc[units]
+            better = candidate > combined[units:]
+            combined[units:][better] = candidate[better]
+            row_units[units:][better] = offsets[: size - units][better]
+
+    return combined, row_units
+
+
+class BranchBoundBackend:
+    """
+    Exact NumPy lineup engine for fixed roster structures such as the DK classic roster.
+
+    Each position class is solved as a knapsack over salary units, and the classes are
+    combined per feasible roster shape by max-plus convolution, which respects both the
+    salary floor and cap. Diversity cuts are enforced by best-first branch-and-bound on
+    the players a lineup shares with a prior lineup, using the DP optimum as the bound.
+    Salaries must share a common unit (DraftKings uses multiples of 100).
+    """
+
+    name = "bnb"
+
+    def __init__(self, compiled, min_salary, max_salary):
+        """
+        Args:
+            compiled (dict): Output of `compile_player_pool`.
+            min_salary (int): Minimum salary cap.
+            max_salary (int): Maximum salary cap.
+        """
+        salary = np.rint(compiled["salary"]).astype(np.int64)
+        unit = int(np.gcd.reduce(np.append(salary, 0))) or 1
+        self.budget = int(max_salary // unit)
+        if self.budget > MAX_SALARY_STEPS:
+            raise ValueError(
+                f"Salaries share a unit of {unit}, giving {self.budget} salary steps "
+                f"(limit {MAX_SALARY_STEPS}). Use a solver backend for this pool."
+            )
+        self.floor = int(math.ceil(min_salary / unit))
+        self.weights = salary // unit
+
+        classes = compile_position_classes(compiled)
+        self.shapes = classes["class_counts"]
+        self.max_per_class = self.shapes.max(axis=0) if len(self.shapes) else np.zeros(0, dtype=int)
+        self.members = [np.flatnonzero(classes["player_class"] == c) for c in range(len(self.max_per_class))]
+        self.player_class = classes["player_class"]
+        self.cuts = {}
+        self.fixed_in = frozenset()
+        self.fixed_out = frozenset()
+        self.projections = None
+        self.stats = None
+        self._tables = {}
+
+    def set_objective(self, projections):
+        """Replaces the objective coefficients with `projections`."""
+        self.projections = np.asarray(projections, dtype=float)
+        self._tables = {}
+
+    def fix_players(self, included, excluded):
+        """Forces the `included` players into the lineup and the `excluded` ones out, replacing earlier fixes."""
+        self.fixed_in = frozenset(int(j) for j in included)
+        self.fixed_out = frozenset(int(j) for j in excluded)
+
+    def add_cut(self, selected, max_shared, name):
+        """Forbids lineups sharing more than `max_shared` players with `selected`."""
+        self.cuts[name] = (np.asarray(selected), max_shared)
+
+    def remove_cuts(self, names):
+        """Removes the cuts with the given names."""
+        for name in names:
+            del self.cuts[name]
+
+    def _table(self, class_id, included, excluded):
+        """Returns the cached DP table for a class with some players forced in or out."""
+        key = (class_id, included, excluded)
+        if key not in self._tables:
+            members = self.members[class_id]
+            free = members[~np.isin(members, list(included | excluded))]
+            max_count = int(self.max_per_class[class_id]) - len(included)
+            best, take = _class_table(self.weights[free], self.projections[free], max(max_count, 0), self.budget)
+            self._tables[key] = (free, best, take)
+        return self._tables[key]
+
+    def _relax(self, included, excluded):
+        """
+        Solves the lineup model without diversity cuts, given forced players.
+
+        Returns:
+            tuple: (points, lineup) for the best lineup, or None if infeasible.
+        """
+        forced = np.fromiter(included, dtype=np.int64)
+        forced_units = int(self.weights[forced].sum())
+        forced_points = float(self.projections[forced].sum())
+        lowest = max(self.floor - forced_units, 0)
+        highest = self.budget - forced_units
+        if highest < lowest:
+            return None
+
+        # Split the forced players by class so each class table is cached independently
+        tables = []
+        forced_counts = np.zeros(len(self.members), dtype=np.int64)
+        for class_id, members in enumerate(self.members):
+            class_in = frozenset(j for j in included if self.player_class[j] == class_id)
+            class_out = frozenset(j for j in excluded if self.player_class[j] == class_id)
+            forced_counts[class_id] = len(class_in)
+            tables.append(self._table(class_id, class_in, class_out))
+
+        best = None
+        for shape in self.shapes:
+            remaining = shape - forced_counts
+            if (remaining < 0).any():
+                continue
+
+            # Combine the classes' salary curves for this roster shape
+            acc = tables[0][1][remaining[0]]
+            splits = []
+            for class_id in range(1, len(tables)):
+                acc, row_units = _combine(acc, tables[class_id][1][remaining[class_id]])
+                splits.append(row_units)
+
+            window = acc[lowest : highest + 1]
+            if not len(window) or window.max() == -np.inf:
+                continue
+            total = lowest + int(window.argmax())
+            points = float(acc[total]) + forced_points
+            if best is not None and points <= best[0]:
+                continue
+
+            # Walk the splits back to each class's salary, then to its players
+            class_units = [0] * len(tables)
+            for class_id in range(len(tables) - 1, 0, -1):
+                class_units[class_id] = int(splits[class_id - 1][total])
+                total -= class_units[class_id]
+            class_units[0] = total
+
+            lineup = list(forced)
+            for class_id, (free, _, take) in enumerate(tables):
+                chosen = _reconstruct(take, self.weights[free], int(remaining[class_id]), class_units[class_id])
+                lineup.extend(free[chosen])
+            best = (points, np.sort(np.array(lineup, dtype=np.int64)))
+
+        return best
+
+    def solve(self):
+        """
+        Returns:
+            np.ndarray: Positional indices of the selected players, or None if infeasible.
+        """
+        # The search is exact, so every lineup it returns is a proven optimum
+        solve_start = time.perf_counter()
+        lineup = self._search()
+        solve_seconds = time.perf_counter() - solve_start
+        if lineup is None:
+            self.stats = solve_stats("Infeasible", solve_seconds=solve_seconds)
+            return None
+        self.stats = solve_stats("Optimal", float(self.projections[lineup].sum()), 0.0, solve_seconds)
+        return lineup
+
+    def _search(self):
+        """Best-first branch-and-bound over the diversity cuts, returning the best lineup or None."""
+        root = self._relax(self.fixed_in, self.fixed_out)
+        if root is None:
+            return None
+
+        # Best-first search: the first lineup popped that satisfies every cut is optimal
+        node_id = 0
+        heap = [(-root[0], node_id, root[1], self.fixed_in, self.fixed_out)]
+        while heap:
+            _, _, lineup, included, excluded = heapq.heappop(heap)
+
+            violated = None
+            for selected, max_shared in self.cuts.values():
+                shared = np.intersect1d(lineup, selected)
+                if len(shared) > max_shared:
+                    violated = (shared, max_shared)
+                    break
+            if violated is None:
+                return lineup
+
+            # Any feasible lineup leaves out one of the first (allowed + 1) free shared
+            # players; child i keeps the first i of them and drops the next
+            shared, max_shared = violated
+            free_shared = [j for j in shared if j not in included]
+            allowed = max_shared - (len(shared) - len(free_shared))
+            for i in range(allowed + 1):
+                child_in = included | frozenset(free_shared[:i])
+                child_out = excluded | {free_shared[i]}
+                relaxed = self._relax(child_in, child_out)
+                if relaxed is not None:
+                    node_id += 1
+                    heapq.heappush(heap, (-relaxed[0], node_id, relaxed[1], child_in, child_out))
+
+        return None
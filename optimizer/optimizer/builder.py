@@ -1,84 +1,255 @@
+import time
+from contextlib import contextmanager
+
+import numpy as np
 import pandas as pd
-from pulp import LpMaximize, LpProblem, LpVariable, lpSum
 
-def optimize_lineup(player_pool, roster_requirements, min_salary, max_salary, num_lineups, min_uniques):
+from optimizer.backends import get_backend
+from optimizer.model import compile_player_pool
+from optimizer.player_pool import PlayerPool
+
+
+def add_flex_flags(player_pool):
+    """
+    Adds the FLEX and WR eligibility flags the lineup model and display rely on.
+
+    Args:
+        player_pool (pd.DataFrame): The player pool with a "Position" column.
+
+    Returns:
+        pd.DataFrame: The same player pool, with "IsFLEX" and "IsWR" set.
+    """
+    player_pool["IsFLEX"] = player_pool["Position"].str.contains("FLEX")
+    player_pool["IsWR"] = player_pool["Position"].str.contains("WR")
+    return player_pool
+
+
+def lineup_frame(player_pool, selected, projections):
+    """
+    Renders a selection of players as a lineup DataFrame.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The pool the selection indexes into.
+        selected (np.ndarray): Positional indices of the players in the lineup.
+        projections (np.ndarray): Projections aligned to the pool, reported as "ProjPts".
+
+    Returns:
+        pd.DataFrame: The lineup.
+    """
+    if isinstance(player_pool, PlayerPool):
+        return player_pool.to_frame(selected, projections=projections[selected])
+
+    # Extract the optimal lineup
+    optimal_lineup = player_pool.iloc[selected].copy()
+    optimal_lineup["ProjPts"] = projections[selected]
+    return optimal_lineup
+
+
+class SolverSession:
+    """
+    Holds a compiled roster/salary model and re-solves it for new projection vectors.
+
+    The binary variables, salary and position constraints are built once. Each solve
+    only swaps the objective coefficients, and every lineup found adds a diversity cut
+    so later solves respect `min_uniques` against all prior lineups in the session.
+
+    Time spent building or changing the model is charged to the next solve, so the
+    first solve carries the model build. `last_solve` holds the backend's stats for the
+    latest solve plus that "build_seconds".
+    """
+
+    def __init__(
+        self, player_pool, roster_requirements, min_salary, max_salary, min_uniques, backend="cbc", **backend_options
+    ):
+        """
+        Args:
+            player_pool (pd.DataFrame or PlayerPool): The player pool with projections and salary data.
+            roster_requirements (dict): Position constraints for the lineup.
+            min_salary (int): Minimum salary cap.
+            max_salary (int): Maximum salary cap.
+            min_uniques (int): Minimum number of unique players across any two lineups.
+            backend (str): Solver backend name, see `optimizer.backends.SOLVER_BACKENDS`.
+            **backend_options: Extra options for the backend (e.g. `solver` for "cbc").
+        """
+        self.build_seconds = 0.0
+        self.last_solve = None
+        with self._building():
+            # Add FLEX eligibility flags; a PlayerPool already carries them as bitmasks
+            if not isinstance(player_pool, PlayerPool):
+                player_pool = add_flex_flags(player_pool)
+            self.player_pool = player_pool
+            self.min_uniques = min_uniques
+            self.compiled = compile_player_pool(player_pool, roster_requirements)
+            self.backend = get_backend(backend)(self.compiled, min_salary, max_salary, **backend_options)
+            self.selections = []
+        self.set_projections(self.compiled["projections"])
+
+    @contextmanager
+    def _building(self):
+        """Times the enclosed model change, charging it to the next solve."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.build_seconds += time.perf_counter() - start
+
+    def set_projections(self, projections):
+        """
+        Replaces the objective with a new projection vector aligned to the player pool.
+
+        Args:
+            projections (array-like): Projected points, one per player in pool order.
+        """
+        with self._building():
+            projections = np.asarray(projections, dtype=float)
+            self.backend.set_objective(projections)
+            self.projections = projections
+
+    def add_lineup_cut(self, selected):
+        """
+        Forbids any future lineup from sharing more than `roster - min_uniques` players with `selected`.
+
+        Args:
+            selected (np.ndarray): Positional indices of the players in a prior lineup.
+        """
+        with self._building():
+            self.backend.add_cut(selected, len(selected) - self.min_uniques, f"lineup_cut_{len(self.selections)}")
+            self.selections.append(selected)
+
+    def fix_players(self, included=(), excluded=()):
+        """
+        Forces players into or out of every following lineup, replacing earlier fixes.
+
+        Args:
+            included (array-like): Positional indices of players every lineup must hold.
+            excluded (array-like): Positional indices of players no lineup may hold.
+        """
+        with self._building():
+            self.backend.fix_players(
+                np.asarray(included, dtype=np.int64).tolist(), np.asarray(excluded, dtype=np.int64).tolist()
+            )
+
+    def reset_cuts(self, keep=0):
+        """
+        Removes diversity cuts so the next solve is independent of prior lineups.
+
+        Args:
+            keep (int): Number of the oldest cuts to leave in place.
+        """
+        with self._building():
+            self.backend.remove_cuts([f"lineup_cut_{cut_num}" for cut_num in range(keep, len(self.selections))])
+            self.selections = self.selections[:keep]
+
+    def iter_selections(self, projections=None, num_lineups=1):
+        """
+        Solves one or more lineups, yielding each as player indices as soon as it is found.
+
+        Args:
+            projections (array-like): Projected points in pool order. Defaults to the
+                most recently set projections (initially the pool's "ProjPts").
+            num_lineups (int): Number of lineups to generate.
+
+        Yields:
+            np.ndarray: Positional indices of the players in each lineup found.
+        """
+        if projections is not None:
+            self.set_projections(projections)
+
+        for _ in range(num_lineups):
+            selected = self.backend.solve()
+            self.last_solve = {**self.backend.stats, "build_seconds": self.build_seconds}
+            self.build_seconds = 0.0
+
+            # If no valid lineup is found, stop generating further lineups
+            if selected is None:
+                print(f"Unable to generate lineup {len(self.selections) + 1}. No feasible solution found.")
+                return
+
+            self.add_lineup_cut(selected)
+            yield selected
+
+    def solve_selections(self, projections=None, num_lineups=1):
+        """
+        Solves one or more lineups and returns them as player indices.
+
+        Args:
+            projections (array-like): Projected points in pool order. Defaults to the
+                most recently set projections (initially the pool's "ProjPts").
+            num_lineups (int): Number of lineups to generate.
+
+        Returns:
+            list of np.ndarray: Positional indices of the players in each lineup found.
+        """
+        return list(self.iter_selections(projections, num_lineups=num_lineups))
+
+    def solve(self, projections=None, num_lineups=1):
+        """
+        Solves one or more lineups against the given projections.
+
+        Args:
+            projections (array-like): Projected points in pool order. Defaults to the
+                most recently set projections (initially the pool's "ProjPts").
+            num_lineups (int): Number of lineups to generate.
+
+        Returns:
+            list of pd.DataFrame: List of optimized lineups, with "ProjPts" set to the
+                projections they were solved against.
+        """
+        selections = self.solve_selections(projections, num_lineups=num_lineups)
+        return [lineup_frame(self.player_pool, selected, self.projections) for selected in selections]
+
+
+def iter_optimize_lineup(
+    player_pool, roster_requirements, min_salary, max_salary, num_lineups, min_uniques, backend="cbc"
+):
+    """
+    Optimizes lineups like `optimize_lineup`, yielding each one as soon as it is solved.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections and salary data.
+        roster_requirements (dict): Position constraints for the lineup.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        num_lineups (int): Number of lineups to generate.
+        min_uniques (int): Minimum number of unique players across any two lineups.
+        backend (str): Solver backend name, see `optimizer.backends.SOLVER_BACKENDS`.
+
+    Yields:
+        tuple: (lineup, info) where lineup is a DataFrame and info is a dict with "lineup"
+            (1-based number), "selected", "points", "salary" and "solve_seconds".
+    """
+    session = SolverSession(player_pool, roster_requirements, min_salary, max_salary, min_uniques, backend=backend)
+    solve_start = time.perf_counter()
+    for selected in session.iter_selections(num_lineups=num_lineups):
+        solve_seconds = time.perf_counter() - solve_start
+        lineup = lineup_frame(session.player_pool, selected, session.projections)
+        yield lineup, {
+            "lineup": len(session.selections),
+            "selected": selected,
+            "points": float(session.projections[selected].sum()),
+            "salary": int(lineup["Salary"].sum()),
+            "solve_seconds": solve_seconds,
+        }
+        solve_start = time.perf_counter()
+
+
+def optimize_lineup(
+    player_pool, roster_requirements, min_salary, max_salary, num_lineups, min_uniques, backend="cbc"
+):
     """
     Optimizes multiple lineups for DraftKings NFL contests with diversity constraints.
 
     Args:
-        player_pool (pd.DataFrame): The player pool with projections and salary data.
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections and salary data.
         roster_requirements (dict): Position constraints for the lineup.
         min_salary (int): Minimum salary cap.
         max_salary (int): Maximum salary cap.
         num_lineups (int): Number of lineups to generate.
         min_unique_players (int): Minimum number of unique players across any two lineups.
+        backend (str): Solver backend name, see `optimizer.backends.SOLVER_BACKENDS`.
 
     Returns:
         list of pd.DataFrame: List of optimized lineups.
     """
-    # Add FLEX eligibility flags
-    player_pool["IsFLEX"] = player_pool["Position"].str.contains("FLEX")
-    player_pool["IsWR"] = player_pool["Position"].str.contains("WR")
-
-    # Initialize list to store generated lineups
-    lineups = []
-
-    for lineup_num in range(num_lineups):
-        # Define the optimization problem
-        problem = LpProblem(f"DraftKings_NFL_Lineup_Optimization_{lineup_num}", LpMaximize)
-
-        # Define variables
-        player_vars = {i: LpVariable(f"player_{i}", cat="Binary") for i in player_pool.index}
-
-        # Objective: Maximize total projected points
-        problem += lpSum(player_pool.loc[i, "ProjPts"] * player_vars[i] for i in player_pool.index)
-
-        # Add salary constraints
-        salary_constraint = lpSum(player_pool.loc[i, "Salary"] * player_vars[i] for i in player_pool.index)
-        problem += salary_constraint <= max_salary
-        problem += salary_constraint >= min_salary
-
-        # Add position constraints
-        for pos, req in roster_requirements.items():
-            if pos == "FLEX":
-                problem += lpSum(
-                    player_vars[i]
-                    for i in player_pool.index
-                    if player_pool.loc[i, "IsFLEX"]
-                ) >= req
-            elif pos == "WR":
-                problem += lpSum(
-                    player_vars[i]
-                    for i in player_pool.index
-                    if player_pool.loc[i, "IsWR"]
-                ) >= req
-            else:
-                problem += lpSum(
-                    player_vars[i]
-                    for i in player_pool.index
-                    if pos in player_pool.loc[i, "Position"]
-                ) == req
-
-        # Total number of players in the lineup
-        problem += lpSum(player_vars[i] for i in player_pool.index) == sum(roster_requirements.values())
-
-        # Enforce minimum unique players across lineups
-        for prev_lineup in lineups:
-            prev_player_indices = prev_lineup.index
-            problem += lpSum(player_vars[i] for i in prev_player_indices) <= (len(prev_player_indices) - min_uniques)
-
-        # Solve the problem
-        problem.solve()
-
-        # Extract the optimal lineup
-        optimal_lineup = player_pool.loc[[i for i in player_pool.index if player_vars[i].value() == 1]].copy()
-
-        # If no valid lineup is found, stop generating further lineups
-        if optimal_lineup.empty:
-            print(f"Unable to generate lineup {lineup_num + 1}. No feasible solution found.")
-            break
-
-        # Add lineup to the list
-        lineups.append(optimal_lineup)
-
-    return lineups
\ No newline at end of file
+    session = SolverSession(player_pool, roster_requirements, min_salary, max_salary, min_uniques, backend=backend)
+    return session.solve(num_lineups=num_lineups)
@@ -0,0 +1,182 @@
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+
+import pandas as pd
+
+from optimizer.columnar import read_projections
+
+# Bytes read at a time when hashing a projections file
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def estimate_size(value):
+    """
+    Approximates the memory held by a cached value, in bytes.
+
+    Args:
+        value: A DataFrame, an object exposing `nbytes` (arrays, PlayerPool, LineupSet),
+            or a tuple/list of those.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_size(item) for item in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    A least-recently-used cache bounded by entry count and estimated size.
+
+    Entries live for the whole process, so in Streamlit they survive reruns and are
+    shared by every session of the app.
+    """
+
+    def __init__(self, max_entries=8, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            max_entries (int): Most entries kept.
+            max_bytes (int): Most total estimated bytes kept. A single larger value is
+                still cached until the next insert.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    @property
+    def total_bytes(self):
+        return sum(self.sizes.values())
+
+    def get(self, key, default=None):
+        """Returns the cached value for `key` and marks it most recently used."""
+        if key not in self.entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value):
+        """Caches `value` under `key`, evicting least recently used entries over the limits."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.sizes[key] = estimate_size(value)
+
+        while len(self.entries) > 1 and (
+            len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            evicted, _ = self.entries.popitem(last=False)
+            del self.sizes[evicted]
+
+    def clear(self):
+        """Drops every entry."""
+        self.entries.clear()
+        self.sizes.clear()
+
+
+# Process-wide caches for loaded player pools and finished builds
+POOL_CACHE = LRUCache(max_entries=4)
+RESULT_CACHE = LRUCache(max_entries=32)
+
+# (path, mtime, size) -> content hash, so unchanged files are not re-read every rerun
+_file_hashes = {}
+
+
+def file_hash(path):
+    """
+    Returns the SHA-256 of a file's content.
+
+    The digest is memoized on the file's modification time and size, so repeated calls
+    for an unchanged file only cost a `stat`.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    stat = os.stat(path)
+    stamp = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if stamp not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        _file_hashes[stamp] = digest.hexdigest()
+    return _file_hashes[stamp]
+
+
+def load_player_pool(path, preprocess=None):
+    """
+    Loads a projections CSV, reusing the parsed pool while the file content is unchanged.
+
+    The typed `.npz` bundle next to the CSV is read instead when it is fresh, see
+    `optimizer.columnar.read_projections`.
+
+    Args:
+        path (str): Path to the projections CSV.
+        preprocess (callable): Optional function applied to the DataFrame after loading.
+            Its result is cached along with the parsed file, keyed on the function's module
+            and qualified name so same-named preprocessors don't share entries.
+
+    Returns:
+        tuple: (player pool DataFrame, content hash of the file). The DataFrame is a copy,
+            so callers may add columns without touching the cache.
+    """
+    pool_hash = file_hash(path)
+    key = (pool_hash, getattr(preprocess, "__module__", None), getattr(preprocess, "__qualname__", None))
+    player_pool = POOL_CACHE.get(key)
+    if player_pool is None:
+        player_pool = read_projections(path)
+        if preprocess is not None:
+            player_pool = preprocess(player_pool)
+        POOL_CACHE.put(key, player_pool)
+    return player_pool.copy(), pool_hash
+
+
+def result_key(pool_hash, roster_requirements, num_lineups, min_salary, max_salary, min_uniques, variance_range,
+               seed, **options):
+    """
+    Builds the result cache key for one optimizer run.
+
+    Args:
+        pool_hash (str): Content hash of the player pool file.
+        roster_requirements (dict): Position constraints for the lineup.
+        num_lineups (int): Number of lineups requested.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        min_uniques (int): Minimum unique players across lineups.
+        variance_range (float): Maximum percentage variance applied to projections.
+        seed (int): Seed for the projection draws.
+        **options: Any other settings that change the build (e.g. backend).
+
+    Returns:
+        tuple: A hashable key.
+    """
+    return (
+        pool_hash,
+        tuple(roster_requirements.items()),
+        num_lineups,
+        min_salary,
+        max_salary,
+        min_uniques,
+        round(float(variance_range), 6),
+        seed,
+        tuple(sorted(options.items())),
+    )
@@ -0,0 +1,211 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from optimizer.preprocess import parse_game_times
+
+# Columns loaded as categoricals; other string columns are stored the same way but loaded as strings
+CATEGORICAL_COLUMNS = {"Position", "Position_x", "Position_y", "TeamAbbrev", "Team", "Game Info", "merge_time"}
+
+# Layout of the bundle's arrays; bundles of any other version are treated as stale
+BUNDLE_VERSION = 2
+
+def columnar_path(csv_path):
+    """Path of the typed bundle written next to a merged projections CSV."""
+    return os.path.splitext(csv_path)[0] + ".npz"
+
+
+def _source_stamp(csv_path):
+    """(mtime_ns, size) of the CSV a bundle was written from."""
+    stat = os.stat(csv_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _encode_column(name, column):
+    """
+    Encodes one column for a bundle.
+
+    Args:
+        name (str): Column name.
+        column (pd.Series): Column values.
+
+    Returns:
+        tuple: (arrays, kind) where arrays maps key suffixes ("" for the values) to arrays.
+    """
+    # Match the types `pd.read_csv` would infer for the same column
+    if not pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        numeric = pd.to_numeric(column, errors="coerce")
+        if column.notna().sum() and numeric.notna().sum() == column.notna().sum():
+            column = numeric
+
+    if pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column):
+        return {"": column.to_numpy()}, "numeric"
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return {"": column.to_numpy(dtype="datetime64[us]")}, "datetime"
+    codes, uniques = pd.factorize(column)
+    if name in CATEGORICAL_COLUMNS:
+        return {"": codes.astype(np.int32), "_categories": np.asarray(uniques, dtype=str)}, "categorical"
+
+    # Other strings keep their dtype but are stored once per distinct value, as one UTF-8
+    # blob cut at character offsets, instead of as a fixed-width array padded to the longest
+    uniques = [str(value) for value in uniques]
+    offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in uniques], out=offsets[1:])
+    text = np.frombuffer("".join(uniques).encode("utf-8"), dtype=np.uint8)
+    return {"": codes.astype(np.int32), "_text": text, "_offsets": offsets}, "string"
+
+
+def _save_bundle(path, metadata, arrays):
+    """Writes a bundle under a temporary name, then renames it, so readers never see a partial file."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(f, metadata=np.array(json.dumps(metadata)), **arrays)
+    os.replace(temp_path, path)
+
+
+def write_columnar(player_pool, csv_path):
+    """
+    Writes a typed `.npz` bundle next to a merged projections CSV that was just saved.
+
+    Strings with few distinct values (positions, teams, games) are stored as integer
+    codes plus categories and load as categoricals. Other strings are stored the same way,
+    with their distinct values packed into one UTF-8 blob, and load as strings.
+    Numeric-looking columns are stored as numbers, and "Game Info" is parsed
+    into a "GameTime" column once here instead of in every loader. The bundle records
+    the CSV's modification time and size, so loaders can tell when it's stale.
+
+    Args:
+        player_pool (pd.DataFrame): The merged projections, as written to `csv_path`.
+        csv_path (str): Path of the saved CSV.
+
+    Returns:
+        str: Path of the bundle.
+    """
+    stamp = _source_stamp(csv_path)
+    arrays = {}
+    kinds = []
+    for i, name in enumerate(player_pool.columns):
+        encoded, kind = _encode_column(name, player_pool[name])
+        arrays.update({f"c{i}{suffix}": values for suffix, values in encoded.items()})
+        kinds.append(kind)
+
+    columns = list(player_pool.columns)
+    if "Game Info" in player_pool.columns and "GameTime" not in player_pool.columns:
+        arrays[f"c{len(columns)}"] = parse_game_times(player_pool["Game Info"]).to_numpy()
+        columns.append("GameTime")
+        kinds.append("datetime")
+
+    metadata = {"version": BUNDLE_VERSION, "columns": columns, "kinds": kinds, "source_stamp": stamp}
+    path = columnar_path(csv_path)
+    _save_bundle(path, metadata, arrays)
+    return path
+
+
+def update_columnar(player_pool, csv_path, changed_columns):
+    """
+    Refreshes the bundle next to a CSV that was just rewritten, re-encoding only some columns.
+
+    The other columns' arrays are copied over from the current bundle as they are. Falls
+    back to `write_columnar` when there is no readable bundle or its columns don't match.
+
+    Args:
+        player_pool (pd.DataFrame): The merged projections, as written to `csv_path`.
+        csv_path (str): Path of the saved CSV.
+        changed_columns (list): Columns whose values changed since the bundle was written.
+
+    Returns:
+        str: Path of the bundle.
+    """
+    path = columnar_path(csv_path)
+    try:
+        with np.load(path) as bundle:
+            metadata = json.loads(str(bundle["metadata"]))
+            arrays = {key: bundle[key] for key in bundle.files if key != "metadata"}
+    except (OSError, ValueError, KeyError):
+        return write_columnar(player_pool, csv_path)
+
+    columns = metadata["columns"]
+    derived = columns[len(player_pool.columns):]
+    if (
+        metadata.get("version") != BUNDLE_VERSION
+        or columns[: len(player_pool.columns)] != list(player_pool.columns)
+        or derived not in ([], ["GameTime"])
+    ):
+        return write_columnar(player_pool, csv_path)
+
+    for name in changed_columns:
+        i = columns.index(name)
+        for key in [key for key in arrays if key == f"c{i}" or key.startswith(f"c{i}_")]:
+            del arrays[key]
+        encoded, metadata["kinds"][i] = _encode_column(name, player_pool[name])
+        arrays.update({f"c{i}{suffix}": values for suffix, values in encoded.items()})
+    if derived and "Game Info" in changed_columns:
+        arrays[f"c{len(player_pool.columns)}"] = parse_game_times(player_pool["Game Info"]).to_numpy()
+
+    metadata["source_stamp"] = _source_stamp(csv_path)
+    _save_bundle(path, metadata, arrays)
+    return path
+
+
+def read_columnar(path):
+    """
+    Loads a bundle written by `write_columnar`.
+
+    Args:
+        path (str): Path to the `.npz` bundle.
+
+    Returns:
+        pd.DataFrame: The merged projections, with categorical positions and teams,
+            integer salaries and a parsed "GameTime" column.
+    """
+    with np.load(path) as bundle:
+        metadata = json.loads(str(bundle["metadata"]))
+        data = {}
+        for i, (name, kind) in enumerate(zip(metadata["columns"], metadata["kinds"])):
+            values = bundle[f"c{i}"]
+            if kind == "categorical":
+                categories = pd.Index(bundle[f"c{i}_categories"], dtype=str)
+                data[name] = pd.Categorical.from_codes(values, categories=categories)
+            elif kind == "string":
+                # Distinct values plus a trailing None, so the missing values' code -1 picks it
+                text = bundle[f"c{i}_text"].tobytes().decode("utf-8")
+                offsets = bundle[f"c{i}_offsets"].tolist()
+                uniques = np.empty(len(offsets), dtype=object)
+                uniques[:-1] = [text[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+                data[name] = pd.array(uniques[values], dtype=str)
+            else:
+                data[name] = values
+    return pd.DataFrame(data)
+
+
+def is_fresh(csv_path):
+    """True when the bundle next to `csv_path` was written, in the current layout, from the CSV as it is now."""
+    path = columnar_path(csv_path)
+    if not os.path.exists(path):
+        return False
+    try:
+        with np.load(path) as bundle:
+            metadata = json.loads(str(bundle["metadata"]))
+        return metadata.get("version") == BUNDLE_VERSION and metadata["source_stamp"] == _source_stamp(csv_path)
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def read_projections(csv_path):
+    """
+    Loads merged projections, preferring the typed bundle when it is fresh.
+
+    Only the writers of the CSV write the bundle (see `write_columnar`), so loaders
+    never race the merge watcher for it; a missing or stale bundle means reading the CSV.
+
+    Args:
+        csv_path (str): Path to the merged projections CSV.
+
+    Returns:
+        pd.DataFrame: The merged projections.
+    """
+    if is_fresh(csv_path):
+        return read_columnar(columnar_path(csv_path))
+    return pd.read_csv(csv_path)
@@ -8,3 +8,80 @@ ROSTER_REQUIREMENTS = {
     "FLEX": 1,   # 1 Flex (RB/WR/TE)
     "DST": 1,    # 1 Defense/Special Teams
 }
+
+# Players in a lineup
+ROSTER_SIZE = sum(ROSTER_REQUIREMENTS.values())
+
+# Bit assigned to each position token in a PlayerPool position bitmask
+POSITION_BITS = {
+    "QB": 1,
+    "RB": 2,
+    "WR": 4,
+    "TE": 8,
+    "FLEX": 16,
+    "DST": 32,
+}
+
+# Eligibility flag columns added by preprocess_player_pool and the "Position" pattern each matches
+POSITION_FLAGS = {
+    "IsFLEX": "RB|WR|TE",
+    "IsWR": "WR",
+    "IsRB": "RB",
+    "IsTE": "TE",
+    "IsQB": "QB",
+    "IsDST": "DST",
+}
+
+# NFL teams by DraftKings abbreviation: (city, nickname)
+NFL_TEAMS = {
+    "ARI": ("Arizona", "Cardinals"),
+    "ATL": ("Atlanta", "Falcons"),
+    "BAL": ("Baltimore", "Ravens"),
+    "BUF": ("Buffalo", "Bills"),
+    "CAR": ("Carolina", "Panthers"),
+    "CHI": ("Chicago", "Bears"),
+    "CIN": ("Cincinnati", "Bengals"),
+    "CLE": ("Cleveland", "Browns"),
+    "DAL": ("Dallas", "Cowboys"),
+    "DEN": ("Denver", "Broncos"),
+    "DET": ("Detroit", "Lions"),
+    "GB": ("Green Bay", "Packers"),
+    "HOU": ("Houston", "Texans"),
+    "IND": ("Indianapolis", "Colts"),
+    "JAX": ("Jacksonville", "Jaguars"),
+    "KC": ("Kansas City", "Chiefs"),
+    "LAC": ("Los Angeles", "Chargers"),
+    "LAR": ("Los Angeles", "Rams"),
+    "LV": ("Las Vegas", "Raiders"),
+    "MIA": ("Miami", "Dolphins"),
+    "MIN": ("Minnesota", "Vikings"),
+    "NE": ("New England", "Patriots"),
+    "NO": ("New Orleans", "Saints"),
+    "NYG": ("New York", "Giants"),
+    "NYJ": ("New York", "Jets"),
+    "PHI": ("Philadelphia", "Eagles"),
+    "PIT": ("Pittsburgh", "Steelers"),
+    "SEA": ("Seattle", "Seahawks"),
+    "SF": ("San Francisco", "49ers"),
+    "TB": ("Tampa Bay", "Buccaneers"),
+    "TEN": ("Tennessee", "Titans"),
+    "WAS": ("Washington", "Commanders"),
+}
+
+# Abbreviations other projection sources use, mapped to the DraftKings ones
+TEAM_ALIASES = {
+    "ARZ": "ARI",
+    "GBP": "GB",
+    "JAC": "JAX",
+    "KCC": "KC",
+    "LA": "LAR",
+    "LVR": "LV",
+    "NEP": "NE",
+    "NOR": "NO",
+    "OAK": "LV",
+    "SD": "LAC",
+    "SFO": "SF",
+    "STL": "LAR",
+    "TBB": "TB",
+    "WSH": "WAS",
+}
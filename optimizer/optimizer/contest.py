@@ -0,0 +1,280 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from optimizer.constants import ROSTER_REQUIREMENTS
+from optimizer.export import upload_slots
+from optimizer.lineups import LineupSet
+from optimizer.player_pool import PlayerPool
+from optimizer.scoring import iter_simulation_chunks, lineup_incidence, score_chunk
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SAMPLE_PAYOUTS_FILE = os.path.join(BASE_DIR, "data", "sample_payouts.csv")
+
+# Simulations ranked per chunk, and opponent lineups scored at once within a chunk
+CONTEST_CHUNK_SIZE = 500
+FIELD_CHUNK_SIZE = 10000
+
+# Simulated points are rounded to multiples of 1 / SCORE_GRID, so lineup scores sum exactly
+# in float32 whatever the summation order and identical lineups always tie
+SCORE_GRID = 1024
+
+# Share of all entries a lineup must finish in to count as a top finish
+TOP_PERCENT = 0.01
+
+# Field lineups are drawn in rounds of at most FIELD_MAX_CANDIDATES candidates, dropping
+# the ones that break the salary rules
+FIELD_MAX_ROUNDS = 100
+FIELD_MAX_CANDIDATES = 1000000
+
+# Ownership floor, so players projected at 0% can still appear in the field
+FIELD_MIN_OWNERSHIP = 0.1
+
+
+def load_payouts(path=SAMPLE_PAYOUTS_FILE):
+    """
+    Reads a contest payout table.
+
+    Args:
+        path (str): CSV with "MinRank", "MaxRank" and "Payout" columns, one row per band
+            of finishing positions paying the same amount.
+
+    Returns:
+        np.ndarray: Payout of every paid finishing position, index 0 being first place.
+
+    Raises:
+        ValueError: If columns are missing or bands overlap.
+    """
+    table = pd.read_csv(path)
+    missing = {"MinRank", "MaxRank", "Payout"} - set(table.columns)
+    if missing:
+        raise ValueError(f"Payout table {path} is missing columns: {', '.join(sorted(missing))}")
+
+    payouts = np.zeros(int(table["MaxRank"].max()))
+    paid = np.zeros(len(payouts), dtype=bool)
+    for min_rank, max_rank, payout in table[["MinRank", "MaxRank", "Payout"]].itertuples(index=False):
+        band = slice(int(min_rank) - 1, int(max_rank))
+        if paid[band].any():
+            raise ValueError(f"Payout table {path} pays ranks {min_rank}-{max_rank} more than once")
+        paid[band] = True
+        payouts[band] = payout
+    return payouts
+
+
+def generate_field(
+    player_pool,
+    field_size,
+    seed=None,
+    roster_requirements=ROSTER_REQUIREMENTS,
+    min_salary=0,
+    max_salary=50000,
+):
+    """
+    Draws an opponent field, picking each roster slot by projected ownership.
+
+    Every slot draws among the players eligible for it with probability proportional to
+    ownership. Lineups that roster a player twice or break the salary rules are dropped,
+    and each round draws enough candidates to fill the rest at the acceptance rate seen so far.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The slate.
+        field_size (int): Number of opponent lineups.
+        seed (int): Seed for the draws. None draws fresh entropy.
+        roster_requirements (dict): Position constraints for the lineup.
+        min_salary (int): Minimum total salary of a field lineup.
+        max_salary (int): Maximum total salary of a field lineup.
+
+    Returns:
+        LineupSet: The field.
+
+    Raises:
+        ValueError: If the field can't be filled within `FIELD_MAX_ROUNDS` rounds.
+    """
+    pool = player_pool if isinstance(player_pool, PlayerPool) else PlayerPool.from_dataframe(player_pool)
+    rng = np.random.default_rng(seed)
+    slots = upload_slots(roster_requirements)
+    weights = np.maximum(pool.ownership.astype(np.float64), FIELD_MIN_OWNERSHIP)
+
+    # Cumulative ownership over each slot's eligible players, sampled by inverse CDF
+    candidates = []
+    for slot in slots:
+        eligible = np.flatnonzero(pool.eligible(slot))
+        candidates.append((eligible, np.cumsum(weights[eligible])))
+
+    # Draw candidates in rounds sized by the acceptance seen so far, keeping the legal ones
+    matrix = np.empty((field_size, len(slots)), dtype=np.int32)
+    filled = 0
+    acceptance = 1.0
+    for _ in range(FIELD_MAX_ROUNDS):
+        if filled == field_size:
+            return LineupSet(player_pool, matrix)
+        num_candidates = min(int(np.ceil((field_size - filled) / acceptance)), FIELD_MAX_CANDIDATES)
+        candidates_matrix = np.empty((num_candidates, len(slots)), dtype=np.int32)
+        for column, (eligible, cumulative) in enumerate(candidates):
+            draws = rng.random(num_candidates) * cumulative[-1]
+            candidates_matrix[:, column] = eligible[np.searchsorted(cumulative, draws, side="right")]
+
+        # Distinct players and a legal salary
+        rows = np.sort(candidates_matrix, axis=1)
+        salaries = pool.salary[rows].sum(axis=1)
+        valid = (rows[:, 1:] != rows[:, :-1]).all(axis=1) & (salaries >= min_salary) & (salaries <= max_salary)
+        acceptance = max(valid.mean(), 1 / FIELD_MAX_CANDIDATES)
+
+        kept = candidates_matrix[valid][: field_size - filled]
+        matrix[filled:filled + len(kept)] = kept
+        filled += len(kept)
+
+    if filled < field_size:
+        raise ValueError(
+            f"Could only draw {filled} of {field_size} field lineups "
+            f"between {min_salary} and {max_salary} salary."
+        )
+    return LineupSet(player_pool, matrix)
+
+
+def _rank_counts(ours, others):
+    """
+    Counts, for each of our scores, how many of `others` in the same sim beat it and how
+    many tie it.
+
+    The other scores are sorted along each sim in one call, and each sim's row is then
+    searched for all of our scores at once.
+
+    Args:
+        ours (np.ndarray): `(num_sims, num_ours)` scores.
+        others (np.ndarray): `(num_sims, num_others)` scores to rank against.
+
+    Returns:
+        tuple: (above, ties), `(num_sims, num_ours)` counts.
+    """
+    others = np.sort(others, axis=1)
+    above = np.empty(ours.shape, dtype=np.int64)
+    ties = np.empty(ours.shape, dtype=np.int64)
+    for sim, (row, scores) in enumerate(zip(others, ours)):
+        left = np.searchsorted(row, scores, side="left")
+        right = np.searchsorted(row, scores, side="right")
+        above[sim] = len(row) - right
+        ties[sim] = right - left
+    return above, ties
+
+
+def simulate_contest(
+    lineups,
+    field,
+    simulations,
+    payouts,
+    entry_fee,
+    top_percent=TOP_PERCENT,
+    chunk_size=CONTEST_CHUNK_SIZE,
+    field_chunk_size=FIELD_CHUNK_SIZE,
+):
+    """
+    Plays a build against an opponent field in every simulation.
+
+    Every sim scores all entries, ranks our lineups among the field and each other with
+    `searchsorted`, and pays them by the payout table, splitting tied places evenly.
+    Points are rounded to a `1 / SCORE_GRID` grid first, so duplicated lineups tie exactly.
+    Sims are processed in chunks and the field in slices, so memory doesn't grow with
+    the number of sims and only one field slice of scores is held at a time.
+
+    Args:
+        lineups (LineupSet): Our entries.
+        field (LineupSet): Opponent entries, on the same player pool.
+        simulations (np.ndarray or iterable): `(num_sims, num_players)` simulated points in
+            pool order, or batches of them such as `SlateSimulator.iter_batches`.
+        payouts (np.ndarray): Payout by finishing position, from `load_payouts`.
+        entry_fee (float): Cost of one entry.
+        top_percent (float): Share of all entries counted as a top finish.
+        chunk_size (int): Simulations ranked per chunk.
+        field_chunk_size (int): Opponent lineups scored at once.
+
+    Returns:
+        tuple: (results, portfolio) where results is a DataFrame with each lineup's
+            "Mean Payout", "ROI", "Cash Rate", "Top <x>% Rate" and "Win Rate", and portfolio
+            is a dict with the build's "entries", "field_size", "sims", "mean_payout",
+            "roi", "cash_rate" (any lineup cashing), "top_rate" (any lineup in the top),
+            "win_rate" and "profit_rate" (winning more than the fees).
+
+    Raises:
+        ValueError: If there are no lineups or no simulations.
+    """
+    num_lineups = len(lineups)
+    if num_lineups == 0:
+        raise ValueError("No lineups to enter.")
+    num_entries = num_lineups + len(field)
+    top_rank = max(1, int(np.ceil(num_entries * top_percent)))
+
+    # Prize money won by finishing positions 1..k, for splitting tied places
+    paid = np.zeros(num_entries)
+    paid[: min(len(payouts), num_entries)] = payouts[:num_entries]
+    cumulative = np.concatenate([[0.0], np.cumsum(paid)])
+
+    players, incidence = lineup_incidence(lineups)
+    field_slices = [slice(start, start + field_chunk_size) for start in range(0, len(field), field_chunk_size)]
+
+    # Running totals per lineup and for the whole build
+    num_sims = 0
+    winnings = np.zeros(num_lineups)
+    cashes = np.zeros(num_lineups, dtype=np.int64)
+    tops = np.zeros(num_lineups, dtype=np.int64)
+    wins = np.zeros(num_lineups, dtype=np.int64)
+    portfolio_winnings = []
+    portfolio_cashes = portfolio_tops = portfolio_wins = 0
+
+    for chunk in iter_simulation_chunks(simulations, chunk_size):
+        chunk = np.round(np.asarray(chunk, dtype=np.float32) * SCORE_GRID) / SCORE_GRID
+        ours = score_chunk(chunk, players, incidence)
+
+        # Our lineups against each other, each tying itself, then against the field slice by slice
+        above, ties = _rank_counts(ours, ours)
+        for field_slice in field_slices:
+            field_lineups = LineupSet(field.pool, field.matrix[field_slice])
+            field_above, field_ties = _rank_counts(ours, score_chunk(chunk, *lineup_incidence(field_lineups)))
+            above += field_above
+            ties += field_ties
+
+        # Tied entries share the prize money of the places they span
+        chunk_payouts = (cumulative[above + ties] - cumulative[above]) / ties
+        ranks = above + 1
+
+        num_sims += len(chunk)
+        winnings += chunk_payouts.sum(axis=0)
+        cashes += (chunk_payouts > 0).sum(axis=0)
+        tops += (ranks <= top_rank).sum(axis=0)
+        wins += (ranks == 1).sum(axis=0)
+        portfolio_winnings.append(chunk_payouts.sum(axis=1))
+        portfolio_cashes += int((chunk_payouts > 0).any(axis=1).sum())
+        portfolio_tops += int((ranks <= top_rank).any(axis=1).sum())
+        portfolio_wins += int((ranks == 1).any(axis=1).sum())
+
+    if num_sims == 0:
+        raise ValueError("No simulations to play the contest in.")
+
+    top_label = f"Top {top_percent * 100:g}% Rate"
+    mean_payouts = winnings / num_sims
+    results = pd.DataFrame(
+        {
+            "Lineup": [f"Lineup {i + 1}" for i in range(num_lineups)],
+            "Mean Payout": mean_payouts,
+            "ROI": mean_payouts / entry_fee - 1,
+            "Cash Rate": cashes / num_sims,
+            top_label: tops / num_sims,
+            "Win Rate": wins / num_sims,
+        }
+    )
+
+    portfolio_winnings = np.concatenate(portfolio_winnings)
+    fees = entry_fee * num_lineups
+    portfolio = {
+        "entries": num_lineups,
+        "field_size": len(field),
+        "sims": num_sims,
+        "mean_payout": float(portfolio_winnings.mean()),
+        "roi": float(portfolio_winnings.mean() / fees - 1),
+        "cash_rate": portfolio_cashes / num_sims,
+        "top_rate": portfolio_tops / num_sims,
+        "win_rate": portfolio_wins / num_sims,
+        "profit_rate": float((portfolio_winnings > fees).mean()),
+    }
+    return results, portfolio
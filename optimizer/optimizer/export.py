@@ -0,0 +1,123 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from optimizer.constants import POSITION_BITS, POSITION_FLAGS, ROSTER_REQUIREMENTS
+from optimizer.late_swap import game_times
+
+# Lineups rendered and written per chunk of an upload file
+EXPORT_CHUNK_SIZE = 5000
+
+
+def upload_slots(roster_requirements=ROSTER_REQUIREMENTS):
+    """
+    DraftKings upload columns in roster order, e.g. QB, RB, RB, WR, WR, WR, TE, FLEX, DST.
+
+    Args:
+        roster_requirements (dict): Position constraints for the lineup, in upload order.
+
+    Returns:
+        list: One slot name per roster spot.
+    """
+    return [position for position, count in roster_requirements.items() for _ in range(count)]
+
+
+def primary_positions(pool, positions):
+    """
+    Code of each player's first position among `positions`, by bitmask.
+
+    Args:
+        pool (PlayerPool): The player pool.
+        positions (list): Position names, codes are their indices.
+
+    Returns:
+        np.ndarray: Position code per player, -1 for players with none of `positions`.
+    """
+    codes = np.full(len(pool), -1)
+    for code, position in reversed(list(enumerate(positions))):
+        codes[(pool.positions & POSITION_BITS[position]) > 0] = code
+    return codes
+
+
+def assign_slots(lineups, roster_requirements=ROSTER_REQUIREMENTS):
+    """
+    Orders every lineup's players into DraftKings upload slots in one pass over the matrix.
+
+    The FLEX slot takes the latest-kickoff player among the position the lineup holds
+    one more of than its base slots need, which keeps the most late-swap options open.
+    The other players fill their position's slots earliest game first.
+
+    Args:
+        lineups (LineupSet): The build.
+        roster_requirements (dict): Position constraints for the lineup, in upload order.
+
+    Returns:
+        np.ndarray: `(num_lineups, roster_size)` player indices in `upload_slots` order.
+
+    Raises:
+        ValueError: If a lineup doesn't fill the slots, naming the first few.
+    """
+    slots = upload_slots(roster_requirements)
+    base_positions = [position for position in roster_requirements if position != "FLEX"]
+    flex_codes = [base_positions.index(position) for position in POSITION_FLAGS["IsFLEX"].split("|")]
+    matrix = lineups.matrix
+    if len(matrix) == 0:
+        return matrix.reshape(0, len(slots))
+
+    # Position code and kickoff of every rostered player; unknown kickoffs sort first
+    codes = primary_positions(lineups.pool, base_positions)[matrix]
+    kickoffs = game_times(lineups.pool).astype("datetime64[us]").view(np.int64)
+    kickoffs = np.maximum(kickoffs, np.iinfo(np.int64).min + 1)[matrix]
+
+    # The FLEX comes from the one position filled past its base requirement
+    base_counts = np.array([roster_requirements[position] for position in base_positions])
+    counts = (codes[:, :, None] == np.arange(len(base_positions))).sum(axis=1)
+    surplus = counts - base_counts
+    flex_code = np.array(flex_codes)[surplus[:, flex_codes].argmax(axis=1)]
+    latest = np.where(codes == flex_code[:, None], kickoffs, np.iinfo(np.int64).min)
+    flex_column = latest.argmax(axis=1)
+
+    # Rank each player by the slot it fills, then sort rows by slot rank and kickoff
+    slot_rank = {position: rank for rank, position in enumerate(roster_requirements)}
+    ranks = np.array([slot_rank[position] for position in base_positions])[codes]
+    ranks[np.arange(len(matrix)), flex_column] = slot_rank["FLEX"]
+    order = np.lexsort((kickoffs, ranks), axis=-1)
+    rows = np.arange(len(matrix))[:, None]
+
+    expected = np.array([slot_rank[slot] for slot in slots])
+    invalid = np.flatnonzero((ranks[rows, order] != expected).any(axis=1) | (codes < 0).any(axis=1))
+    if len(invalid):
+        raise ValueError(
+            f"{len(invalid)} lineups don't fit the {', '.join(slots)} slots, "
+            f"e.g. lineup {', '.join(str(i + 1) for i in invalid[:5])}."
+        )
+    return matrix[rows, order]
+
+
+def write_dk_upload(lineups, path_or_buffer, roster_requirements=ROSTER_REQUIREMENTS, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Writes a build as a DraftKings bulk upload CSV, one player id per slot.
+
+    Slots are assigned for the whole build at once; rows are then rendered and written
+    `chunk_size` lineups at a time, so the text of a large build is never held in memory.
+
+    Args:
+        lineups (LineupSet): The build.
+        path_or_buffer (str or file-like): Output path or open text file.
+        roster_requirements (dict): Position constraints for the lineup, in upload order.
+        chunk_size (int): Lineups written per chunk.
+
+    Returns:
+        int: Number of lineups written.
+    """
+    if isinstance(path_or_buffer, (str, os.PathLike)):
+        with open(path_or_buffer, "w", newline="") as f:
+            return write_dk_upload(lineups, f, roster_requirements, chunk_size)
+
+    slots = upload_slots(roster_requirements)
+    ids = lineups.pool.ids[assign_slots(lineups, roster_requirements)]
+    path_or_buffer.write(",".join(slots) + "\n")
+    for start in range(0, len(ids), chunk_size):
+        pd.DataFrame(ids[start:start + chunk_size]).to_csv(path_or_buffer, header=False, index=False)
+    return len(ids)
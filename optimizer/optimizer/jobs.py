@@ -0,0 +1,103 @@
+import threading
+import time
+
+from optimizer.main_opto import run_optimizer_workflow
+from optimizer.telemetry import Telemetry
+
+
+class OptimizerJob:
+    """
+    Runs `run_optimizer_workflow` on a background thread.
+
+    Lineups are appended to `lineups` as each projection set finishes, so a caller
+    (typically a Streamlit rerun loop) can poll progress and show partial results while
+    the build runs. CBC solves in a subprocess, so the Streamlit script thread keeps
+    serving reruns while the job waits on it. `telemetry` fills in as the build runs.
+    """
+
+    def __init__(self, player_pool, num_lineups, min_salary, max_salary, min_uniques, variance_range,
+                 **workflow_options):
+        """
+        Args:
+            player_pool (pd.DataFrame or PlayerPool): Player pool with projections and salary.
+            num_lineups (int): Number of lineups to generate.
+            min_salary (int): Minimum salary cap.
+            max_salary (int): Maximum salary cap.
+            min_uniques (int): Minimum unique players across lineups.
+            variance_range (float): Maximum percentage variance applied to projections.
+            **workflow_options: Extra keyword arguments for `run_optimizer_workflow`
+                (max_workers, backend, prune, seed).
+        """
+        self.args = (player_pool, num_lineups, min_salary, max_salary, min_uniques, variance_range)
+        self.workflow_options = workflow_options
+        self.total = num_lineups
+        self.completed = 0
+        self.lineups = []
+        self.telemetry = Telemetry()
+        self.status = "pending"
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Starts the build on the background thread and returns immediately."""
+        self.started_at = time.perf_counter()
+        self.status = "running"
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        """Asks the build to stop after the projection set in progress."""
+        self.cancel_event.set()
+
+    def _on_progress(self, sets_done, num_sets, lineups):
+        with self.lock:
+            self.completed = sets_done
+            self.total = num_sets
+            self.lineups.extend(lineups)
+
+    def _run(self):
+        try:
+            self.result = run_optimizer_workflow(
+                *self.args,
+                progress_callback=self._on_progress,
+                cancel_event=self.cancel_event,
+                telemetry=self.telemetry,
+                **self.workflow_options,
+            )
+            self.status = "cancelled" if self.cancel_event.is_set() else "done"
+        except Exception as e:
+            self.error = e
+            self.status = "failed"
+        finally:
+            self.finished_at = time.perf_counter()
+
+    @property
+    def running(self):
+        return self.status == "running"
+
+    @property
+    def progress(self):
+        """Fraction of projection sets solved, between 0 and 1."""
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def elapsed(self):
+        """Seconds since the job started (frozen once it finishes)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def rate(self):
+        """Lineups found per second so far."""
+        return len(self.lineups) / self.elapsed if self.elapsed else 0.0
+
+    def snapshot(self):
+        """Returns a copy of the lineups found so far, safe to render while the job runs."""
+        with self.lock:
+            return list(self.lineups)
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from optimizer.builder import SolverSession
+from optimizer.constants import ROSTER_REQUIREMENTS
+from optimizer.lineups import LineupSet
+from optimizer.player_pool import PlayerPool
+from optimizer.preprocess import parse_game_times
+from optimizer.telemetry import Telemetry
+
+# Clock the DraftKings "Game Info" kickoff times are written in
+SLATE_TIMEZONE = "America/New_York"
+
+
+def game_times(player_pool):
+    """
+    Kickoff time of every player's game.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool.
+
+    Returns:
+        np.ndarray: datetime64 kickoff per player in pool order, NaT where unknown.
+    """
+    if isinstance(player_pool, PlayerPool):
+        kickoffs = parse_game_times(pd.Series(player_pool.games, dtype=object)).to_numpy()
+        return kickoffs[player_pool.game_codes]
+    if "GameTime" in player_pool.columns:
+        return player_pool["GameTime"].to_numpy(dtype="datetime64[us]")
+    return parse_game_times(player_pool["Game Info"]).to_numpy()
+
+
+def slate_now():
+    """The current time on the slate's clock, as a naive timestamp like "GameTime"."""
+    return pd.Timestamp.now(tz=SLATE_TIMEZONE).tz_localize(None)
+
+
+def locked_players(player_pool, now=None):
+    """
+    Marks players whose game has started.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool.
+        now (datetime): Current time on the slate's clock. Defaults to `slate_now()`.
+
+    Returns:
+        np.ndarray: Boolean mask in pool order. Players with unknown kickoffs stay unlocked.
+    """
+    now = np.datetime64(pd.Timestamp(slate_now() if now is None else now).to_datetime64(), "us")
+    return game_times(player_pool) <= now
+
+
+def late_swap(
+    lineups,
+    now=None,
+    roster_requirements=ROSTER_REQUIREMENTS,
+    min_salary=0,
+    max_salary=50000,
+    min_uniques=0,
+    projections=None,
+    backend="cbc",
+    telemetry=None,
+):
+    """
+    Re-optimizes the open slots of every lineup after some games have locked.
+
+    Players whose game has started are fixed: a lineup keeps the locked players it
+    holds and can't add any others. One model is compiled for the whole build, over
+    the unlocked players plus the locked players the build holds, and each lineup
+    only changes which players are fixed before its solve. Each swapped lineup gets a
+    diversity cut, so the swapped build keeps `min_uniques` between lineups wherever
+    their locked players allow it. A lineup that can't be swapped is kept as it was.
+
+    Args:
+        lineups (LineupSet): The build to swap.
+        now (datetime): Current time on the slate's clock. Defaults to `slate_now()`.
+        roster_requirements (dict): Position constraints for the lineup.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        min_uniques (int): Minimum number of unique players across any two swapped lineups.
+        projections (np.ndarray): Current projections in pool order. Defaults to the
+            pool's projections.
+        backend (str): Solver backend name, see `optimizer.backends.SOLVER_BACKENDS`.
+        telemetry (Telemetry): Records the "late_swap" stage and every solve's stats, if
+            given, with each solve's set numbered by its lineup.
+
+    Returns:
+        tuple: (swapped, summary) where swapped is a LineupSet over the same pool and
+            summary is a DataFrame with each lineup's locked and swapped player counts,
+            projected points before and after, and status.
+    """
+    if telemetry is None:
+        telemetry = Telemetry(backend)
+    player_pool = lineups.player_pool
+    if projections is None:
+        projections = lineups.pool.projections
+    projections = np.asarray(projections, dtype=float)
+    matrix = lineups.matrix
+    locked = locked_players(player_pool, now)
+
+    # Locked players nobody holds can't be added, so they stay out of the model entirely
+    held = np.zeros(len(locked), dtype=bool)
+    held[matrix.ravel()] = True
+    columns = np.flatnonzero(~locked | held)
+    position = np.full(len(locked), -1)
+    position[columns] = np.arange(len(columns))
+    solve_pool = player_pool.take(columns) if isinstance(player_pool, PlayerPool) else player_pool.iloc[columns]
+
+    session = SolverSession(solve_pool, roster_requirements, min_salary, max_salary, min_uniques, backend=backend)
+    session.set_projections(projections[columns])
+    locked_held = position[np.flatnonzero(locked & held)]
+
+    swapped = matrix.copy()
+    rows = []
+    with telemetry.stage("late_swap"):
+        for lineup_index, selected in enumerate(matrix):
+            lineup_locked = selected[locked[selected]]
+            status = "locked"
+            if len(lineup_locked) < len(selected):
+                # Keep this lineup's locked players and bar every other locked player
+                session.fix_players(position[lineup_locked], np.setdiff1d(locked_held, position[lineup_locked]))
+                solved = next(session.iter_selections(num_lineups=1), None)
+                telemetry.record_solve(lineup_index, session.last_solve)
+                if solved is not None:
+                    swapped[lineup_index] = np.sort(columns[solved])
+                    status = "swapped"
+                else:
+                    status = "infeasible"
+            if status != "swapped":
+                session.add_lineup_cut(position[selected])
+
+            rows.append(
+                {
+                    "Lineup": lineup_index + 1,
+                    "Locked": len(lineup_locked),
+                    "Swapped": len(np.setdiff1d(swapped[lineup_index], selected)),
+                    "Points Before": round(float(projections[selected].sum()), 4),
+                    "Points After": round(float(projections[swapped[lineup_index]].sum()), 4),
+                    "Status": status,
+                }
+            )
+    telemetry.finish()
+
+    return LineupSet(player_pool, swapped, projections[swapped]), pd.DataFrame(rows)
@@ -0,0 +1,212 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from optimizer.builder import lineup_frame
+from optimizer.constants import ROSTER_SIZE
+from optimizer.player_pool import PlayerPool
+
+
+class LineupSet:
+    """
+    A build stored as an `(num_lineups, roster_size)` int32 matrix of player indices.
+
+    Totals, exposures, stacks and duplicates are computed on the matrix with NumPy.
+    Indexing or iterating yields one lineup DataFrame at a time, built on demand, so
+    callers that expect a list of DataFrames keep working.
+    """
+
+    def __init__(self, player_pool, selections, projections=None):
+        """
+        Args:
+            player_pool (pd.DataFrame or PlayerPool): The pool the indices point into.
+            selections (np.ndarray): `(num_lineups, roster_size)` positional player indices.
+            projections (np.ndarray): Optional `(num_lineups, roster_size)` projections each
+                lineup was solved against. Defaults to the pool's projections.
+        """
+        self.player_pool = player_pool
+        self.pool = player_pool if isinstance(player_pool, PlayerPool) else PlayerPool.from_dataframe(player_pool)
+        # An empty build keeps the full roster width, so per-lineup results are just empty
+        roster_size = -1 if len(selections) else ROSTER_SIZE
+        self.matrix = np.asarray(selections, dtype=np.int32).reshape(len(selections), roster_size)
+        self.projections = (
+            None if projections is None else np.asarray(projections, dtype=np.float32).reshape(self.matrix.shape)
+        )
+
+    @classmethod
+    def from_selections(cls, player_pool, selections, projections=None):
+        """
+        Builds a LineupSet from per-lineup index arrays, as returned by the solver.
+
+        Args:
+            player_pool (pd.DataFrame or PlayerPool): The pool the indices point into.
+            selections (list of np.ndarray): Positional player indices, one array per lineup.
+            projections (list of np.ndarray): Optional projections of the selected players,
+                one array per lineup.
+
+        Returns:
+            LineupSet: The build.
+        """
+        roster_size = len(selections[0]) if len(selections) else ROSTER_SIZE
+        matrix = np.array(selections, dtype=np.int32).reshape(len(selections), roster_size)
+        if projections is not None:
+            projections = np.array(projections, dtype=np.float32).reshape(len(selections), roster_size)
+        return cls(player_pool, matrix, projections)
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def __getitem__(self, lineup_index):
+        selected = self.matrix[lineup_index]
+        projections = np.zeros(len(self.pool))
+        projections[selected] = self.player_projections()[lineup_index]
+        return lineup_frame(self.player_pool, selected, projections)
+
+    def __iter__(self):
+        for lineup_index in range(len(self)):
+            yield self[lineup_index]
+
+    @property
+    def nbytes(self):
+        """Bytes held by the lineup matrix and per-lineup projections."""
+        return self.matrix.nbytes + (0 if self.projections is None else self.projections.nbytes)
+
+    def player_projections(self):
+        """`(num_lineups, roster_size)` projections of every rostered player."""
+        if self.projections is not None:
+            return self.projections
+        return self.pool.projections[self.matrix]
+
+    def salary_totals(self):
+        """Total salary of each lineup."""
+        return self.pool.salary[self.matrix].sum(axis=1)
+
+    def projection_totals(self):
+        """Total projected points of each lineup, rounded to hide float32 noise."""
+        return self.player_projections().sum(axis=1, dtype=np.float64).round(4)
+
+    def ownership_totals(self):
+        """Total projected ownership of each lineup, rounded to hide float32 noise."""
+        return self.pool.ownership[self.matrix].sum(axis=1, dtype=np.float64).round(4)
+
+    def exposure_counts(self):
+        """Number of lineups each player in the pool appears in."""
+        return np.bincount(self.matrix.ravel(), minlength=len(self.pool))
+
+    def exposures(self):
+        """
+        Returns:
+            pd.DataFrame: "Player" and "Appearances" for every rostered player, most used first.
+        """
+        counts = self.exposure_counts()
+        used = np.flatnonzero(counts)
+        order = used[np.argsort(-counts[used], kind="stable")]
+        return pd.DataFrame({"Player": self.pool.names[order], "Appearances": counts[order]})
+
+    def _group_counts(self, codes, num_groups):
+        """`(num_lineups, num_groups)` count of rostered players per group code."""
+        lineup_ids = np.repeat(np.arange(len(self)), self.matrix.shape[1])
+        flat = lineup_ids * num_groups + codes[self.matrix].ravel().astype(np.int64)
+        return np.bincount(flat, minlength=len(self) * num_groups).reshape(len(self), num_groups)
+
+    def team_counts(self):
+        """`(num_lineups, num_teams)` players rostered from each team."""
+        return self._group_counts(self.pool.team_codes, len(self.pool.teams))
+
+    def game_counts(self):
+        """`(num_lineups, num_games)` players rostered from each game."""
+        return self._group_counts(self.pool.game_codes, len(self.pool.games))
+
+    def stack_sizes(self):
+        """
+        Returns:
+            pd.DataFrame: Largest team stack and game stack of each lineup, with the team
+                and game they come from.
+        """
+        team_counts = self.team_counts()
+        game_counts = self.game_counts()
+        team = team_counts.argmax(axis=1)
+        game = game_counts.argmax(axis=1)
+        return pd.DataFrame(
+            {
+                "Team Stack": team_counts.max(axis=1, initial=0),
+                "Stack Team": self.pool.teams[team] if len(self.pool.teams) else [],
+                "Game Stack": game_counts.max(axis=1, initial=0),
+                "Stack Game": self.pool.games[game] if len(self.pool.games) else [],
+            }
+        )
+
+    def lineup_keys(self):
+        """One hashable key per lineup, equal for lineups with the same players in any order."""
+        rows = np.ascontiguousarray(np.sort(self.matrix, axis=1))
+        return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
+
+    def duplicate_mask(self):
+        """Boolean mask of lineups that repeat an earlier lineup."""
+        _, first = np.unique(self.lineup_keys(), return_index=True)
+        duplicated = np.ones(len(self), dtype=bool)
+        duplicated[first] = False
+        return duplicated
+
+    def unique(self):
+        """Returns a LineupSet without duplicate lineups, keeping first occurrences."""
+        keep = ~self.duplicate_mask()
+        projections = None if self.projections is None else self.projections[keep]
+        return LineupSet(self.player_pool, self.matrix[keep], projections)
+
+    def summary(self):
+        """
+        Returns:
+            pd.DataFrame: Total salary, projected score and ownership of each lineup.
+        """
+        return pd.DataFrame(
+            {
+                "Lineup": [f"Lineup {i + 1}" for i in range(len(self))],
+                "Total Salary": self.salary_totals(),
+                "Total Projected Score": self.projection_totals(),
+                "Total Projected Ownership": self.ownership_totals(),
+            }
+        )
+
+    def format_rows(self):
+        """
+        Returns:
+            pd.DataFrame: One condensed row per lineup, with player names joined.
+        """
+        names = self.pool.names[self.matrix].astype(str)
+        return pd.DataFrame(
+            {
+                "Rank": np.arange(1, len(self) + 1),
+                "Players": [", ".join(row) for row in names],
+                "Salary": self.salary_totals(),
+                "Proj. Score": self.projection_totals(),
+                "Proj. Ownership": self.ownership_totals(),
+            }
+        )
+
+
+class ExposureCounter:
+    """
+    Counts player appearances one lineup at a time, so a streamed build never has to be
+    held in memory to report exposures.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.num_lineups = 0
+
+    def add(self, lineup):
+        """
+        Args:
+            lineup (pd.DataFrame): One lineup with a "Name" column.
+        """
+        self.counts.update(lineup["Name"])
+        self.num_lineups += 1
+
+    def exposures(self):
+        """
+        Returns:
+            pd.DataFrame: "Player" and "Appearances", most used first.
+        """
+        return pd.DataFrame(self.counts.most_common(), columns=["Player", "Appearances"])
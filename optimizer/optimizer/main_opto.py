@@ -1,48 +1,232 @@
+import time
+
+import numpy as np
 import pandas as pd
-from optimizer.builder import optimize_lineup
+from optimizer.builder import SolverSession, add_flex_flags, lineup_frame
+from optimizer.lineups import LineupSet
+from optimizer.parallel import iter_projection_sets_parallel
+from optimizer.player_pool import PlayerPool
+from optimizer.pruning import prune_dominated_players, pruning_scale
+from optimizer.telemetry import Telemetry
 from optimizer.variance import generate_projection_sets
 from optimizer.opto_utils import calculate_player_exposures
 from optimizer.constants import ROSTER_REQUIREMENTS
 
 
-def run_optimizer_workflow(player_pool, num_lineups, min_salary, max_salary, min_uniques, variance_range):
+def iter_optimizer_workflow(
+    player_pool,
+    num_lineups,
+    min_salary,
+    max_salary,
+    min_uniques,
+    variance_range,
+    max_workers=1,
+    backend="cbc",
+    prune=None,
+    seed=None,
+    lineups_per_set=1,
+    telemetry=None,
+):
     """
-    Orchestrates the entire optimization workflow.
+    Runs the optimization workflow, yielding each lineup as soon as it is solved.
+
+    Stopping iteration early stops the build; in parallel mode pending projection sets
+    are cancelled.
 
     Args:
-        player_pool (pd.DataFrame): Player pool with projections and salary.
-        num_lineups (int): Number of lineups to generate.
+        player_pool (pd.DataFrame or PlayerPool): Player pool with projections and salary.
+        num_lineups (int): Number of projection sets to draw and solve.
         min_salary (int): Minimum salary cap.
         max_salary (int): Maximum salary cap.
         min_uniques (int): Minimum unique players across lineups.
         variance_range (float): Maximum percentage variance applied to projections.
+        max_workers (int): Worker processes used to solve projection sets. With more than
+            one, sets are solved in parallel; the lineups match a serial run's.
+        backend (str): Solver backend name, see `optimizer.backends.SOLVER_BACKENDS`.
+        prune (bool): Drop players that are dominated in every projection set before solving.
+            None prunes when `min_uniques` is 0. A build with diversity cuts is only
+            pruned when True, against the whole build.
+        seed (int): Seed for the projection draws. None draws fresh entropy. Set `i` is
+            drawn from the `i`-th child of `np.random.SeedSequence(seed)`, so serial and
+            parallel runs draw bit-identical projection sets and build the same lineups.
+        lineups_per_set (int): Lineups solved per projection set.
+        telemetry (Telemetry): Records stage times and every solve's stats, if given.
 
-    Returns:
-        tuple: (all_lineups, player_exposures)
+    Yields:
+        tuple: (lineup, info) where lineup is a DataFrame and info is a dict with "set",
+            "sets_done", "num_sets", "selected" (positional indices into `player_pool`),
+            "projections" (of the selected players), "points", "salary" and "solve_seconds".
     """
     print("Debug: Starting optimizer workflow")
     print(f"Variance Range: {variance_range * 100}%")
+    if telemetry is None:
+        telemetry = Telemetry()
+    telemetry.backend = backend
+
+    if max_workers > 1:
+        print(f"Debug: Solving {num_lineups} projection sets across {max_workers} workers")
+        try:
+            yield from iter_projection_sets_parallel(
+                player_pool,
+                roster_requirements=ROSTER_REQUIREMENTS,
+                min_salary=min_salary,
+                max_salary=max_salary,
+                min_uniques=min_uniques,
+                num_sets=num_lineups,
+                variance_range=variance_range,
+                num_lineups=lineups_per_set,
+                max_workers=max_workers,
+                backend=backend,
+                prune=prune,
+                seed=seed,
+                telemetry=telemetry,
+            )
+        finally:
+            telemetry.finish()
+        print("Debug: Optimization workflow completed")
+        return
 
-    # Generate multiple projection sets with variance applied
-    projection_sets = generate_projection_sets(player_pool, num_sets=num_lineups, variance_range=variance_range)
+    # Flag the caller's pool, so lineups rendered from it carry the FLEX flags too
+    if not isinstance(player_pool, PlayerPool):
+        player_pool = add_flex_flags(player_pool)
+
+    # Generate multiple projection sets with variance applied, each from its own substream
+    with telemetry.stage("projection_sets"):
+        projection_sets = generate_projection_sets(
+            player_pool, num_sets=num_lineups, variance_range=variance_range, seed=seed
+        )
     print(f"Debug: {len(projection_sets)} projection sets generated")
+    full_matrix = projection_sets.matrix
+    projection_matrix = full_matrix
+    columns = np.arange(len(player_pool))
+    solve_pool = player_pool
+
+    # Drop players that can't make any lineup in any set, keeping the matrix aligned. Here
+    # one session solves every set, so diversity cuts accumulate across sets and the exact
+    # threshold grows with the whole build; by default that case isn't pruned at all
+    scale = pruning_scale(min_uniques, lineups_per_set, num_sets=num_lineups)
+    if prune is None:
+        prune = scale == 1
+    if prune:
+        with telemetry.stage("pruning"):
+            solve_pool, kept = prune_dominated_players(
+                player_pool,
+                ROSTER_REQUIREMENTS,
+                min_salary=min_salary,
+                projections=projection_matrix,
+                num_lineups=scale,
+            )
+        projection_matrix = projection_matrix[:, kept]
+        columns = np.flatnonzero(kept)
+
+    # Build the roster/salary model once; each projection set only swaps the objective
+    session = SolverSession(
+        solve_pool,
+        roster_requirements=ROSTER_REQUIREMENTS,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        min_uniques=min_uniques,
+        backend=backend,
+    )
 
     # Optimize lineups for each projection set
-    all_lineups = []
-    for i, projection_set in enumerate(projection_sets):
-        print(f"Debug: Optimizing lineup for projection set {i + 1}")
-        lineups = optimize_lineup(
-            player_pool=projection_set,
-            roster_requirements=ROSTER_REQUIREMENTS,
-            min_salary=min_salary,
-            max_salary=max_salary,
-            num_lineups=1,  # Optimize one lineup per set
-            min_uniques=min_uniques,
-        )
-        all_lineups.extend(lineups)
+    try:
+        for i, projections in enumerate(projection_matrix):
+            print(f"Debug: Optimizing lineup for projection set {i + 1}")
+            solve_start = time.perf_counter()
+            found = 0
+            for selected in session.iter_selections(projections, num_lineups=lineups_per_set):
+                solve_seconds = time.perf_counter() - solve_start
+                render_start = time.perf_counter()
+                pool_selected = columns[selected]
+                lineup = lineup_frame(player_pool, pool_selected, full_matrix[i].astype(float))
+                telemetry.record_solve(i, session.last_solve, time.perf_counter() - render_start)
+                found += 1
+                yield lineup, {
+                    "set": i,
+                    "sets_done": i + 1,
+                    "num_sets": len(projection_matrix),
+                    "selected": pool_selected,
+                    "projections": projections[selected],
+                    "points": float(projections[selected].sum()),
+                    "salary": int(lineup["Salary"].sum()),
+                    "solve_seconds": solve_seconds,
+                }
+                solve_start = time.perf_counter()
+
+            # A set that stopped short ended on a failed solve
+            if found < lineups_per_set:
+                telemetry.record_solve(i, session.last_solve)
+    finally:
+        telemetry.finish()
+
+    print("Debug: Optimization workflow completed")
+
+
+def run_optimizer_workflow(
+    player_pool,
+    num_lineups,
+    min_salary,
+    max_salary,
+    min_uniques,
+    variance_range,
+    max_workers=1,
+    backend="cbc",
+    prune=None,
+    seed=None,
+    progress_callback=None,
+    cancel_event=None,
+    lineups_per_set=1,
+    telemetry=None,
+):
+    """
+    Orchestrates the entire optimization workflow.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): Player pool with projections and salary.
+        num_lineups (int): Number of lineups to generate.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        min_uniques (int): Minimum unique players across lineups.
+        variance_range (float): Maximum percentage variance applied to projections.
+        max_workers (int): Worker processes used to solve projection sets. With more than
+            one, sets are solved in parallel; the lineups match a serial run's.
+        backend (str): Solver backend name, see `optimizer.backends.SOLVER_BACKENDS`.
+        prune (bool): Drop players that are dominated in every projection set before solving.
+            None prunes when `min_uniques` is 0. A build with diversity cuts is only
+            pruned when True, against the whole build.
+        seed (int): Seed for the projection draws. None draws fresh entropy.
+        progress_callback (callable): Called as `progress_callback(sets_done, num_sets, lineups)`
+            after each lineup is solved, with a list holding that lineup's DataFrame.
+        cancel_event (threading.Event): When set, stops after the current lineup and
+            returns the lineups found so far.
+        lineups_per_set (int): Lineups solved per projection set.
+        telemetry (Telemetry): Records stage times and every solve's stats, if given.
+
+    Returns:
+        tuple: (all_lineups, player_exposures) where all_lineups is a LineupSet.
+    """
+    selections = []
+    selected_projections = []
+    lineups = iter_optimizer_workflow(
+        player_pool, num_lineups, min_salary, max_salary, min_uniques, variance_range,
+        max_workers=max_workers, backend=backend, prune=prune, seed=seed, lineups_per_set=lineups_per_set,
+        telemetry=telemetry,
+    )
+    for lineup, info in lineups:
+        selections.append(info["selected"])
+        selected_projections.append(info["projections"])
+        if progress_callback is not None:
+            progress_callback(info["sets_done"], info["num_sets"], [lineup])
+        if cancel_event is not None and cancel_event.is_set():
+            print(f"Debug: Cancelled after {info['sets_done']} projection sets")
+            lineups.close()
+            break
+    if not selections:
+        print("Debug: No feasible lineup found for any projection set")
+    all_lineups = LineupSet.from_selections(player_pool, selections, selected_projections)
 
     # Calculate and store player exposures
     player_exposures = calculate_player_exposures(all_lineups)
-    print("Debug: Optimization workflow completed")
 
     return all_lineups, player_exposures
@@ -0,0 +1,271 @@
+import difflib
+import re
+import unicodedata
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from optimizer.constants import NFL_TEAMS, TEAM_ALIASES
+
+# Name suffixes dropped before comparing, so "DJ Chark Jr." matches "D.J. Chark"
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+# Position spellings other sources use, mapped to DraftKings positions
+POSITION_ALIASES = {"D": "DST", "DEF": "DST", "D/ST": "DST", "DST": "DST"}
+
+# Smallest name similarity accepted by the fuzzy pass, and how close a runner-up must be to count as a tie
+FUZZY_THRESHOLD = 0.85
+AMBIGUITY_MARGIN = 0.03
+
+# Score given to same team, last name and first initial ("Mike"/"Michael"), when the spelling alone scores lower
+INITIAL_MATCH_SCORE = 0.9
+
+
+def _team_lookup():
+    """Lowercase abbreviation, alias, nickname, "city nickname" and unshared city -> DK abbreviation."""
+    lookup = {}
+    city_counts = Counter(city for city, _ in NFL_TEAMS.values())
+    for abbr, (city, nickname) in NFL_TEAMS.items():
+        lookup[abbr.lower()] = abbr
+        lookup[nickname.lower()] = abbr
+        lookup[f"{city} {nickname}".lower()] = abbr
+        if city_counts[city] == 1:
+            lookup[city.lower()] = abbr
+    for alias, abbr in TEAM_ALIASES.items():
+        lookup[alias.lower()] = abbr
+    return lookup
+
+
+TEAM_LOOKUP = _team_lookup()
+
+
+def _normalize_name(name):
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+    tokens = re.sub(r"[^a-z0-9 ]+", " ", re.sub(r"[.'`]", "", name)).split()
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def _map_unique(values, function):
+    """Applies `function` once per distinct value of a string Series."""
+    codes, uniques = pd.factorize(values.fillna("").astype(str))
+    mapped = np.array([function(value) for value in uniques] or [""], dtype=object)
+    return pd.Series(mapped[codes] if len(uniques) else [], index=values.index, dtype=object)
+
+
+def normalize_names(names):
+    """
+    Lowercases names and strips accents, punctuation and generational suffixes.
+
+    Args:
+        names (pd.Series): Player names.
+
+    Returns:
+        pd.Series: Normalized names, "" where missing.
+    """
+    return _map_unique(names, _normalize_name)
+
+
+def normalize_teams(teams):
+    """
+    Maps abbreviations, aliases and team names to DraftKings abbreviations.
+
+    Args:
+        teams (pd.Series): Team abbreviations or names, e.g. "JAC", "Bengals", "Tampa Bay Buccaneers".
+
+    Returns:
+        pd.Series: DraftKings abbreviations, "" where unknown.
+    """
+    return _map_unique(teams, lambda team: TEAM_LOOKUP.get(team.strip().lower().replace(".", ""), ""))
+
+
+def normalize_positions(positions):
+    """
+    Reduces position strings to their first DraftKings position, e.g. "RB/FLEX" -> "RB".
+
+    Args:
+        positions (pd.Series): Position strings.
+
+    Returns:
+        pd.Series: Positions, "" where missing.
+    """
+    def first_position(position):
+        position = position.strip().upper()
+        position = POSITION_ALIASES.get(position, position.split("/")[0])
+        return POSITION_ALIASES.get(position, position)
+
+    return _map_unique(positions, first_position)
+
+
+def _column(frame, candidates):
+    """Returns the first of `candidates` present in `frame`, as a Series ("" if none are)."""
+    for name in candidates:
+        if name in frame.columns:
+            return frame[name]
+    return pd.Series("", index=frame.index)
+
+
+def player_keys(frame, name_columns=("Name",), team_columns=("TeamAbbrev", "Team"),
+                position_columns=("Position", "Pos")):
+    """
+    Builds the normalized name, team and position used to match a source's players.
+
+    Defenses are keyed by team, so "Buccaneers" and "Tampa Bay Buccaneers" agree.
+
+    Args:
+        frame (pd.DataFrame): A player table.
+        name_columns (tuple): Candidate name columns, first present wins.
+        team_columns (tuple): Candidate team columns, first present wins.
+        position_columns (tuple): Candidate position columns, first present wins.
+
+    Returns:
+        pd.DataFrame: "name", "team" and "position" columns aligned to `frame`.
+    """
+    raw_names = _column(frame, name_columns)
+    keys = pd.DataFrame(
+        {
+            "name": normalize_names(raw_names),
+            "team": normalize_teams(_column(frame, team_columns)),
+            "position": normalize_positions(_column(frame, position_columns)),
+        },
+        index=frame.index,
+    )
+    defenses = (keys["position"] == "DST").to_numpy()
+    if defenses.any():
+        defense_teams = normalize_teams(raw_names[defenses])
+        keys.loc[defenses, "team"] = keys.loc[defenses, "team"].where(keys.loc[defenses, "team"] != "", defense_teams)
+        keys.loc[defenses, "name"] = keys.loc[defenses, "team"].where(
+            keys.loc[defenses, "team"] != "", keys.loc[defenses, "name"]
+        )
+    return keys
+
+
+def _name_score(matcher, name, source_name, threshold, use_initials):
+    """`difflib` ratio of two normalized names, or `INITIAL_MATCH_SCORE` for a same-surname nickname."""
+    name_parts, source_parts = name.split(" "), source_name.split(" ")
+    initial_match = (
+        use_initials and len(name_parts) > 1 and len(source_parts) > 1
+        and name_parts[-1] == source_parts[-1] and name_parts[0][:1] == source_parts[0][:1]
+    )
+    matcher.set_seq1(source_name)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return INITIAL_MATCH_SCORE if initial_match else 0.0
+    score = matcher.ratio()
+    return max(score, INITIAL_MATCH_SCORE) if initial_match else score
+
+
+def _blocks(keys, use_team):
+    """Blocking key per row: position and team, or position and last-name initial without teams."""
+    if use_team:
+        return keys["position"] + "|" + keys["team"]
+    last_names = keys["name"].str.split(" ").str[-1].fillna("")
+    return keys["position"] + "|" + last_names.str[:1]
+
+
+def match_players(dk_df, source_df, threshold=FUZZY_THRESHOLD, margin=AMBIGUITY_MARGIN):
+    """
+    Matches a projection source's players to DraftKings players without ids.
+
+    Players are first joined exactly on normalized name within blocks of the same
+    position and team (or position and last-name initial when the source has no
+    teams). Players left over are compared with `difflib` only inside their block,
+    so the work grows with block sizes rather than with the product of the tables.
+    Within a team, a shared last name and first initial also counts as a match, for
+    nicknames.
+    A player whose best candidates tie within `margin` is reported as ambiguous and
+    left unmatched rather than guessed.
+
+    Args:
+        dk_df (pd.DataFrame): DraftKings players with "Name", "TeamAbbrev" and "Position".
+        source_df (pd.DataFrame): Projection rows with a name and, optionally, team and position.
+        threshold (float): Smallest `difflib` ratio accepted by the fuzzy pass.
+        margin (float): Ratio gap under which two candidates are considered tied.
+
+    Returns:
+        tuple: (matches, report). `matches` has "dk_index", "source_index", "method"
+            ("name" or "fuzzy") and "score". `report` lists the unmatched and ambiguous
+            rows of both tables with their "side", "index", "name", "team", "position",
+            "status" and "candidates".
+    """
+    dk_keys = player_keys(dk_df)
+    source_keys = player_keys(source_df)
+    # Defenses always get a team from their name, so only other players show whether the source has teams
+    use_team = bool(((source_keys["team"] != "") & (source_keys["position"] != "DST")).any())
+    dk_keys["block"] = _blocks(dk_keys, use_team)
+    source_keys["block"] = _blocks(source_keys, use_team)
+
+    # Exact pass: one join on (name, block), keeping only one-to-one pairs
+    pairs = dk_keys.reset_index(names="dk_index").merge(
+        source_keys.reset_index(names="source_index"), on=["name", "block"]
+    )[["dk_index", "source_index"]]
+    one_to_one = (pairs.groupby("dk_index")["source_index"].transform("size") == 1) & (
+        pairs.groupby("source_index")["dk_index"].transform("size") == 1
+    )
+    ambiguous = {}
+    for dk_index, group in pairs[~one_to_one].groupby("dk_index"):
+        ambiguous[dk_index] = [(source_index, 1.0) for source_index in group["source_index"]]
+    exact = pairs[one_to_one].assign(method="name", score=1.0)
+    tied_sources = set(pairs.loc[~one_to_one, "source_index"])
+
+    # Fuzzy pass over what's left. Within a block, only names sharing a first or last
+    # initial are compared; one typo can't change both
+    dk_left = dk_keys[~dk_keys.index.isin(pairs["dk_index"])]
+    source_left = source_keys[~source_keys.index.isin(pairs["source_index"])]
+    source_blocks = {}
+    for source_index, source_name, block in zip(source_left.index, source_left["name"], source_left["block"]):
+        by_first, by_last = source_blocks.setdefault(block, ({}, {}))
+        by_first.setdefault(source_name[:1], {})[source_index] = source_name
+        by_last.setdefault(source_name.split(" ")[-1][:1], {})[source_index] = source_name
+    candidates = []
+    matcher = difflib.SequenceMatcher(autojunk=False)
+    for dk_index, name, block in zip(dk_left.index, dk_left["name"], dk_left["block"]):
+        if block not in source_blocks or not name:
+            continue
+        by_first, by_last = source_blocks[block]
+        names = {**by_first.get(name[:1], {}), **by_last.get(name.split(" ")[-1][:1], {})}
+        matcher.set_seq2(name)
+        scores = []
+        for source_index, source_name in names.items():
+            score = _name_score(matcher, name, source_name, threshold, use_team)
+            if score >= threshold:
+                scores.append((source_index, score))
+        if not scores:
+            continue
+        scores.sort(key=lambda item: -item[1])
+        if len(scores) > 1 and scores[1][1] >= scores[0][1] - margin:
+            ambiguous[dk_index] = scores
+            tied_sources.update(source_index for source_index, _ in scores)
+            continue
+        candidates.append((scores[0][1], dk_index, scores[0][0]))
+
+    # Best pairs first, each projection row used once
+    fuzzy = []
+    used = set()
+    for score, dk_index, source_index in sorted(candidates, key=lambda item: -item[0]):
+        if source_index not in used:
+            used.add(source_index)
+            fuzzy.append((dk_index, source_index, "fuzzy", score))
+    matches = pd.concat(
+        [exact, pd.DataFrame(fuzzy, columns=["dk_index", "source_index", "method", "score"])], ignore_index=True
+    )
+
+    # Report every row of either table that ended up without a partner
+    def describe(keys, index):
+        return {"name": keys.at[index, "name"], "team": keys.at[index, "team"], "position": keys.at[index, "position"]}
+
+    rows = []
+    for dk_index in dk_keys.index.difference(matches["dk_index"]):
+        status = "ambiguous" if dk_index in ambiguous else "unmatched"
+        names = ", ".join(
+            f"{source_keys.at[source_index, 'name']} ({score:.2f})" for source_index, score in ambiguous.get(dk_index, [])
+        )
+        rows.append({"side": "dk", "index": dk_index, **describe(dk_keys, dk_index), "status": status,
+                     "candidates": names})
+    for source_index in source_keys.index.difference(matches["source_index"]):
+        status = "ambiguous" if source_index in tied_sources else "unmatched"
+        rows.append({"side": "projections", "index": source_index, **describe(source_keys, source_index),
+                     "status": status, "candidates": ""})
+    report = pd.DataFrame(rows, columns=["side", "index", "name", "team", "position", "status", "candidates"])
+    return matches, report
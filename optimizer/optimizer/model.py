@@ -0,0 +1,82 @@
+import numpy as np
+
+from optimizer.player_pool import PlayerPool
+
+
+def compile_player_pool(player_pool, roster_requirements):
+    """
+    Compiles the player pool into the NumPy arrays the lineup model is built from.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections and salary data.
+        roster_requirements (dict): Position constraints for the lineup.
+
+    Returns:
+        dict: Player index, salary and projection vectors, the position eligibility
+            matrix (one row per roster requirement) and the sense of each row.
+    """
+    # One eligibility row per roster requirement; FLEX and WR are minimums, the rest exact
+    eligibility = np.empty((len(roster_requirements), len(player_pool)), dtype=bool)
+    if isinstance(player_pool, PlayerPool):
+        # Position bitmasks were decoded once when the pool was loaded
+        for row, pos in enumerate(roster_requirements):
+            eligibility[row] = player_pool.eligible(pos)
+        index = np.arange(len(player_pool))
+        salary = player_pool.salary.astype(float)
+        projections = player_pool.projections.astype(float)
+    else:
+        positions = player_pool["Position"].astype(str)
+        for row, pos in enumerate(roster_requirements):
+            eligibility[row] = positions.str.contains(pos, regex=False).to_numpy()
+        index = player_pool.index
+        salary = player_pool["Salary"].to_numpy(dtype=float)
+        projections = player_pool["ProjPts"].to_numpy(dtype=float)
+    senses = [">=" if pos in ("FLEX", "WR") else "==" for pos in roster_requirements]
+
+    return {
+        "index": index,
+        "salary": salary,
+        "projections": projections,
+        "eligibility": eligibility,
+        "senses": senses,
+        "requirements": list(roster_requirements.values()),
+        "roster_size": sum(roster_requirements.values()),
+    }
+
+
+def _compositions(total, parts):
+    """Yields every way to split `total` into `parts` non-negative integers."""
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total + 1):
+        for rest in _compositions(total - first, parts - 1):
+            yield (first,) + rest
+
+
+def compile_position_classes(compiled):
+    """
+    Groups players with identical position eligibility and enumerates feasible roster shapes.
+
+    Args:
+        compiled (dict): Output of `compile_player_pool`.
+
+    Returns:
+        dict: "player_class" (class id per player), "class_eligibility" (requirement rows x
+            classes) and "class_counts" (one row per feasible number of players per class).
+    """
+    class_eligibility, player_class = np.unique(compiled["eligibility"].T, axis=0, return_inverse=True)
+    class_eligibility = class_eligibility.T
+
+    # Keep every split of the roster across classes that satisfies all position rows
+    counts = np.array(list(_compositions(compiled["roster_size"], class_eligibility.shape[1])))
+    row_totals = counts @ class_eligibility.T.astype(int)
+    feasible = np.ones(len(counts), dtype=bool)
+    for row, (sense, req) in enumerate(zip(compiled["senses"], compiled["requirements"])):
+        feasible &= row_totals[:, row] >= req if sense == ">=" else row_totals[:, row] == req
+
+    return {
+        "player_class": player_class.ravel(),
+        "class_eligibility": class_eligibility,
+        "class_counts": counts[feasible],
+    }
@@ -0,0 +1,246 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from optimizer.builder import SolverSession, add_flex_flags, lineup_frame
+from optimizer.player_pool import PlayerPool
+from optimizer.pruning import prune_dominated_players, pruning_scale
+from optimizer.telemetry import Telemetry
+from optimizer.variance import base_projections, draw_projection_set, set_seed_sequences
+
+# Per-process solver session and base projections, set once by the pool initializer
+_worker_session = None
+_worker_base_projections = None
+_worker_columns = None
+_worker_cuts_held = 0
+
+
+def _init_worker(
+    player_pool, roster_requirements, min_salary, max_salary, min_uniques, backend, base, columns
+):
+    """Builds the compiled roster/salary model once in each worker process."""
+    global _worker_session, _worker_base_projections, _worker_columns, _worker_cuts_held
+    _worker_session = SolverSession(
+        player_pool, roster_requirements, min_salary, max_salary, min_uniques, backend=backend
+    )
+    _worker_base_projections = base
+    _worker_columns = columns
+    _worker_cuts_held = 0
+
+
+def _sync_cuts(session, cuts_held, cuts):
+    """
+    Brings a session's build-wide diversity cuts up to `cuts`.
+
+    The build's cuts only ever grow, so the session's first `cuts_held` cuts are already
+    a prefix of `cuts`; any cuts past them are the last set's own lineups and are dropped.
+
+    Returns:
+        int: The number of build-wide cuts the session now holds.
+    """
+    session.reset_cuts(keep=cuts_held)
+    for selected in cuts[cuts_held:]:
+        session.add_lineup_cut(selected)
+    return len(cuts)
+
+
+def _solve_set(session, projections, num_lineups):
+    """
+    Solves one projection set's lineups on top of the session's current cuts.
+
+    Returns:
+        tuple: (selections, error, solve_seconds, stats) where selections is a list of
+            positional player indices, one array per lineup found, and stats holds the
+            session's `last_solve` for every solve, failed ones included.
+    """
+    cuts_held = len(session.selections)
+    solve_start = time.perf_counter()
+    stats = []
+    try:
+        for _ in session.iter_selections(projections, num_lineups=num_lineups):
+            stats.append(session.last_solve)
+    except Exception as e:
+        return [], str(e), time.perf_counter() - solve_start, stats
+    if len(stats) < num_lineups:
+        stats.append(session.last_solve)
+
+    selections = session.selections[cuts_held:]
+    error = None if selections else "No feasible solution found."
+    return selections, error, time.perf_counter() - solve_start, stats
+
+
+def _solve_projection_set(task):
+    """
+    Draws one projection set from its own seed and solves it in the worker's session.
+
+    Args:
+        task (tuple): (set_index, seed_sequence, variance_range, num_lineups, cuts), where
+            cuts is an array of the build's earlier lineups to stay `min_uniques` away from.
+
+    Returns:
+        tuple: (set_index, selections, projections, error, solve_seconds, stats), as
+            described in `_solve_set`.
+    """
+    global _worker_cuts_held
+    set_index, seed_sequence, variance_range, num_lineups, cuts = task
+
+    # Each set draws from its own stream over the full pool, so results depend on
+    # neither the worker that runs it nor which players were pruned
+    projections = draw_projection_set(_worker_base_projections, seed_sequence, variance_range)[_worker_columns]
+
+    _worker_cuts_held = _sync_cuts(_worker_session, _worker_cuts_held, cuts)
+    selections, error, solve_seconds, stats = _solve_set(_worker_session, projections, num_lineups)
+    return set_index, selections, projections, error, solve_seconds, stats
+
+
+def _breaks_cuts(selections, cuts, min_uniques):
+    """Whether any lineup in `selections` shares more than `roster - min_uniques` players with one of `cuts`."""
+    if min_uniques <= 0 or not len(cuts):
+        return False
+    return any((np.isin(cuts, selected).sum(axis=1) > len(selected) - min_uniques).any() for selected in selections)
+
+
+def iter_projection_sets_parallel(
+    player_pool,
+    roster_requirements,
+    min_salary,
+    max_salary,
+    min_uniques,
+    num_sets,
+    variance_range,
+    num_lineups=1,
+    max_workers=None,
+    seed=None,
+    backend="cbc",
+    prune=None,
+    telemetry=None,
+):
+    """
+    Generates and solves projection sets across a process pool, yielding lineups as sets finish.
+
+    Every set gets an independent child of `np.random.SeedSequence(seed)`, so a given seed
+    draws the same projection sets as a serial run regardless of worker count or scheduling.
+    Diversity cuts apply across the whole build, as in a serial run: sets are solved in
+    waves of `max_workers`, each against the lineups of earlier waves, and a set that
+    breaks a cut from its own wave is re-solved in order in this process. Lineups come
+    out in set order. Infeasible sets are reported and skipped. Closing the generator
+    cancels the sets not yet started.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections and salary data.
+        roster_requirements (dict): Position constraints for the lineup.
+        min_salary (int): Minimum salary cap.
+        max_salary (int): Maximum salary cap.
+        min_uniques (int): Minimum unique players between any two lineups of the build.
+        num_sets (int): Number of projection sets to generate.
+        variance_range (float): Maximum percentage adjustment for variance (e.g., 0.1 for ±10%).
+        num_lineups (int): Number of lineups to optimize per projection set.
+        max_workers (int): Number of worker processes. Defaults to the CPU count.
+        seed (int): Seed for the projection draws. None draws fresh entropy.
+        backend (str): Solver backend name, see `optimizer.backends.SOLVER_BACKENDS`.
+        prune (bool): Drop players dominated across the whole variance range before solving.
+            None, the default, prunes when `min_uniques` is 0.
+        telemetry (Telemetry): Records pruning time and every solve's stats, if given. Each
+            worker's model build is charged to the first solve it runs; only the final solve
+            of a re-solved set is recorded.
+
+    Yields:
+        tuple: (lineup, info), as described in `optimizer.main_opto.iter_optimizer_workflow`.
+            "solve_seconds" is the time spent on the whole set, re-solve included.
+    """
+    max_workers = max_workers or os.cpu_count()
+    if telemetry is None:
+        telemetry = Telemetry(backend)
+    if not isinstance(player_pool, PlayerPool):
+        player_pool = add_flex_flags(player_pool)
+    base = base_projections(player_pool)
+    columns = np.arange(len(player_pool))
+    solve_pool = player_pool
+
+    # Prune against the extremes any draw can reach, so one prune covers every set. The
+    # bounds use the draws' float32 arithmetic, so no rounded draw can land outside them.
+    # Diversity cuts carry across sets as in a serial build, so the threshold scales the
+    # same way and by default only cut-free builds are pruned
+    scale = pruning_scale(min_uniques, num_lineups, num_sets=num_sets)
+    if prune is None:
+        prune = scale == 1
+    if prune:
+        spread = np.float32(variance_range)
+        bounds = np.stack([base * (1 - spread), base * (1 + spread)])
+        with telemetry.stage("pruning"):
+            solve_pool, kept = prune_dominated_players(
+                player_pool, roster_requirements, min_salary=min_salary, projections=bounds, num_lineups=scale,
+            )
+        columns = np.flatnonzero(kept)
+
+    # Without cuts every set is independent and they all go out at once. With cuts, sets
+    # go out in ordered waves, each solved against every lineup from the earlier waves
+    seed_sequences = set_seed_sequences(seed, num_sets)
+    wave_size = max_workers if min_uniques > 0 else num_sets
+    cuts = []
+    resolver = None
+    resolver_cuts_held = 0
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(
+            solve_pool, roster_requirements, min_salary, max_salary, min_uniques, backend,
+            base, columns,
+        ),
+    ) as executor:
+        try:
+            sets_done = 0
+            for wave_start in range(0, num_sets, wave_size):
+                wave_cuts = tuple(cuts)
+                tasks = [
+                    (i, seed_sequences[i], variance_range, num_lineups, wave_cuts)
+                    for i in range(wave_start, min(wave_start + wave_size, num_sets))
+                ]
+                chunksize = max(1, len(tasks) // (max_workers * 4))
+                results = executor.map(_solve_projection_set, tasks, chunksize=chunksize)
+                for set_index, selections, projections, error, solve_seconds, stats in results:
+                    sets_done += 1
+
+                    # A set didn't see the lineups of earlier sets in its own wave. If it broke
+                    # one of their cuts, re-solve it against every lineup so far, as a serial
+                    # build would; otherwise its lineups are already the serial ones
+                    if _breaks_cuts(selections, cuts[len(wave_cuts):], min_uniques):
+                        if resolver is None:
+                            resolver = SolverSession(
+                                solve_pool, roster_requirements, min_salary, max_salary, min_uniques,
+                                backend=backend,
+                            )
+                        resolver_cuts_held = _sync_cuts(resolver, resolver_cuts_held, cuts)
+                        selections, error, resolve_seconds, stats = _solve_set(resolver, projections, num_lineups)
+                        solve_seconds += resolve_seconds
+                    cuts.extend(selections)
+
+                    if error is not None:
+                        print(f"Unable to solve projection set {set_index + 1}: {error}")
+
+                    # Render lineups from the caller's pool, with the set's projections scattered back
+                    full_projections = np.zeros(len(player_pool))
+                    full_projections[columns] = projections
+                    for selected, solve in zip(selections, stats):
+                        render_start = time.perf_counter()
+                        pool_selected = columns[selected]
+                        lineup = lineup_frame(player_pool, pool_selected, full_projections)
+                        telemetry.record_solve(set_index, solve, time.perf_counter() - render_start)
+                        yield lineup, {
+                            "set": set_index,
+                            "sets_done": sets_done,
+                            "num_sets": num_sets,
+                            "selected": pool_selected,
+                            "projections": projections[selected],
+                            "points": float(projections[selected].sum()),
+                            "salary": int(lineup["Salary"].sum()),
+                            "solve_seconds": solve_seconds,
+                        }
+                    for solve in stats[len(selections):]:
+                        telemetry.record_solve(set_index, solve)
+        finally:
+            # Runs on exhaustion, errors and early close alike; pending sets are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+
+from optimizer.columnar import read_projections
+from optimizer.constants import POSITION_BITS
+
+
+def encode_positions(positions):
+    """
+    Encodes DK position strings such as "WR/FLEX" as position bitmasks.
+
+    Only the distinct strings are parsed, so a slate costs a handful of splits.
+
+    Args:
+        positions (pd.Series): Position strings, "/"-separated.
+
+    Returns:
+        np.ndarray: uint8 bitmask per player, see `POSITION_BITS`.
+    """
+    codes, labels = pd.factorize(positions.astype(str))
+    label_masks = np.array(
+        [sum(POSITION_BITS.get(token, 0) for token in set(label.split("/"))) for label in labels], dtype=np.uint8
+    )
+    return label_masks[codes] if len(labels) else np.zeros(len(positions), dtype=np.uint8)
+
+
+def decode_position(mask):
+    """Returns the DK position string for a bitmask, e.g. 20 -> "WR/FLEX"."""
+    return "/".join(pos for pos, bit in POSITION_BITS.items() if mask & bit)
+
+
+class PlayerPool:
+    """
+    A slate stored as contiguous per-player arrays instead of a DataFrame.
+
+    Players are identified by their position in the arrays (0..n-1). Names, team
+    abbreviations and game descriptions live in side tables, so the optimizer works
+    only on integer codes and never string-matches positions again after loading.
+
+    Attributes:
+        ids (np.ndarray): int32 DraftKings player ids.
+        salary (np.ndarray): int32 salaries.
+        projections (np.ndarray): float32 projected points.
+        ownership (np.ndarray): float32 projected ownership.
+        positions (np.ndarray): uint8 position bitmasks, see `POSITION_BITS`.
+        team_codes (np.ndarray): int16 codes into `teams`.
+        game_codes (np.ndarray): int16 codes into `games`.
+        names (np.ndarray): Player names.
+        teams (np.ndarray): Team abbreviation per team code.
+        games (np.ndarray): "Game Info" string per game code.
+    """
+
+    def __init__(self, ids, salary, projections, ownership, positions, team_codes, game_codes, names, teams, games):
+        self.ids = np.ascontiguousarray(ids, dtype=np.int32)
+        self.salary = np.ascontiguousarray(salary, dtype=np.int32)
+        self.projections = np.ascontiguousarray(projections, dtype=np.float32)
+        self.ownership = np.ascontiguousarray(ownership, dtype=np.float32)
+        self.positions = np.ascontiguousarray(positions, dtype=np.uint8)
+        self.team_codes = np.ascontiguousarray(team_codes, dtype=np.int16)
+        self.game_codes = np.ascontiguousarray(game_codes, dtype=np.int16)
+        self.names = np.asarray(names, dtype=object)
+        self.teams = np.asarray(teams, dtype=object)
+        self.games = np.asarray(games, dtype=object)
+        self._name_lookup = None
+        self._id_lookup = None
+
+    @classmethod
+    def from_dataframe(cls, player_pool):
+        """
+        Builds a PlayerPool from a merged projections DataFrame.
+
+        "Position", "Salary" and "ProjPts" are required. "Id", "Name", "ProjOwn",
+        "TeamAbbrev" and "Game Info" are used when present.
+
+        Args:
+            player_pool (pd.DataFrame): The player pool with projections and salary data.
+
+        Returns:
+            PlayerPool: The compiled pool, in DataFrame row order.
+        """
+        def column(name, default):
+            if name in player_pool.columns:
+                return player_pool[name]
+            return pd.Series(default, index=player_pool.index)
+
+        team_codes, teams = pd.factorize(column("TeamAbbrev", ""), use_na_sentinel=False)
+        game_codes, games = pd.factorize(column("Game Info", ""), use_na_sentinel=False)
+
+        return cls(
+            ids=column("Id", np.arange(len(player_pool))).to_numpy(),
+            salary=player_pool["Salary"].to_numpy(),
+            projections=player_pool["ProjPts"].fillna(0).to_numpy(),
+            ownership=column("ProjOwn", 0.0).fillna(0).to_numpy(),
+            positions=encode_positions(player_pool["Position"]),
+            team_codes=team_codes,
+            game_codes=game_codes,
+            names=column("Name", "").to_numpy(dtype=object),
+            teams=np.asarray(teams, dtype=object),
+            games=np.asarray(games, dtype=object),
+        )
+
+    @classmethod
+    def from_csv(cls, path):
+        """Loads a merged projections CSV (or its fresh `.npz` bundle) straight into a PlayerPool."""
+        return cls.from_dataframe(read_projections(path))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def take(self, indices):
+        """
+        Returns a PlayerPool holding a subset of the players.
+
+        Args:
+            indices (np.ndarray): Positional indices or a boolean mask.
+
+        Returns:
+            PlayerPool: The subset, sharing the team and game tables.
+        """
+        return PlayerPool(
+            self.ids[indices], self.salary[indices], self.projections[indices], self.ownership[indices],
+            self.positions[indices], self.team_codes[indices], self.game_codes[indices], self.names[indices],
+            self.teams, self.games,
+        )
+
+    def eligible(self, position):
+        """Boolean mask of players whose position includes `position` (e.g. "FLEX")."""
+        return (self.positions & POSITION_BITS[position]) != 0
+
+    def index_of(self, name):
+        """Positional index of the first player named `name`."""
+        if self._name_lookup is None:
+            self._name_lookup = {}
+            for index, player_name in enumerate(self.names):
+                self._name_lookup.setdefault(player_name, index)
+        return self._name_lookup[name]
+
+    def index_of_id(self, player_id):
+        """Positional index of the player with DraftKings id `player_id`."""
+        if self._id_lookup is None:
+            self._id_lookup = {int(player_id): index for index, player_id in enumerate(self.ids)}
+        return self._id_lookup[int(player_id)]
+
+    def to_frame(self, indices=None, projections=None):
+        """
+        Renders players as a DataFrame with the merged CSV's column names.
+
+        Args:
+            indices (np.ndarray): Positional indices or a boolean mask. Defaults to every player.
+            projections (np.ndarray): Optional "ProjPts" override aligned to `indices`.
+
+        Returns:
+            pd.DataFrame: One row per player, indexed by positional index.
+        """
+        indices = np.arange(len(self))[indices if indices is not None else slice(None)]
+        positions = self.positions[indices]
+        return pd.DataFrame(
+            {
+                "Name": self.names[indices],
+                "Id": self.ids[indices],
+                "Position": [decode_position(mask) for mask in positions],
+                "Salary": self.salary[indices],
+                "Game Info": self.games[self.game_codes[indices]],
+                "TeamAbbrev": self.teams[self.team_codes[indices]],
+                "ProjPts": self.projections[indices].astype(float) if projections is None else projections,
+                "ProjOwn": self.ownership[indices].astype(float),
+                "IsFLEX": (positions & POSITION_BITS["FLEX"]) != 0,
+                "IsWR": (positions & POSITION_BITS["WR"]) != 0,
+            },
+            index=pd.Index(indices),
+        )
+
+    @property
+    def nbytes(self):
+        """Bytes held by the numeric per-player arrays."""
+        return sum(
+            array.nbytes
+            for array in (
+                self.ids, self.salary, self.projections, self.ownership,
+                self.positions, self.team_codes, self.game_codes,
+            )
+        )
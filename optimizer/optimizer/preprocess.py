@@ -0,0 +1,51 @@
+import pandas as pd
+
+from optimizer.constants import POSITION_FLAGS
+
+# Format of the "Game Info" kickoff, e.g. "PIT@CIN 12/01/2024 01:00PM ET"
+GAME_TIME_FORMAT = "%m/%d/%Y %I:%M%p"
+
+
+def parse_game_times(game_info):
+    """
+    Parses kickoff times out of "Game Info" strings.
+
+    Only the distinct games are parsed, so a slate costs one parse per game.
+
+    Args:
+        game_info (pd.Series): "Game Info" strings.
+
+    Returns:
+        pd.Series: datetime64 kickoff per row, NaT where the string doesn't parse.
+    """
+    codes, games = pd.factorize(game_info.astype(str))
+    parts = pd.Series(games, dtype=str).str.split(" ")
+    game_times = pd.to_datetime(parts.str[1] + " " + parts.str[2], format=GAME_TIME_FORMAT, errors="coerce")
+    game_times = game_times.to_numpy(dtype="datetime64[us]")
+    return pd.Series(game_times[codes] if len(games) else game_times[:0], index=game_info.index, name="GameTime")
+
+
+def position_flags(positions):
+    """
+    Evaluates the `POSITION_FLAGS` patterns against a "Position" column.
+
+    Each pattern is matched once per distinct position string and broadcast back to
+    the rows, so the result equals `positions.str.contains(pattern)` at a fraction of
+    the cost.
+
+    Args:
+        positions (pd.Series): Position strings, "/"-separated.
+
+    Returns:
+        dict: Flag column name -> boolean Series aligned to `positions`.
+    """
+    # Missing positions keep the row-wise result, whose fill value depends on the dtype
+    if positions.isna().any():
+        return {flag: positions.str.contains(pattern).rename(flag) for flag, pattern in POSITION_FLAGS.items()}
+
+    codes, labels = pd.factorize(positions)
+    labels = pd.Series(labels, dtype=positions.dtype)
+    return {
+        flag: labels.str.contains(pattern).iloc[codes].set_axis(positions.index).rename(flag)
+        for flag, pattern in POSITION_FLAGS.items()
+    }
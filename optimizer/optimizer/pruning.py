@@ -0,0 +1,134 @@
+import numpy as np
+
+from optimizer.model import compile_player_pool, compile_position_classes
+from optimizer.player_pool import PlayerPool
+
+# Players compared at once when counting dominators, bounds the pairwise matrix size
+DOMINANCE_BLOCK_SIZE = 2048
+
+
+def count_dominators(salary, low, high, equal_salary_only=False):
+    """
+    Counts, for every player, how many other players dominate them.
+
+    Player i dominates player j when it costs no more (or exactly the same, with
+    `equal_salary_only`) and its worst-case projection is at least j's best case.
+    Exact ties are broken by position so two identical players never dominate each other.
+
+    Args:
+        salary (np.ndarray): Player salaries.
+        low (np.ndarray): Lowest projection of each player across all projection sets.
+        high (np.ndarray): Highest projection of each player across all projection sets.
+        equal_salary_only (bool): Only count dominators with the same salary.
+
+    Returns:
+        np.ndarray: Number of dominators per player.
+    """
+    num_players = len(salary)
+    order = np.arange(num_players)
+    counts = np.zeros(num_players, dtype=np.int64)
+
+    for start in range(0, num_players, DOMINANCE_BLOCK_SIZE):
+        block = slice(start, start + DOMINANCE_BLOCK_SIZE)
+        # Rows are candidate dominators, columns the players in this block
+        if equal_salary_only:
+            cheaper_or_equal = salary[:, None] == salary[None, block]
+            strictly_cheaper = np.zeros_like(cheaper_or_equal)
+        else:
+            cheaper_or_equal = salary[:, None] <= salary[None, block]
+            strictly_cheaper = salary[:, None] < salary[None, block]
+        at_least_as_good = low[:, None] >= high[None, block]
+        strictly_better = low[:, None] > high[None, block]
+        tie_break = order[:, None] < order[None, block]
+
+        dominates = cheaper_or_equal & at_least_as_good & (strictly_cheaper | strictly_better | tie_break)
+        counts[block] = dominates.sum(axis=0)
+
+    return counts
+
+
+def find_dominated_players(player_pool, roster_requirements, min_salary=0, projections=None, num_lineups=1):
+    """
+    Flags players that can never appear in an optimal lineup.
+
+    A player is dominated when at least k other players of the same position class
+    dominate them in every projection set, where k is the most players of that class a
+    lineup can hold. The threshold is scaled by `num_lineups`, so the prune stays exact
+    under diversity cuts: a dominator unused by every earlier lineup always remains to
+    swap in. With a salary floor, only equal-salary dominators count, since swapping in
+    a cheaper player could drop the lineup under `min_salary`.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections and salary data.
+        roster_requirements (dict): Position constraints for the lineup.
+        min_salary (int): Minimum salary cap.
+        projections (np.ndarray): Optional `(num_sets, num_players)` projection matrix, or a
+            `(2, num_players)` array of per-player lower and upper bounds. Defaults to "ProjPts".
+        num_lineups (int): Number of lineups that will be solved against the pruned pool.
+
+    Returns:
+        np.ndarray: Boolean mask of dominated players, in pool order.
+    """
+    compiled = compile_player_pool(player_pool, roster_requirements)
+    classes = compile_position_classes(compiled)
+    max_per_class = classes["class_counts"].max(axis=0)
+
+    if projections is None:
+        projections = compiled["projections"][None, :]
+    low = np.asarray(projections).min(axis=0)
+    high = np.asarray(projections).max(axis=0)
+
+    dominated = np.zeros(len(player_pool), dtype=bool)
+    for class_id, max_count in enumerate(max_per_class):
+        members = np.flatnonzero(classes["player_class"] == class_id)
+        counts = count_dominators(
+            compiled["salary"][members], low[members], high[members], equal_salary_only=min_salary > 0
+        )
+        dominated[members] = counts >= max_count * num_lineups
+
+    return dominated
+
+
+def pruning_scale(min_uniques, lineups_per_set, num_sets=1):
+    """
+    Number of lineups whose diversity cuts can bind a solve, the `num_lineups` to prune with.
+
+    A cut only forbids anything when `min_uniques` is positive, so without one every
+    lineup is a plain optimum and a single lineup's worth of dominators is enough. Cuts
+    are only kept within a projection set when sets are solved independently; pass the
+    number of sets whose cuts accumulate when they are not.
+
+    Args:
+        min_uniques (int): Minimum unique players between lineups.
+        lineups_per_set (int): Lineups solved per projection set.
+        num_sets (int): Projection sets whose cuts stay in force together.
+
+    Returns:
+        int: The scale for `find_dominated_players`.
+    """
+    if min_uniques <= 0:
+        return 1
+    return lineups_per_set * num_sets
+
+
+def prune_dominated_players(player_pool, roster_requirements, min_salary=0, projections=None, num_lineups=1):
+    """
+    Removes dominated players from the pool and reports how many were dropped.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections and salary data.
+        roster_requirements (dict): Position constraints for the lineup.
+        min_salary (int): Minimum salary cap.
+        projections (np.ndarray): Optional projection matrix or bounds, see `find_dominated_players`.
+        num_lineups (int): Number of lineups that will be solved against the pruned pool.
+
+    Returns:
+        tuple: (pruned player pool, boolean mask of the players kept).
+    """
+    dominated = find_dominated_players(
+        player_pool, roster_requirements, min_salary=min_salary, projections=projections, num_lineups=num_lineups
+    )
+    print(f"Pruned {dominated.sum()} dominated players ({(~dominated).sum()} remain)")
+    if isinstance(player_pool, PlayerPool):
+        return player_pool.take(~dominated), ~dominated
+    return player_pool[~dominated].copy(), ~dominated
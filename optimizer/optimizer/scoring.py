@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+
+# Simulations scored per chunk; a chunk holds `chunk_size * num_lineups` float32 scores
+SCORE_CHUNK_SIZE = 1000
+
+# Lineup scores are tallied into per-lineup histograms of this resolution, from 0 to the
+# max, to read percentiles off without keeping every score. Higher scores land in the top bin
+SCORE_BIN_WIDTH = 1.0
+SCORE_HISTOGRAM_MAX = 400.0
+
+# Percentiles reported for every lineup
+SCORE_PERCENTILES = (25, 50, 75, 90, 99)
+
+# Share of the lineup set a lineup must finish in, in one sim, to count as a top finish
+TOP_PERCENT = 0.01
+
+# A lineup booms at or above this multiple of its projected total and busts at or below this one
+BOOM_RATIO = 1.25
+BUST_RATIO = 0.75
+
+
+def lineup_incidence(lineups):
+    """
+    Builds the player-by-lineup incidence matrix of a build, over rostered players only.
+
+    Args:
+        lineups (LineupSet): The build.
+
+    Returns:
+        tuple: (players, incidence) where players holds the pool indices rostered in at
+            least one lineup and incidence is a `(len(players), num_lineups)` float32 matrix
+            with a 1 where the player is in the lineup.
+    """
+    players, inverse = np.unique(lineups.matrix, return_inverse=True)
+    incidence = np.zeros((len(players), len(lineups)), dtype=np.float32)
+    incidence[inverse.reshape(lineups.matrix.shape), np.arange(len(lineups))[:, None]] = 1
+    return players, incidence
+
+
+def score_chunk(simulations, players, incidence):
+    """`(num_sims, num_lineups)` float32 scores of a chunk of simulations, from `lineup_incidence`'s output."""
+    return np.asarray(simulations, dtype=np.float32)[:, players] @ incidence
+
+
+def iter_simulation_chunks(simulations, chunk_size):
+    """Splits a simulation matrix, or an iterable of simulation batches, into row chunks."""
+    batches = [simulations] if isinstance(simulations, np.ndarray) else simulations
+    for batch in batches:
+        for start in range(0, len(batch), chunk_size):
+            yield batch[start:start + chunk_size]
+
+
+def iter_lineup_scores(lineups, simulations, chunk_size=SCORE_CHUNK_SIZE):
+    """
+    Scores every lineup in every simulation, one chunk of simulations at a time.
+
+    Args:
+        lineups (LineupSet): The build.
+        simulations (np.ndarray or iterable): `(num_sims, num_players)` simulated points in
+            pool order, or batches of them such as `SlateSimulator.iter_batches`.
+        chunk_size (int): Simulations scored per chunk.
+
+    Yields:
+        np.ndarray: `(chunk, num_lineups)` float32 lineup scores.
+    """
+    players, incidence = lineup_incidence(lineups)
+    for chunk in iter_simulation_chunks(simulations, chunk_size):
+        yield score_chunk(chunk, players, incidence)
+
+
+def histogram_percentiles(counts, percentiles, bin_width):
+    """
+    Percentiles of every row of a histogram, interpolated linearly within bins.
+
+    Args:
+        counts (np.ndarray): `(num_rows, num_bins)` counts, bin `b` covering
+            `[b * bin_width, (b + 1) * bin_width)`.
+        percentiles (sequence): Percentiles to read, from 0 to 100.
+        bin_width (float): Width of each bin.
+
+    Returns:
+        np.ndarray: `(num_rows, len(percentiles))` values.
+    """
+    cumulative = counts.cumsum(axis=1)
+    totals = cumulative[:, -1:]
+    rows = np.arange(len(counts))
+    values = np.empty((len(counts), len(percentiles)))
+    for column, percentile in enumerate(percentiles):
+        target = totals[:, 0] * percentile / 100
+        bins = np.minimum((cumulative < target[:, None]).sum(axis=1), counts.shape[1] - 1)
+        below = cumulative[rows, bins] - counts[rows, bins]
+        fraction = (target - below) / np.maximum(counts[rows, bins], 1)
+        values[:, column] = (bins + fraction) * bin_width
+    return values
+
+
+def score_lineups(
+    lineups,
+    simulations,
+    percentiles=SCORE_PERCENTILES,
+    top_percent=TOP_PERCENT,
+    boom_score=None,
+    bust_score=None,
+    chunk_size=SCORE_CHUNK_SIZE,
+    bin_width=SCORE_BIN_WIDTH,
+    max_score=SCORE_HISTOGRAM_MAX,
+):
+    """
+    Scores a build against simulated outcomes and summarizes each lineup's distribution.
+
+    Scores are computed as chunked products of the simulation matrix with the lineup
+    incidence matrix, and only running totals and per-lineup histograms are kept, so
+    memory depends on the chunk size and build size, not the number of simulations.
+
+    Args:
+        lineups (LineupSet): The build.
+        simulations (np.ndarray or iterable): `(num_sims, num_players)` simulated points in
+            pool order, or batches of them such as `SlateSimulator.iter_batches`.
+        percentiles (sequence): Percentiles to report, from 0 to 100.
+        top_percent (float): Share of the build a lineup must finish in to count as a top
+            finish in a sim (e.g., 0.01 for the top 1%).
+        boom_score (float or np.ndarray): Score at or above which a lineup booms, per lineup
+            or for all. Defaults to `BOOM_RATIO` times the lineup's projected total.
+        bust_score (float or np.ndarray): Score at or below which a lineup busts. Defaults
+            to `BUST_RATIO` times the lineup's projected total.
+        chunk_size (int): Simulations scored per chunk.
+        bin_width (float): Histogram resolution of the percentiles, in points.
+        max_score (float): Upper edge of the percentile histograms.
+
+    Returns:
+        pd.DataFrame: One row per lineup with "Lineup", "Projected", "Mean", "Std", a "P<q>"
+            column per percentile, and "Top <x>%", "Boom" and "Bust" rates.
+
+    Raises:
+        ValueError: If there are no lineups or no simulations.
+    """
+    num_lineups = len(lineups)
+    if num_lineups == 0:
+        raise ValueError("No lineups to score.")
+    projected = lineups.pool.projections[lineups.matrix].sum(axis=1, dtype=np.float64)
+    boom_score = BOOM_RATIO * projected if boom_score is None else np.broadcast_to(boom_score, num_lineups)
+    bust_score = BUST_RATIO * projected if bust_score is None else np.broadcast_to(bust_score, num_lineups)
+    num_bins = int(np.ceil(max_score / bin_width))
+    rank = max(1, int(round(num_lineups * top_percent)))
+
+    # Running totals per lineup, updated chunk by chunk
+    num_sims = 0
+    totals = np.zeros(num_lineups)
+    squares = np.zeros(num_lineups)
+    top_finishes = np.zeros(num_lineups, dtype=np.int64)
+    booms = np.zeros(num_lineups, dtype=np.int64)
+    busts = np.zeros(num_lineups, dtype=np.int64)
+    counts = np.zeros(num_lineups * num_bins, dtype=np.int64)
+    offsets = np.arange(num_lineups, dtype=np.int64) * num_bins
+
+    for scores in iter_lineup_scores(lineups, simulations, chunk_size):
+        num_sims += len(scores)
+        totals += scores.sum(axis=0, dtype=np.float64)
+        squares += (scores * scores).sum(axis=0, dtype=np.float64)
+        booms += (scores >= boom_score).sum(axis=0)
+        busts += (scores <= bust_score).sum(axis=0)
+
+        # A top finish beats or ties the `rank`-th best lineup of its sim
+        cutoffs = np.partition(scores, num_lineups - rank, axis=1)[:, num_lineups - rank]
+        top_finishes += (scores >= cutoffs[:, None]).sum(axis=0)
+
+        # Scores are binned in place; the chunk isn't needed after this
+        np.multiply(scores, 1 / bin_width, out=scores)
+        np.clip(scores, 0, num_bins - 1, out=scores)
+        bins = scores.astype(np.int64)
+        bins += offsets
+        counts += np.bincount(bins.ravel(), minlength=len(counts))
+
+    if num_sims == 0:
+        raise ValueError("No simulations to score lineups against.")
+
+    means = totals / num_sims
+    summary = pd.DataFrame(
+        {
+            "Lineup": [f"Lineup {i + 1}" for i in range(num_lineups)],
+            "Projected": projected.round(4),
+            "Mean": means,
+            "Std": np.sqrt(np.maximum(squares / num_sims - means ** 2, 0)),
+        }
+    )
+    values = histogram_percentiles(counts.reshape(num_lineups, num_bins), percentiles, bin_width)
+    for column, percentile in enumerate(percentiles):
+        summary[f"P{percentile:g}"] = values[:, column]
+    summary[f"Top {top_percent * 100:g}%"] = top_finishes / num_sims
+    summary["Boom"] = booms / num_sims
+    summary["Bust"] = busts / num_sims
+    return summary
@@ -0,0 +1,288 @@
+import glob
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from optimizer.export import primary_positions
+from optimizer.player_pool import PlayerPool
+from optimizer.variance import set_seed_sequences
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RESEARCH_DIR = os.path.join(BASE_DIR, "research")
+
+# Positions the research tables cover, in the order players are classified by bitmask
+SIM_POSITIONS = ["QB", "RB", "WR", "TE", "DST"]
+
+# Loadings of each position's normal score on its team's offense, its game's scoring
+# environment and the opposing offense. They set the outcome correlations, e.g. a QB
+# and a WR on one team correlate at about 0.8 * 0.45 + 0.2 * 0.2 = 0.4
+TEAM_LOADINGS = {"QB": 0.8, "RB": 0.3, "WR": 0.45, "TE": 0.4, "DST": 0.0}
+GAME_LOADINGS = {"QB": 0.2, "RB": 0.1, "WR": 0.2, "TE": 0.15, "DST": -0.15}
+OPPONENT_LOADINGS = {"QB": 0.0, "RB": 0.0, "WR": 0.0, "TE": 0.0, "DST": -0.5}
+
+# Shift in the log of each percentile ratio for a projection one standard deviation above
+# its position's average, scaled by that percentile's correlation with projections
+PROJECTION_TILT = 0.15
+
+# Simulations drawn per batch; a batch holds `batch_size * num_players` float32 outcomes
+SIM_BATCH_SIZE = 5000
+
+
+def load_ratio_tables(research_dir=RESEARCH_DIR):
+    """
+    Reads the research percentile-to-projection ratio and correlation tables.
+
+    Args:
+        research_dir (str): Directory holding the research CSVs.
+
+    Returns:
+        tuple: (ratios, correlations) DataFrames indexed by position with one column per
+            percentile, as a fraction (0.25, 0.5, ...). Missing correlations are 0.
+
+    Raises:
+        FileNotFoundError: If the directory holds no percentile ratio tables.
+    """
+    ratios = {}
+    correlations = {}
+    for path in sorted(glob.glob(os.path.join(research_dir, "*.csv"))):
+        name = os.path.basename(path)
+        match = re.search(r"(\d+)th_Percentile", name)
+        if match is None:
+            continue
+        table = pd.read_csv(path)
+        table = table.set_index(table.columns[0])[table.columns[1]]
+        target = correlations if name.startswith("Correlation") else ratios
+        target[int(match.group(1)) / 100] = table
+
+    if not ratios:
+        raise FileNotFoundError(f"No percentile ratio tables found in {research_dir}")
+    ratios = pd.DataFrame(ratios).sort_index(axis=1)
+    correlations = pd.DataFrame(correlations).reindex(index=ratios.index, columns=ratios.columns).fillna(0.0)
+    return ratios, correlations
+
+
+def fit_quantile_knots(projections, position_codes, ratios, correlations):
+    """
+    Fits every player's outcome distribution as a piecewise-linear quantile function.
+
+    The knots are the research percentiles plus 0 and 1. A player's ratios are their
+    position's averages, tilted by how far their projection sits from the position's
+    average on this slate, in the direction the correlation tables give (higher
+    projections raise the floor and flatten the ceiling). The 0th percentile is a zero
+    score, the 100th extends the last segment, and each player's ratios are rescaled so
+    the mean outcome equals the projection.
+
+    Args:
+        projections (np.ndarray): Projected points per player.
+        position_codes (np.ndarray): Index into `SIM_POSITIONS` per player, -1 for none.
+        ratios (pd.DataFrame): Ratio table from `load_ratio_tables`.
+        correlations (pd.DataFrame): Correlation table from `load_ratio_tables`.
+
+    Returns:
+        tuple: (knots, knot_ratios) where knots is the `(num_knots,)` percentile grid and
+            knot_ratios the `(num_players, num_knots)` outcome/projection ratio at each.
+    """
+    percentiles = ratios.columns.to_numpy(dtype=float)
+    knots = np.concatenate([[0.0], percentiles, [1.0]])
+    inner = np.ones((len(projections), len(percentiles)))
+
+    for code, position in enumerate(SIM_POSITIONS):
+        players = np.flatnonzero(position_codes == code)
+        if position not in ratios.index or not len(players):
+            continue
+
+        # Projection z-score among the position's projected players
+        active = players[projections[players] > 0]
+        z = np.zeros(len(players))
+        if len(active) > 1 and projections[active].std() > 0:
+            z = (projections[players] - projections[active].mean()) / projections[active].std()
+        tilt = np.clip(z, -2, 2)[:, None] * correlations.loc[position].to_numpy() * PROJECTION_TILT
+        inner[players] = ratios.loc[position].to_numpy() * np.exp(tilt)
+
+    # Quantiles can't decrease, and the last segment's slope carries on to the 100th percentile
+    inner = np.maximum.accumulate(inner, axis=1)
+    slope = (inner[:, -1] - inner[:, -2]) / (percentiles[-1] - percentiles[-2])
+    knot_ratios = np.column_stack([np.zeros(len(inner)), inner, inner[:, -1] + slope * (1 - percentiles[-1])])
+
+    # Players the tables don't cover score their projection exactly
+    uncovered = ~np.isin(position_codes, [code for code, position in enumerate(SIM_POSITIONS)
+                                          if position in ratios.index])
+    knot_ratios[uncovered] = 1.0
+
+    # Mean of a piecewise-linear quantile function is the area under it
+    means = ((knot_ratios[:, 1:] + knot_ratios[:, :-1]) / 2 * np.diff(knots)).sum(axis=1)
+    return knots, knot_ratios / means[:, None]
+
+
+def normal_cdf(z):
+    """Standard normal CDF, vectorized (Abramowitz & Stegun 7.1.26, error below 1.5e-7)."""
+    x = np.abs(z) * np.float32(1 / np.sqrt(2))
+    t = 1 / (1 + np.float32(0.3275911) * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    half_tail = (0.5 * poly * np.exp(-x * x)).astype(z.dtype, copy=False)
+    return np.where(z >= 0, 1 - half_tail, half_tail)
+
+
+def opponent_teams(pool):
+    """Opponent abbreviation of every player, from the "AWAY@HOME ..." game string ("" if unknown)."""
+    opponents = np.empty(len(pool.games), dtype=object)
+    for game_code, game in enumerate(pool.games):
+        opponents[game_code] = str(game).split(" ")[0].split("@") if "@" in str(game) else ["", ""]
+    teams = pool.teams[pool.team_codes]
+    matchups = opponents[pool.game_codes]
+    return np.array(
+        [away_home[1] if team == away_home[0] else away_home[0] if team == away_home[1] else ""
+         for team, away_home in zip(teams, matchups)],
+        dtype=object,
+    )
+
+
+class SlateSimulator:
+    """
+    Samples correlated full-slate fantasy outcomes.
+
+    Each player's points are their projection times a ratio drawn from a quantile
+    function fitted to the research percentile tables. The draws are tied together by
+    a Gaussian copula: a player's normal score loads on their team's offense, their
+    game's scoring environment and, for defenses, the opposing offense (see
+    `TEAM_LOADINGS`, `GAME_LOADINGS` and `OPPONENT_LOADINGS`). Quarterbacks and their
+    pass catchers rise together, and defenses fall when the offense they face scores.
+
+    Simulations are drawn in batches of `batch_size`, batch `b` from the `b`-th child of
+    `np.random.SeedSequence(seed)`, so memory stays bounded by one batch and a seed
+    reproduces the same outcomes.
+    """
+
+    def __init__(self, player_pool, projections=None, research_dir=RESEARCH_DIR, batch_size=SIM_BATCH_SIZE):
+        """
+        Args:
+            player_pool (pd.DataFrame or PlayerPool): The slate.
+            projections (np.ndarray): Projections to simulate around. Defaults to the pool's.
+            research_dir (str): Directory holding the research CSVs.
+            batch_size (int): Simulations drawn per batch.
+        """
+        self.player_pool = player_pool
+        self.pool = player_pool if isinstance(player_pool, PlayerPool) else PlayerPool.from_dataframe(player_pool)
+        if projections is None:
+            projections = self.pool.projections
+        self.projections = np.maximum(np.asarray(projections, dtype=np.float32), 0)
+        self.batch_size = batch_size
+
+        # Outcome distributions, as ratios at shared percentile knots
+        self.position_codes = primary_positions(self.pool, SIM_POSITIONS)
+        ratios, correlations = load_ratio_tables(research_dir)
+        knots, knot_ratios = fit_quantile_knots(self.projections, self.position_codes, ratios, correlations)
+        self.knots = knots.astype(np.float32)
+        self.knot_ratios = knot_ratios.astype(np.float32)
+        self._lower = np.ascontiguousarray(self.knot_ratios[:, :-1])
+        self._slopes = np.ascontiguousarray(np.diff(knot_ratios, axis=1) / np.diff(knots)).astype(np.float32)
+
+        # Factor each player loads on: own team, opponent (one shared list) and game
+        teams = self.pool.teams[self.pool.team_codes]
+        team_codes, self.factor_teams = pd.factorize(np.concatenate([teams, opponent_teams(self.pool)]))
+        self.team_index = team_codes[: len(teams)]
+        self.opponent_index = team_codes[len(teams):]
+        self.game_index = self.pool.game_codes.astype(np.int64)
+
+        def loadings(table):
+            values = np.array([table[position] for position in SIM_POSITIONS] + [0.0], dtype=np.float32)
+            return values[self.position_codes]
+
+        self.team_loading = loadings(TEAM_LOADINGS)
+        self.game_loading = loadings(GAME_LOADINGS)
+        self.opponent_loading = loadings(OPPONENT_LOADINGS)
+        self.opponent_loading[np.asarray(self.factor_teams == "")[self.opponent_index]] = 0
+        self.residual_loading = np.sqrt(
+            1 - self.team_loading ** 2 - self.game_loading ** 2 - self.opponent_loading ** 2
+        ).astype(np.float32)
+
+    def __len__(self):
+        return len(self.projections)
+
+    def _sample_batch(self, rng, size):
+        """One `(size, num_players)` float32 batch of simulated points."""
+        num_players = len(self)
+
+        # Correlated normal scores from the shared factors plus each player's own noise
+        team_factors = rng.standard_normal((size, len(self.factor_teams)), dtype=np.float32)
+        game_factors = rng.standard_normal((size, len(self.pool.games)), dtype=np.float32)
+        scores = rng.standard_normal((size, num_players), dtype=np.float32)
+        scores *= self.residual_loading
+        scores += team_factors[:, self.team_index] * self.team_loading
+        scores += team_factors[:, self.opponent_index] * self.opponent_loading
+        scores += game_factors[:, self.game_index] * self.game_loading
+
+        # Percentile of each score, then the player's ratio at that percentile
+        u = normal_cdf(scores)
+        segment = np.zeros(u.shape, dtype=np.int64)
+        for knot in self.knots[1:-1]:
+            segment += u >= knot
+        flat = segment + np.arange(num_players) * (len(self.knots) - 1)
+        ratio = self._lower.ravel()[flat] + (u - self.knots[segment]) * self._slopes.ravel()[flat]
+        return ratio * self.projections
+
+    def iter_batches(self, num_sims, seed=None):
+        """
+        Draws simulations one batch at a time.
+
+        Args:
+            num_sims (int): Total simulations.
+            seed (int or np.random.SeedSequence): Root seed. None draws fresh entropy.
+
+        Yields:
+            np.ndarray: `(batch, num_players)` float32 simulated points, in pool order.
+        """
+        num_batches = -(-num_sims // self.batch_size)
+        for batch, seed_sequence in enumerate(set_seed_sequences(seed, num_batches)):
+            size = min(self.batch_size, num_sims - batch * self.batch_size)
+            yield self._sample_batch(np.random.default_rng(seed_sequence), size)
+
+    def simulate(self, num_sims, seed=None):
+        """
+        Draws every simulation into one matrix.
+
+        Args:
+            num_sims (int): Total simulations.
+            seed (int or np.random.SeedSequence): Root seed. None draws fresh entropy.
+
+        Returns:
+            np.ndarray: `(num_sims, num_players)` float32 simulated points.
+        """
+        outcomes = np.empty((num_sims, len(self)), dtype=np.float32)
+        start = 0
+        for batch in self.iter_batches(num_sims, seed):
+            outcomes[start:start + len(batch)] = batch
+            start += len(batch)
+        return outcomes
+
+    def summary(self, num_sims=10000, seed=None):
+        """
+        Simulated distribution of every player.
+
+        Args:
+            num_sims (int): Simulations to summarize.
+            seed (int or np.random.SeedSequence): Root seed. None draws fresh entropy.
+
+        Returns:
+            pd.DataFrame: "Name", "Position", "TeamAbbrev", "ProjPts", the simulated "Mean",
+                "Std" and the 25th, 50th, 85th and 99th percentiles.
+        """
+        outcomes = self.simulate(num_sims, seed)
+        percentiles = np.percentile(outcomes, [25, 50, 85, 99], axis=0)
+        positions = np.array(SIM_POSITIONS + [""], dtype=object)[self.position_codes]
+        return pd.DataFrame(
+            {
+                "Name": self.pool.names,
+                "Position": positions,
+                "TeamAbbrev": self.pool.teams[self.pool.team_codes],
+                "ProjPts": self.projections,
+                "Mean": outcomes.mean(axis=0),
+                "Std": outcomes.std(axis=0),
+                "P25": percentiles[0],
+                "P50": percentiles[1],
+                "P85": percentiles[2],
+                "P99": percentiles[3],
+            }
+        )
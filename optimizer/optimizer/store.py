@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from optimizer.lineups import LineupSet
+from optimizer.player_pool import PlayerPool
+
+# Saved builds live next to the projections they were built from
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_STORE_DIR = os.path.join(BASE_DIR, "data", "builds")
+
+# Listing row of every saved build read so far, by (directory, file name), with the (mtime_ns, size) it was read at.
+# Module-level, so the app's reruns only open bundles that were added or rewritten since
+_LISTING_ROWS = {}
+
+
+def build_key(pool_hash, settings):
+    """
+    Content hash identifying a build by its inputs.
+
+    Args:
+        pool_hash (str): Content hash of the projections file.
+        settings (dict): Every setting that changes the build, including the seed.
+
+    Returns:
+        str: Hex digest, used as the file name of the saved build.
+    """
+    payload = json.dumps({"pool_hash": pool_hash, "settings": settings}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _pool_ids(player_pool):
+    """DraftKings ids of a pool in positional order, or positions if the pool has no ids."""
+    if isinstance(player_pool, PlayerPool):
+        return player_pool.ids
+    if "Id" in player_pool.columns:
+        return player_pool["Id"].to_numpy(dtype=np.int64)
+    return np.arange(len(player_pool))
+
+
+class ResultStore:
+    """
+    Saves builds as `.npz` bundles named by the content hash of their inputs.
+
+    A bundle holds the lineup matrix (int32), the projections each lineup was solved
+    against (float32), the DraftKings ids the matrix indexes, and the settings, seed and
+    pool hash as JSON. Rerunning an identical seeded build is a lookup, and any past
+    build loads back into a LineupSet in milliseconds.
+    """
+
+    def __init__(self, directory=DEFAULT_STORE_DIR):
+        """
+        Args:
+            directory (str): Folder holding the saved builds. Created on first save.
+        """
+        self.directory = directory
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def __contains__(self, key):
+        return os.path.exists(self.path(key))
+
+    def save(self, key, lineup_set, pool_hash, settings):
+        """
+        Writes a build to disk.
+
+        Args:
+            key (str): Build key, see `build_key`.
+            lineup_set (LineupSet): The finished build.
+            pool_hash (str): Content hash of the projections file.
+            settings (dict): Settings the build was made with.
+
+        Returns:
+            str: Path of the saved bundle.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        metadata = {"pool_hash": pool_hash, "settings": settings, "created": time.time()}
+        projections = lineup_set.player_projections()
+
+        # Write under a temporary name, then rename, so readers never see a partial file
+        temp_path = self.path(key) + ".tmp"
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                matrix=lineup_set.matrix,
+                projections=projections.astype(np.float32),
+                player_ids=_pool_ids(lineup_set.player_pool),
+                metadata=np.array(json.dumps(metadata, default=str)),
+            )
+        os.replace(temp_path, self.path(key))
+        return self.path(key)
+
+    def metadata(self, key):
+        """Returns the pool hash, settings and creation time saved with a build."""
+        with np.load(self.path(key)) as bundle:
+            return json.loads(str(bundle["metadata"]))
+
+    def load(self, key, player_pool):
+        """
+        Loads a saved build against a player pool.
+
+        Lineups are matched to the pool by DraftKings id, so the pool may be reordered
+        or re-pruned since the build was saved.
+
+        Args:
+            key (str): Build key, see `build_key`.
+            player_pool (pd.DataFrame or PlayerPool): The pool to render lineups from.
+
+        Returns:
+            LineupSet: The saved build.
+        """
+        with np.load(self.path(key)) as bundle:
+            matrix = bundle["matrix"]
+            projections = bundle["projections"]
+            saved_ids = bundle["player_ids"]
+
+        # Map each saved player to its position in the given pool
+        ids = _pool_ids(player_pool)
+        order = np.argsort(ids, kind="stable")
+        wanted = saved_ids[matrix]
+        positions = np.searchsorted(ids[order], wanted).clip(max=len(ids) - 1)
+        if len(ids) == 0 or not np.array_equal(ids[order][positions], wanted):
+            raise KeyError(f"Build {key} references players that are not in the player pool.")
+
+        return LineupSet(player_pool, order[positions], projections)
+
+    def list_builds(self):
+        """
+        Returns:
+            pd.DataFrame: One row per saved build, newest first, with its key, creation
+                time, lineup count, pool hash and settings. Only bundles that are new or
+                changed since the last listing are opened.
+        """
+        rows = []
+        seen = set()
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".npz"):
+                    continue
+                stat = entry.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                listing_key = (self.directory, entry.name)
+                seen.add(listing_key)
+                cached = _LISTING_ROWS.get(listing_key)
+                if cached is None or cached[0] != stamp:
+                    cached = (stamp, self._listing_row(entry.name[: -len(".npz")]))
+                    _LISTING_ROWS[listing_key] = cached
+                rows.append(cached[1])
+
+        # Forget builds deleted from this directory
+        for listing_key in [listing_key for listing_key in _LISTING_ROWS if listing_key[0] == self.directory]:
+            if listing_key not in seen:
+                del _LISTING_ROWS[listing_key]
+
+        builds = pd.DataFrame(rows, columns=["key", "created", "lineups", "pool_hash"] if not rows else None)
+        return builds.sort_values("created", ascending=False, ignore_index=True)
+
+    def _listing_row(self, key):
+        """Reads the `list_builds` row of one saved build."""
+        with np.load(self.path(key)) as bundle:
+            metadata = json.loads(str(bundle["metadata"]))
+            num_lineups = bundle["matrix"].shape[0]
+        return {
+            "key": key,
+            "created": pd.Timestamp(metadata["created"], unit="s"),
+            "lineups": num_lineups,
+            "pool_hash": metadata["pool_hash"],
+            **metadata["settings"],
+        }
+
+    def delete(self, key):
+        """Removes a saved build."""
+        os.remove(self.path(key))
@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Per-solve telemetry columns, in display order
+SOLVE_COLUMNS = [
+    "set", "lineup", "status", "objective", "mip_gap", "build_seconds", "solve_seconds", "extract_seconds",
+]
+
+
+def solve_stats(status, objective=None, mip_gap=None, solve_seconds=0.0, extract_seconds=0.0):
+    """
+    Telemetry of one backend solve, kept on the backend as `stats`.
+
+    Args:
+        status (str): Solver status, "Optimal" when a lineup was found.
+        objective (float): Objective value of the lineup found.
+        mip_gap (float): Relative MIP gap the solver stopped at, 0 when proven optimal.
+        solve_seconds (float): Time spent in the solver.
+        extract_seconds (float): Time spent reading the solution back.
+
+    Returns:
+        dict: The stats.
+    """
+    return {
+        "status": status,
+        "objective": objective,
+        "mip_gap": mip_gap,
+        "solve_seconds": solve_seconds,
+        "extract_seconds": extract_seconds,
+    }
+
+
+class Telemetry:
+    """
+    Records where a build spends its time.
+
+    Run stages such as the projection draws and pruning are timed with `stage`. Every
+    solve adds a row with its model build, solve and extraction times and the solver's
+    status, objective and MIP gap. The build thread records while other threads read,
+    so a running build can be inspected.
+    """
+
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend (str): Solver backend name, reported in the summary.
+        """
+        self.backend = backend
+        self.stages = {}
+        self.rows = []
+        self.lineups_found = 0
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """Times the enclosed block, adding it to the run stage `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - start)
+
+    def add_stage(self, name, seconds):
+        """Adds `seconds` to the run stage `name`."""
+        with self.lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def record_solve(self, set_index, stats, extract_seconds=0.0):
+        """
+        Records one solve.
+
+        Args:
+            set_index (int): Projection set solved, 0-based.
+            stats (dict): The session's `last_solve`: backend stats plus "build_seconds".
+            extract_seconds (float): Time the caller spent rendering the lineup, added to
+                the backend's own extraction time.
+        """
+        with self.lock:
+            lineup = None
+            if stats["status"] == "Optimal":
+                self.lineups_found += 1
+                lineup = self.lineups_found
+            row = {column: stats.get(column) for column in SOLVE_COLUMNS}
+            row.update(set=set_index + 1, lineup=lineup, extract_seconds=stats["extract_seconds"] + extract_seconds)
+            self.rows.append(row)
+
+    def finish(self):
+        """Stops the run clock."""
+        self.finished_at = time.perf_counter()
+
+    @property
+    def wall_seconds(self):
+        """Seconds since the run started (frozen once it finishes)."""
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def solves_frame(self):
+        """
+        Returns:
+            pd.DataFrame: One row per solve, see `SOLVE_COLUMNS`.
+        """
+        with self.lock:
+            return pd.DataFrame(list(self.rows), columns=SOLVE_COLUMNS)
+
+    def summary(self):
+        """
+        Per-run totals. Stage times are summed over solves, and over workers in a
+        parallel build, so they can add up to more than the wall time.
+
+        Returns:
+            dict: Backend, wall time, lineups found, failed solves, seconds per stage and
+                per-solve solve time and MIP gap extremes.
+        """
+        solves = self.solves_frame()
+        with self.lock:
+            stages = dict(self.stages)
+        for stage in ["build", "solve", "extract"]:
+            stages[stage] = float(solves[f"{stage}_seconds"].sum())
+        found = solves["status"] == "Optimal"
+        return {
+            "backend": self.backend,
+            "wall_seconds": self.wall_seconds,
+            "lineups": int(found.sum()),
+            "failed_solves": int((~found).sum()),
+            "stage_seconds": stages,
+            "mean_solve_seconds": float(solves["solve_seconds"].mean()) if len(solves) else None,
+            "max_solve_seconds": float(solves["solve_seconds"].max()) if len(solves) else None,
+            "max_mip_gap": float(solves["mip_gap"].max()) if found.any() else None,
+        }
+
+    def stages_frame(self):
+        """
+        Returns:
+            pd.DataFrame: "Stage", "Seconds" and "Share" of the wall time for each stage.
+        """
+        summary = self.summary()
+        stages = pd.DataFrame(list(summary["stage_seconds"].items()), columns=["Stage", "Seconds"])
+        stages["Share"] = stages["Seconds"] / summary["wall_seconds"] if summary["wall_seconds"] else 0.0
+        return stages
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: "summary" and "solves", JSON-serializable.
+        """
+        solves = self.solves_frame().astype(object)
+        return {"summary": self.summary(), "solves": solves.where(solves.notna(), None).to_dict("records")}
+
+    def to_json(self, path=None):
+        """
+        Serializes the telemetry as JSON.
+
+        Args:
+            path (str): Optional file to write it to.
+
+        Returns:
+            str: The JSON text.
+        """
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
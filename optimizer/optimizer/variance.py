@@ -1,27 +1,118 @@
 import numpy as np
 import pandas as pd
 
-def generate_projection_sets(player_pool, num_sets=10, variance_range=0.1):
+from optimizer.player_pool import PlayerPool
+
+
+class ProjectionSets:
     """
-    Generates multiple sets of adjusted projections with variance applied.
+    A `(num_sets, num_players)` float32 projection matrix aligned to a shared player pool.
+
+    Indexing or iterating yields a player pool DataFrame per set with "ProjPts" replaced.
+    Those DataFrames are only built on demand, for callers that still expect a list.
+    """
+
+    def __init__(self, player_pool, matrix):
+        """
+        Args:
+            player_pool (pd.DataFrame or PlayerPool): The player pool the matrix columns are aligned to.
+            matrix (np.ndarray): Adjusted projections, one row per set.
+        """
+        self.player_pool = player_pool
+        self.matrix = matrix
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def __getitem__(self, set_index):
+        if isinstance(self.player_pool, PlayerPool):
+            return self.player_pool.to_frame(projections=self.matrix[set_index].astype(float))
+        projection_set = self.player_pool.copy()
+        projection_set["ProjPts"] = self.matrix[set_index].astype(float)
+        return projection_set
+
+    def __iter__(self):
+        for set_index in range(len(self)):
+            yield self[set_index]
+
+
+def base_projections(player_pool):
+    """The pool's projections as the float32 vector every projection set is drawn around."""
+    if isinstance(player_pool, PlayerPool):
+        return player_pool.projections
+    return player_pool["ProjPts"].to_numpy(dtype=np.float32)
+
+
+def set_seed_sequences(seed, num_sets):
+    """
+    One independent seed sequence per projection set.
+
+    Set `i` always gets the `i`-th child of `np.random.SeedSequence(seed)`, so a set's
+    draws depend only on the seed and its index, never on which process draws it or
+    how many sets are drawn alongside it.
 
     Args:
-        player_pool (pd.DataFrame): The player pool with projections.
+        seed (int or np.random.SeedSequence): Root seed. None draws fresh entropy.
+        num_sets (int): Number of projection sets.
+
+    Returns:
+        list of np.random.SeedSequence: The per-set sequences.
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return root.spawn(num_sets)
+
+
+def draw_projection_set(base, seed_sequence, variance_range):
+    """
+    Draws one projection set from its own stream.
+
+    Args:
+        base (np.ndarray): float32 base projections, see `base_projections`.
+        seed_sequence (np.random.SeedSequence): The set's sequence, see `set_seed_sequences`.
+        variance_range (float): Maximum percentage adjustment for variance (e.g., 0.1 for ±10%).
+
+    Returns:
+        np.ndarray: float32 adjusted projections, one per player.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    return base * (1 + rng.uniform(-variance_range, variance_range, len(base)).astype(np.float32))
+
+
+def generate_projection_matrix(player_pool, num_sets=10, variance_range=0.1, seed=None):
+    """
+    Draws every projection set, each from its own substream of `seed`.
+
+    Row `i` is identical to what `draw_projection_set` gives for set `i` anywhere else,
+    which is what lets parallel workers reproduce a serial build bit for bit.
+
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections.
         num_sets (int): Number of projection sets to generate.
         variance_range (float): Maximum percentage adjustment for variance (e.g., 0.1 for ±10%).
+        seed (int or np.random.SeedSequence): Root seed. None draws fresh entropy.
 
     Returns:
-        list of pd.DataFrame: List of player pools with adjusted projections.
+        np.ndarray: `(num_sets, num_players)` float32 matrix of adjusted projections.
     """
-    projection_sets = []
+    base = base_projections(player_pool)
+    matrix = np.empty((num_sets, len(base)), dtype=np.float32)
+    for set_index, seed_sequence in enumerate(set_seed_sequences(seed, num_sets)):
+        matrix[set_index] = draw_projection_set(base, seed_sequence, variance_range)
+    return matrix
+
 
-    for _ in range(num_sets):
-        adjusted_player_pool = player_pool.copy()
-        # Apply random variance to projections
-        adjusted_player_pool["ProjPts"] = adjusted_player_pool["ProjPts"] * (
-            1 + np.random.uniform(-variance_range, variance_range, len(player_pool))
-        )
-        projection_sets.append(adjusted_player_pool)
+def generate_projection_sets(player_pool, num_sets=10, variance_range=0.1, seed=None):
+    """
+    Generates multiple sets of adjusted projections with variance applied.
 
-    return projection_sets
+    Args:
+        player_pool (pd.DataFrame or PlayerPool): The player pool with projections.
+        num_sets (int): Number of projection sets to generate.
+        variance_range (float): Maximum percentage adjustment for variance (e.g., 0.1 for ±10%).
+        seed (int or np.random.SeedSequence): Root seed. None draws fresh entropy.
 
+    Returns:
+        ProjectionSets: The projection matrix, viewable as a list of player pools.
+    """
+    matrix = generate_projection_matrix(player_pool, num_sets=num_sets, variance_range=variance_range, seed=seed)
+    return ProjectionSets(player_pool, matrix)
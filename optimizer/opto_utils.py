@@ -3,6 +3,8 @@ from datetime import datetime
 import pandas as pd
 from datetime import datetime
 
+from optimizer.preprocess import parse_game_times, position_flags
+
 ROSTER_REQUIREMENTS = {
     "QB": 1,
     "RB": 2,
@@ -25,22 +27,14 @@ def preprocess_player_pool(player_pool):
     Returns:
         pd.DataFrame: Preprocessed player pool.
     """
-    # Extract and parse game start time from the "Game Info" column
-    def extract_game_time(game_info):
-        try:
-            return datetime.strptime(game_info.split(" ")[1] + " " + game_info.split(" ")[2], "%m/%d/%Y %I:%M%p")
-        except:
-            return None
-
-    player_pool["GameTime"] = player_pool["Game Info"].apply(extract_game_time)
-
-    # Add position eligibility flags
-    player_pool["IsFLEX"] = player_pool[ "Position"].str.contains("RB|WR|TE")
-    player_pool["IsWR"] = player_pool[ "Position"].str.contains("WR")
-    player_pool["IsRB"] = player_pool[ "Position"].str.contains("RB")
-    player_pool["IsTE"] = player_pool[ "Position"].str.contains("TE")
-    player_pool["IsQB"] = player_pool[ "Position"].str.contains("QB")
-    player_pool["IsDST"] = player_pool[ "Position"].str.contains("DST")
+    # Parse kickoff times once per game, unless the columnar projections bundle
+    # already carries them
+    if "GameTime" not in player_pool.columns:
+        player_pool["GameTime"] = parse_game_times(player_pool["Game Info"])
+
+    # Add position eligibility flags, matching each distinct position string once
+    for flag, values in position_flags(player_pool["Position"]).items():
+        player_pool[flag] = values
 
     return player_pool
 
@@ -159,11 +153,15 @@ def calculate_player_exposures(lineups):
     Calculates player exposures from a set of lineups.
 
     Args:
-        lineups (list of pd.DataFrame): List of DataFrames, each representing a lineup.
+        lineups (list of pd.DataFrame): List of DataFrames, each representing a lineup, or a LineupSet.
 
     Returns:
         pd.DataFrame: A DataFrame listing players and their exposures, sorted by appearances.
     """
+    # A LineupSet counts appearances straight from its lineup matrix
+    if hasattr(lineups, "exposures"):
+        return lineups.exposures()
+
     # Flatten the player names from all lineups into a single list
     all_players = []
     for lineup in lineups:
@@ -191,33 +189,3 @@ def display_player_exposures(lineups):
     print("\n=== Player Exposures ===")
     print(exposures_df)
     return exposures_df
-
-
-
-import numpy as np
-
-def generate_projection_sets(player_pool, num_sets=10, variance_range=0.1):
-    """
-    Generates multiple sets of adjusted projections with variance applied.
-
-    Args:
-        player_pool (pd.DataFrame): The player pool with projections.
-        num_sets (int): Number of projection sets to generate.
-        variance_range (float): Maximum percentage adjustment for variance (e.g., 0.1 for ±10%).
-
-    Returns:
-        list of pd.DataFrame: List of player pools with adjusted projections.
-    """
-    projection_sets = []
-
-    for _ in range(num_sets):
-        adjusted_player_pool = player_pool.copy()
-        # Apply random variance to projections
-        adjusted_player_pool["ProjPts"] = adjusted_player_pool["ProjPts"] * (
-            1 + np.random.uniform(-variance_range, variance_range, len(player_pool))
-        )
-        projection_sets.append(adjusted_player_pool)
-
-    return projection_sets
-
-
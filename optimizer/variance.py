@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 
-def apply_variance(player_pool, variance_by_position, team_variance):
+def apply_variance(player_pool, variance_by_position, team_variance, rng=None):
     """
     Applies variance to player projections.
 
@@ -9,21 +9,24 @@ def apply_variance(player_pool, variance_by_position, team_variance):
         player_pool (pd.DataFrame): Player pool with projections.
         variance_by_position (dict): Variance levels by position (e.g., {"QB": 0.05, "RB": 0.1}).
         team_variance (float): Variance applied to team projections.
+        rng (np.random.Generator): Generator to draw from. Defaults to a freshly seeded one.
 
     Returns:
         pd.DataFrame: Player pool with adjusted projections.
     """
+    rng = rng if rng is not None else np.random.default_rng()
+
     # Apply variance by position
     for position, variance_level in variance_by_position.items():
         position_mask = player_pool["Position_y"] == position
-        player_pool.loc[position_mask, "ProjPts"] += np.random.normal(
+        player_pool.loc[position_mask, "ProjPts"] += rng.normal(
             0, variance_level * player_pool.loc[position_mask, "ProjPts"]
         )
 
     # Apply team-level variance
     for team in player_pool["Team"].unique():
         team_mask = player_pool["Team"] == team
-        team_projection_adjustment = np.random.normal(0, team_variance)
+        team_projection_adjustment = rng.normal(0, team_variance)
         player_pool.loc[team_mask, "ProjPts"] += team_projection_adjustment
 
     return player_pool
@@ -0,0 +1,84 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.backends import SOLVER_BACKENDS
+from optimizer.builder import SolverSession
+from optimizer.constants import ROSTER_REQUIREMENTS
+
+# Set user parameters
+NUM_LINEUPS = 20  # Lineups solved per backend (each adds a diversity cut)
+MIN_SALARY = 49500
+MAX_SALARY = 50000
+MIN_UNIQUES = 2
+
+
+def time_backend(player_pool, backend, projection_matrix):
+    """
+    Times one backend on the shipped slate.
+
+    Returns:
+        tuple: (setup ms, ms per independent lineup, ms per sequential lineup,
+            objective values of both runs).
+    """
+    setup_start = time.perf_counter()
+    session = SolverSession(
+        player_pool.copy(), ROSTER_REQUIREMENTS, MIN_SALARY, MAX_SALARY, MIN_UNIQUES, backend=backend
+    )
+    setup_ms = (time.perf_counter() - setup_start) * 1000
+
+    # Independent projection sets: swap the objective, no diversity cuts carried over
+    independent_points = []
+    solve_start = time.perf_counter()
+    for projections in projection_matrix:
+        session.reset_cuts()
+        lineup = session.solve(projections)[0]
+        independent_points.append(round(lineup["ProjPts"].sum(), 4))
+    independent_ms = (time.perf_counter() - solve_start) / len(projection_matrix) * 1000
+
+    # Sequential build: one objective, each lineup adds a diversity cut
+    session.reset_cuts()
+    solve_start = time.perf_counter()
+    lineups = session.solve(player_pool["ProjPts"], num_lineups=NUM_LINEUPS)
+    sequential_ms = (time.perf_counter() - solve_start) / max(len(lineups), 1) * 1000
+    sequential_points = [round(lineup["ProjPts"].sum(), 4) for lineup in lineups]
+
+    return setup_ms, independent_ms, sequential_ms, independent_points + sequential_points
+
+
+def main():
+    print("Loading merged projections...")
+    player_pool = pd.read_csv(MERGED_PROJECTIONS_FILE)
+
+    # Fixed projection sets so every backend solves the same objectives
+    rng = np.random.default_rng(0)
+    adjustments = rng.uniform(-0.1, 0.1, (NUM_LINEUPS, len(player_pool)))
+    projection_matrix = player_pool["ProjPts"].to_numpy() * (1 + adjustments)
+
+    results = {}
+    for backend in SOLVER_BACKENDS:
+        try:
+            results[backend] = time_backend(player_pool, backend, projection_matrix)
+        except ImportError as e:
+            print(f"Skipping {backend}: {e}")
+
+    print(f"\n=== {len(player_pool)} players, {NUM_LINEUPS} lineups ===")
+    print(f"{'backend':>8}  {'setup ms':>9}  {'independent ms/lineup':>22}  {'sequential ms/lineup':>21}  matches cbc")
+    reference = results["cbc"][3]
+    for backend, (setup_ms, independent_ms, sequential_ms, points) in results.items():
+        print(
+            f"{backend:>8}  {setup_ms:9.2f}  {independent_ms:22.2f}  {sequential_ms:21.2f}  {points == reference}"
+        )
+
+
+if __name__ == "__main__":
+    main()
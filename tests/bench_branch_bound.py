@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.builder import SolverSession, optimize_lineup
+from optimizer.constants import ROSTER_REQUIREMENTS
+
+# Set user parameters
+NUM_SETS = 20  # Random projection sets solved independently
+NUM_LINEUPS = 10  # Lineups built with diversity cuts per min_uniques setting
+SALARY_WINDOWS = [(0, 50000), (49500, 50000)]
+MIN_UNIQUES = [1, 3]
+
+
+def lineup_points(lineups):
+    """Rounded objective value of each lineup."""
+    return [round(lineup["ProjPts"].sum(), 4) for lineup in lineups]
+
+
+def validate(player_pool, min_salary, max_salary, projection_matrix):
+    """
+    Compares the "bnb" engine against the PuLP/CBC path.
+
+    Returns:
+        bool: True when every objective matches.
+    """
+    matches = True
+
+    # Independent projection sets, one lineup each
+    sessions = {
+        backend: SolverSession(player_pool.copy(), ROSTER_REQUIREMENTS, min_salary, max_salary, 1, backend=backend)
+        for backend in ("cbc", "bnb")
+    }
+    for projections in projection_matrix:
+        points = [lineup_points(session.solve(projections)) for session in sessions.values()]
+        matches &= points[0] == points[1]
+
+    # Sequential builds with diversity cuts, through `optimize_lineup`
+    for min_uniques in MIN_UNIQUES:
+        points = [
+            lineup_points(
+                optimize_lineup(
+                    player_pool.copy(), ROSTER_REQUIREMENTS, min_salary, max_salary, NUM_LINEUPS, min_uniques,
+                    backend=backend,
+                )
+            )
+            for backend in ("cbc", "bnb")
+        ]
+        matches &= points[0] == points[1]
+
+    return matches
+
+
+def time_single_lineup(player_pool, backend, min_salary, max_salary, projection_matrix):
+    """Returns the mean latency of one independent lineup in milliseconds."""
+    session = SolverSession(player_pool.copy(), ROSTER_REQUIREMENTS, min_salary, max_salary, 1, backend=backend)
+    start = time.perf_counter()
+    for projections in projection_matrix:
+        session.solve(projections)
+    return (time.perf_counter() - start) / len(projection_matrix) * 1000
+
+
+def main():
+    print("Loading merged projections...")
+    player_pool = pd.read_csv(MERGED_PROJECTIONS_FILE)
+
+    # Fixed projection sets so both engines solve the same objectives
+    rng = np.random.default_rng(0)
+    adjustments = rng.uniform(-0.1, 0.1, (NUM_SETS, len(player_pool)))
+    projection_matrix = player_pool["ProjPts"].to_numpy() * (1 + adjustments)
+
+    for min_salary, max_salary in SALARY_WINDOWS:
+        matches = validate(player_pool, min_salary, max_salary, projection_matrix)
+        cbc_ms = time_single_lineup(player_pool, "cbc", min_salary, max_salary, projection_matrix)
+        bnb_ms = time_single_lineup(player_pool, "bnb", min_salary, max_salary, projection_matrix)
+
+        print(f"\n=== {len(player_pool)} players, salary {min_salary}-{max_salary} ===")
+        print(f"Matches CBC:  {matches}")
+        print(f"CBC:          {cbc_ms:8.2f} ms/lineup")
+        print(f"Branch-bound: {bnb_ms:8.2f} ms/lineup ({cbc_ms / bnb_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.columnar import read_columnar, columnar_path, write_columnar
+from optimizer.opto_utils import preprocess_player_pool
+
+# Set user parameters
+NUM_SLATES = 40  # Copies of the slate stacked into one multi-slate file
+REPEATS = 5
+
+
+def best_ms(load):
+    """Best of REPEATS wall times for `load()`, in milliseconds."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        load()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def main():
+    print("Loading merged projections...")
+    slate = pd.read_csv(MERGED_PROJECTIONS_FILE)
+
+    # Stack copies of the slate with distinct ids to stand in for a large multi-slate file
+    slates = [slate.assign(Id=slate["Id"] + i * 10_000_000) for i in range(NUM_SLATES)]
+    multi_slate = pd.concat(slates, ignore_index=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "merged_projections.csv")
+        multi_slate.to_csv(csv_path, index=False)
+        write_columnar(multi_slate, csv_path)
+        csv_bytes = os.path.getsize(csv_path)
+        npz_bytes = os.path.getsize(columnar_path(csv_path))
+
+        csv_ms = best_ms(lambda: preprocess_player_pool(pd.read_csv(csv_path)))
+        npz_ms = best_ms(lambda: preprocess_player_pool(read_columnar(columnar_path(csv_path))))
+
+        # Both loads must agree on every value the optimizer reads
+        from_csv = preprocess_player_pool(pd.read_csv(csv_path))
+        from_npz = preprocess_player_pool(read_columnar(columnar_path(csv_path)))
+        for column in from_csv.columns:
+            assert from_csv[column].astype(object).tolist() == from_npz[column].astype(object).tolist(), column
+
+    print(f"{len(multi_slate)} players across {NUM_SLATES} slates")
+    print(f"CSV + preprocess: {csv_ms:8.1f} ms ({csv_bytes / 1024:.0f} KB)")
+    print(f"NPZ + preprocess: {npz_ms:8.1f} ms ({npz_bytes / 1024:.0f} KB)")
+    print(f"Speedup: {csv_ms / npz_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
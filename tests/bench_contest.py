@@ -0,0 +1,94 @@
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, TEST_DIR)
+
+from synthetic_slate import generate_slate
+from optimizer.contest import SCORE_GRID, generate_field, load_payouts, simulate_contest
+from optimizer.lineups import LineupSet
+from optimizer.opto_utils import preprocess_player_pool
+from optimizer.simulation import SlateSimulator
+
+# Set user parameters
+SEED = 2024
+NUM_PLAYERS = 500
+NUM_LINEUPS = 150
+FIELD_SIZE = 100000
+NUM_SIMS = 2000
+ENTRY_FEE = 20
+MIN_SALARY = 45000
+CHECK_FIELD_SIZE = 3000
+CHECK_SIMS = 200
+
+
+def brute_force_payouts(lineups, field, outcomes, payouts):
+    """Every entry scored and ranked per sim with a full sort, ties splitting their places."""
+    points = np.round(outcomes.astype(np.float32) * SCORE_GRID) / SCORE_GRID
+    entries = np.vstack([lineups.matrix, field.matrix])
+    paid = np.zeros(len(entries))
+    paid[: min(len(payouts), len(entries))] = payouts[: len(entries)]
+    result = np.zeros((len(points), len(lineups)))
+    for sim, row in enumerate(points.astype(np.float64)):
+        scores = row[entries].sum(axis=1)
+        ranked = np.sort(scores)[::-1]
+        for lineup in range(len(lineups)):
+            above = np.count_nonzero(ranked > scores[lineup])
+            tied = np.count_nonzero(ranked == scores[lineup])
+            result[sim, lineup] = paid[above:above + tied].mean()
+    return result
+
+
+def main():
+    player_pool = preprocess_player_pool(generate_slate(NUM_PLAYERS, seed=SEED))
+    simulator = SlateSimulator(player_pool)
+    payouts = load_payouts()
+    print(f"Payout table: {len(payouts)} paid places, ${payouts.sum():,.0f} in prizes")
+
+    # The field is drawn by ownership; our entries are a separate draw of the same kind
+    start = time.perf_counter()
+    field = generate_field(player_pool, FIELD_SIZE, seed=SEED, min_salary=MIN_SALARY)
+    print(f"Drew a {FIELD_SIZE}-lineup field in {time.perf_counter() - start:.2f}s")
+    lineups = generate_field(player_pool, NUM_LINEUPS, seed=SEED + 1, min_salary=MIN_SALARY)
+    salaries = field.salary_totals()
+    assert (salaries >= MIN_SALARY).all() and (salaries <= 50000).all()
+    assert (np.diff(np.sort(field.matrix, axis=1), axis=1) != 0).all()
+
+    # Against a brute-force ranking, with some of our lineups duplicated in the field
+    small_field = LineupSet(player_pool, np.vstack([field.matrix[:CHECK_FIELD_SIZE], lineups.matrix[:10]]))
+    outcomes = simulator.simulate(CHECK_SIMS, seed=SEED)
+    results, _ = simulate_contest(lineups, small_field, outcomes, payouts, ENTRY_FEE, chunk_size=64, field_chunk_size=1000)
+    exact = brute_force_payouts(lineups, small_field, outcomes, payouts)
+    assert np.allclose(results["Mean Payout"], exact.mean(axis=0))
+    assert np.allclose(results["Cash Rate"], (exact > 0).mean(axis=0))
+    print("Chunked payouts match a brute-force ranking, duplicate lineups splitting their places")
+
+    # Full-size run, simulations streamed in
+    tracemalloc.start()
+    start = time.perf_counter()
+    results, portfolio = simulate_contest(
+        lineups, field, simulator.iter_batches(NUM_SIMS, seed=SEED), payouts, ENTRY_FEE
+    )
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{NUM_LINEUPS} lineups vs a {FIELD_SIZE}-entry field x {NUM_SIMS} sims: {seconds:.2f}s, "
+        f"peak memory {peak / 2 ** 20:.0f} MiB"
+    )
+    print(results.sort_values("ROI", ascending=False).head())
+    print({key: round(value, 4) for key, value in portfolio.items()})
+
+    # Our lineups come from the same process as the field, so they win about their share
+    share = NUM_LINEUPS / (NUM_LINEUPS + FIELD_SIZE)
+    expected = payouts.sum() * share * NUM_SIMS
+    print(f"Winnings {portfolio['mean_payout'] * NUM_SIMS:,.0f} against a fair share of {expected:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from opto_utils import format_lineup_for_display
+from optimizer.columnar import read_projections
+from optimizer.export import assign_slots, write_dk_upload
+from optimizer.lineups import LineupSet
+from optimizer.opto_utils import preprocess_player_pool
+
+# Set user parameters
+NUM_LINEUPS = 10000
+LEGACY_LINEUPS = 500  # The per-lineup formatter is timed on a sample and scaled up
+SHAPES = [(1, 2, 4, 1, 1), (1, 3, 3, 1, 1), (1, 2, 3, 2, 1)]  # QB, RB, WR, TE, DST counts
+
+
+def random_lineups(player_pool, num_lineups, rng):
+    """Random lineups of legal shape, each with one extra RB, WR or TE for the FLEX."""
+    by_position = [
+        np.flatnonzero(player_pool[flag].to_numpy()) for flag in ["IsQB", "IsRB", "IsWR", "IsTE", "IsDST"]
+    ]
+    shapes = rng.integers(len(SHAPES), size=num_lineups)
+    matrix = np.empty((num_lineups, 9), dtype=np.int32)
+    for shape_index, shape in enumerate(SHAPES):
+        rows = np.flatnonzero(shapes == shape_index)
+        picks = [
+            np.argsort(rng.random((len(rows), len(players))), axis=1)[:, :count]
+            for players, count in zip(by_position, shape)
+        ]
+        matrix[rows] = np.hstack([players[pick] for players, pick in zip(by_position, picks)])
+    return LineupSet(player_pool, rng.permuted(matrix, axis=1))
+
+
+def main():
+    player_pool = preprocess_player_pool(read_projections(MERGED_PROJECTIONS_FILE))
+    lineups = random_lineups(player_pool, NUM_LINEUPS, np.random.default_rng(0))
+
+    # Legacy: format each lineup DataFrame on its own
+    start = time.perf_counter()
+    legacy = [format_lineup_for_display(lineups[i]) for i in range(LEGACY_LINEUPS)]
+    legacy_seconds = (time.perf_counter() - start) * NUM_LINEUPS / LEGACY_LINEUPS
+
+    # Bulk: assign slots for the whole build, then stream the upload file
+    start = time.perf_counter()
+    slots = assign_slots(lineups)
+    slot_seconds = time.perf_counter() - start
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    write_dk_upload(lineups, buffer)
+    write_seconds = time.perf_counter() - start
+
+    # Every slot holds its position, and FLEX kicks off no earlier than any player it could swap with
+    positions = player_pool["Position"].str.split("/").str[0].to_numpy()[slots]
+    assert (positions[:, :7] == np.array(["QB", "RB", "RB", "WR", "WR", "WR", "TE"])).all()
+    assert (positions[:, 8] == "DST").all()
+    kickoffs = player_pool["GameTime"].to_numpy()[slots]
+    same_position = positions[:, :7] == positions[:, [7]]
+    assert (kickoffs[:, 7] >= np.where(same_position, kickoffs[:, :7], kickoffs.min()).max(axis=1)).all()
+
+    # The legacy formatter ignores which position has the spare player, so some of its lineups are illegal
+    legacy_illegal = np.mean(
+        [list(frame["Position"].str.split("/").str[0].iloc[1:7]) != ["RB", "RB", "WR", "WR", "WR", "TE"]
+         for frame in legacy]
+    )
+    header, *rows = buffer.getvalue().splitlines()
+    assert header == "QB,RB,RB,WR,WR,WR,TE,FLEX,DST" and len(rows) == NUM_LINEUPS
+
+    print(f"Legacy formatter: {legacy_seconds:.2f}s for {NUM_LINEUPS} lineups (timed on {LEGACY_LINEUPS})")
+    print(f"Slot assignment:  {slot_seconds * 1000:.1f}ms")
+    print(f"Upload CSV:       {write_seconds * 1000:.1f}ms ({len(buffer.getvalue()) / 1e6:.2f} MB)")
+    print(f"Legacy lineups with a misplaced FLEX: {legacy_illegal:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.backends import SOLVER_BACKENDS
+from optimizer.columnar import read_projections
+from optimizer.late_swap import late_swap, locked_players
+from optimizer.main_opto import run_optimizer_workflow
+from optimizer.opto_utils import preprocess_player_pool
+from optimizer.telemetry import Telemetry
+
+# Set user parameters
+NUM_LINEUPS = 150
+LOCK_TIME = pd.Timestamp("2024-12-01 16:00")  # The 1pm games have kicked off
+SEED = 2024
+VARIANCE_RANGE = 0.2
+MIN_SALARY = 49000
+MAX_SALARY = 50000
+MIN_UNIQUES = 2
+
+
+def check_swap(lineups, swapped, summary, locked):
+    """Asserts the swapped build honours the locks, the salary window and `min_uniques`."""
+    before = np.zeros((len(lineups), len(locked)), dtype=bool)
+    after = np.zeros_like(before)
+    np.put_along_axis(before, lineups.matrix.astype(np.int64), True, axis=1)
+    np.put_along_axis(after, swapped.matrix.astype(np.int64), True, axis=1)
+
+    # Locked players are kept, and no lineup picks up a locked player it didn't hold
+    assert ((before & locked) == (after & locked)).all()
+
+    # Swapped lineups fill the salary window and stay `min_uniques` apart
+    is_swapped = (summary["Status"] == "swapped").to_numpy()
+    salaries = swapped.salary_totals()[is_swapped]
+    assert ((salaries >= MIN_SALARY) & (salaries <= MAX_SALARY)).all()
+    members = after[is_swapped].astype(np.int64)
+    shared = members @ members.T
+    np.fill_diagonal(shared, 0)
+    assert shared.max(initial=0) <= swapped.matrix.shape[1] - MIN_UNIQUES
+
+
+def main():
+    player_pool = preprocess_player_pool(read_projections(MERGED_PROJECTIONS_FILE))
+    locked = locked_players(player_pool, LOCK_TIME)
+    print(f"{locked.sum()} of {len(player_pool)} players locked at {LOCK_TIME:%H:%M}")
+
+    # A full-size build to swap, solved before any game locked
+    lineups, _ = run_optimizer_workflow(
+        player_pool, NUM_LINEUPS, MIN_SALARY, MAX_SALARY, MIN_UNIQUES, VARIANCE_RANGE, backend="bnb", seed=SEED,
+    )
+    print(f"Built {len(lineups)} lineups")
+
+    print(f"\n=== Late swap of {len(lineups)} lineups ===")
+    print(f"{'backend':>8}  {'seconds':>8}  {'swapped':>8}  {'infeasible':>10}  {'points gained':>14}")
+    for backend in SOLVER_BACKENDS:
+        telemetry = Telemetry(backend)
+        start = time.perf_counter()
+        try:
+            swapped, summary = late_swap(
+                lineups, LOCK_TIME, min_salary=MIN_SALARY, max_salary=MAX_SALARY, min_uniques=MIN_UNIQUES,
+                backend=backend, telemetry=telemetry,
+            )
+        except ImportError as e:
+            print(f"Skipping {backend}: {e}")
+            continue
+        seconds = time.perf_counter() - start
+        check_swap(lineups, swapped, summary, locked)
+
+        gained = (summary["Points After"] - summary["Points Before"]).sum()
+        print(
+            f"{backend:>8}  {seconds:8.2f}  {(summary['Status'] == 'swapped').sum():8d}  "
+            f"{(summary['Status'] == 'infeasible').sum():10d}  {gained:14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.lineups import LineupSet
+from optimizer.player_pool import PlayerPool
+
+# Set user parameters
+NUM_LINEUPS = 10000  # Size of the synthetic build
+ROSTER_SIZE = 9
+
+
+def legacy_summaries(lineups):
+    """Totals and exposures with the original per-DataFrame loops."""
+    totals = pd.DataFrame(
+        {
+            "Total Salary": [lineup["Salary"].sum() for lineup in lineups],
+            "Total Projected Score": [lineup["ProjPts"].sum() for lineup in lineups],
+            "Total Projected Ownership": [lineup["ProjOwn"].sum() for lineup in lineups],
+        }
+    )
+    exposures = pd.concat(lineups, ignore_index=True)["Name"].value_counts()
+    return totals, exposures
+
+
+def main():
+    print("Loading merged projections...")
+    player_pool = pd.read_csv(MERGED_PROJECTIONS_FILE)
+    pool = PlayerPool.from_dataframe(player_pool)
+
+    # Random 9-player lineups stand in for a large build
+    rng = np.random.default_rng(0)
+    selections = np.argsort(rng.random((NUM_LINEUPS, len(pool))), axis=1)[:, :ROSTER_SIZE]
+    selections[-100:] = selections[:100]
+
+    # Legacy: one DataFrame copy per lineup
+    build_start = time.perf_counter()
+    lineups = [player_pool.iloc[selected].copy() for selected in selections]
+    legacy_build_ms = (time.perf_counter() - build_start) * 1000
+    legacy_bytes = sum(lineup.memory_usage(deep=True).sum() for lineup in lineups)
+    summary_start = time.perf_counter()
+    legacy_totals, legacy_exposures = legacy_summaries(lineups)
+    legacy_ms = (time.perf_counter() - summary_start) * 1000
+
+    # LineupSet: one int32 matrix
+    build_start = time.perf_counter()
+    lineup_set = LineupSet(pool, selections)
+    matrix_build_ms = (time.perf_counter() - build_start) * 1000
+    summary_start = time.perf_counter()
+    summary = lineup_set.summary()
+    exposures = lineup_set.exposures()
+    stacks = lineup_set.stack_sizes()
+    duplicates = lineup_set.duplicate_mask()
+    matrix_ms = (time.perf_counter() - summary_start) * 1000
+
+    # Both paths must agree
+    matches = (
+        np.array_equal(summary["Total Salary"], legacy_totals["Total Salary"])
+        and np.allclose(summary["Total Projected Score"], legacy_totals["Total Projected Score"], atol=1e-3)
+        and np.allclose(summary["Total Projected Ownership"], legacy_totals["Total Projected Ownership"], atol=1e-3)
+        and dict(zip(exposures["Player"], exposures["Appearances"])) == legacy_exposures.to_dict()
+    )
+
+    print(f"\n=== {NUM_LINEUPS} lineups ===")
+    print(f"DataFrame list: {legacy_bytes / 1024:10.0f} KB  build {legacy_build_ms:8.2f} ms  summarize {legacy_ms:8.2f} ms")
+    print(
+        f"LineupSet:      {lineup_set.nbytes / 1024:10.0f} KB  build {matrix_build_ms:8.2f} ms  "
+        f"summarize {matrix_ms:8.2f} ms (incl. stacks and duplicates)"
+    )
+    print(f"Duplicates found: {duplicates.sum()}, largest team stack: {stacks['Team Stack'].max()}")
+    print(f"Matches legacy: {matches}")
+
+    # An infeasible build is an empty set, not an error
+    empty = LineupSet.from_selections(pool, [], [])
+    assert empty.matrix.shape == (0, ROSTER_SIZE)
+    assert len(empty.exposures()) == len(empty.summary()) == len(empty.format_rows()) == 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+DK_SALARIES_FILE = os.path.join(BASE_DIR, "data", "DKSalaries(2).csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.constants import NFL_TEAMS
+from optimizer.matching import match_players
+
+# Set user parameters
+NUM_PLAYERS = [5000, 20000, 50000]  # DraftKings rows; the projection source has as many
+TYPO_RATE = 0.1  # Share of projection names with one letter changed
+SUFFIX_RATE = 0.1  # Share of projection names with punctuation or a suffix added
+
+
+def synthetic_sources(size, rng):
+    """Random DraftKings players and an id-less projection source naming them with some noise."""
+    dk = pd.read_csv(DK_SALARIES_FILE)
+    first_names = dk["Name"].str.split(" ").str[0].unique()
+    last_names = dk["Name"].str.split(" ").str[-1].unique()
+
+    # Random syllables keep names distinct within a team and position
+    syllables = np.array(["ka", "lo", "mi", "ro", "ta", "ve", "zu", "ne", "sa", "di"])
+    surnames = (
+        rng.choice(last_names, size) + rng.choice(syllables, size) + rng.choice(syllables, size)
+    ).astype(object)
+    teams = rng.choice(list(NFL_TEAMS), size)
+    dk_players = pd.DataFrame(
+        {
+            "Name": rng.choice(first_names, size) + " " + surnames,
+            "TeamAbbrev": teams,
+            "Position": rng.choice(["QB", "RB", "WR", "TE"], size, p=[0.1, 0.25, 0.45, 0.2]),
+        }
+    )
+
+    # The source spells teams out and mangles some names
+    names = dk_players["Name"].to_numpy(dtype=object).copy()
+    typos = rng.random(size) < TYPO_RATE
+    for i in np.flatnonzero(typos):
+        position = rng.integers(1, len(names[i]))
+        names[i] = names[i][:position] + "x" + names[i][position + 1:]
+    suffixes = ~typos & (rng.random(size) < SUFFIX_RATE)
+    names[suffixes] = [name.replace(" ", ". ", 1) + " Jr." for name in names[suffixes]]
+    source = pd.DataFrame(
+        {
+            "Name": names,
+            "Team": [NFL_TEAMS[team][1] for team in teams],
+            "Position": dk_players["Position"] + "/FLEX",
+            "ProjPts": rng.random(size) * 20,
+        }
+    ).sample(frac=1, random_state=0)
+    return dk_players, source
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'Players':>8} {'Seconds':>8} {'Matched':>8} {'Correct':>8} {'Reported':>9}")
+    for size in NUM_PLAYERS:
+        dk_players, source = synthetic_sources(size, rng)
+
+        start = time.perf_counter()
+        matches, report = match_players(dk_players, source)
+        seconds = time.perf_counter() - start
+
+        correct = (matches["dk_index"] == matches["source_index"]).mean()
+        print(f"{size:>8} {seconds:>8.3f} {len(matches):>8} {correct:>8.2%} {len(report):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+
+import pandas as pd
+from pulp import LpMaximize, LpProblem, LpVariable, lpSum
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.backends import build_lineup_model
+from optimizer.model import compile_player_pool
+from optimizer.constants import ROSTER_REQUIREMENTS
+
+# Set user parameters
+NUM_LINEUPS = 20  # Number of lineup models to build per method
+MIN_SALARY = 49500
+MAX_SALARY = 50000
+
+
+def build_model_legacy(player_pool, roster_requirements, min_salary, max_salary, lineup_num):
+    """Builds the lineup model with the original per-player `.loc` lookups (no solve)."""
+    player_pool["IsFLEX"] = player_pool["Position"].str.contains("FLEX")
+    player_pool["IsWR"] = player_pool["Position"].str.contains("WR")
+
+    problem = LpProblem(f"DraftKings_NFL_Lineup_Optimization_{lineup_num}", LpMaximize)
+    player_vars = {i: LpVariable(f"player_{i}", cat="Binary") for i in player_pool.index}
+    problem += lpSum(player_pool.loc[i, "ProjPts"] * player_vars[i] for i in player_pool.index)
+
+    salary_constraint = lpSum(player_pool.loc[i, "Salary"] * player_vars[i] for i in player_pool.index)
+    problem += salary_constraint <= max_salary
+    problem += salary_constraint >= min_salary
+
+    for pos, req in roster_requirements.items():
+        if pos == "FLEX":
+            problem += lpSum(player_vars[i] for i in player_pool.index if player_pool.loc[i, "IsFLEX"]) >= req
+        elif pos == "WR":
+            problem += lpSum(player_vars[i] for i in player_pool.index if player_pool.loc[i, "IsWR"]) >= req
+        else:
+            problem += lpSum(
+                player_vars[i] for i in player_pool.index if pos in player_pool.loc[i, "Position"]
+            ) == req
+
+    problem += lpSum(player_vars[i] for i in player_pool.index) == sum(roster_requirements.values())
+    return problem
+
+
+def build_model_compiled(player_pool, roster_requirements, min_salary, max_salary, lineup_num, compiled=None):
+    """Builds the lineup model from the compiled NumPy arrays (no solve)."""
+    if compiled is None:
+        compiled = compile_player_pool(player_pool, roster_requirements)
+    problem, _ = build_lineup_model(
+        compiled, min_salary, max_salary, name=f"DraftKings_NFL_Lineup_Optimization_{lineup_num}"
+    )
+    return problem
+
+
+def time_builds(build, player_pool, num_lineups, **kwargs):
+    """Returns the mean build time per lineup in milliseconds."""
+    start = time.perf_counter()
+    for lineup_num in range(num_lineups):
+        build(player_pool, ROSTER_REQUIREMENTS, MIN_SALARY, MAX_SALARY, lineup_num, **kwargs)
+    return (time.perf_counter() - start) / num_lineups * 1000
+
+
+def main():
+    print("Loading merged projections...")
+    player_pool = pd.read_csv(MERGED_PROJECTIONS_FILE)
+
+    for scale in (1, 10):
+        pool = pd.concat([player_pool] * scale, ignore_index=True)
+        legacy_ms = time_builds(build_model_legacy, pool, NUM_LINEUPS)
+
+        compile_start = time.perf_counter()
+        compiled = compile_player_pool(pool, ROSTER_REQUIREMENTS)
+        compile_ms = (time.perf_counter() - compile_start) * 1000
+        compiled_ms = time_builds(build_model_compiled, pool, NUM_LINEUPS, compiled=compiled)
+
+        print(f"\n=== {len(pool)} players, {NUM_LINEUPS} lineups ===")
+        print(f"Legacy build:   {legacy_ms:8.2f} ms/lineup")
+        print(f"Compile once:   {compile_ms:8.2f} ms")
+        print(f"Compiled build: {compiled_ms:8.2f} ms/lineup ({legacy_ms / compiled_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.opto_utils import preprocess_player_pool
+
+# Set user parameters
+POOL_SIZES = [500, 5000, 50000]
+REPEATS = 3
+
+
+def legacy_preprocess(player_pool):
+    """The original per-row game time parse and six regex scans over "Position"."""
+    def extract_game_time(game_info):
+        try:
+            return datetime.strptime(game_info.split(" ")[1] + " " + game_info.split(" ")[2], "%m/%d/%Y %I:%M%p")
+        except:
+            return None
+
+    player_pool["GameTime"] = player_pool["Game Info"].apply(extract_game_time)
+    player_pool["IsFLEX"] = player_pool["Position"].str.contains("RB|WR|TE")
+    player_pool["IsWR"] = player_pool["Position"].str.contains("WR")
+    player_pool["IsRB"] = player_pool["Position"].str.contains("RB")
+    player_pool["IsTE"] = player_pool["Position"].str.contains("TE")
+    player_pool["IsQB"] = player_pool["Position"].str.contains("QB")
+    player_pool["IsDST"] = player_pool["Position"].str.contains("DST")
+    return player_pool
+
+
+def synthetic_pool(slate, size, rng):
+    """Samples `size` players from the slate, with games spread over many kickoff times."""
+    pool = slate.iloc[rng.integers(0, len(slate), size)].reset_index(drop=True)
+    days = rng.integers(1, 29, size)
+    hours = rng.choice(["01:00PM", "04:05PM", "04:25PM", "08:20PM"], size)
+    teams = pool["Game Info"].str.split(" ").str[0]
+    pool["Game Info"] = teams + " 12/" + pd.Series(days).map("{:02d}".format) + "/2024 " + hours + " ET"
+
+    # A few unparseable games, which both paths must leave as NaT
+    pool.loc[::997, "Game Info"] = "Postponed"
+    return pool
+
+
+def best_ms(preprocess, pool):
+    """Best of REPEATS wall times for `preprocess` on a fresh copy of `pool`, in milliseconds."""
+    times = []
+    for _ in range(REPEATS):
+        player_pool = pool.copy()
+        start = time.perf_counter()
+        preprocess(player_pool)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def main():
+    print("Loading merged projections...")
+    slate = pd.read_csv(MERGED_PROJECTIONS_FILE)
+    rng = np.random.default_rng(0)
+
+    print(f"{'Players':>8} {'Legacy ms':>10} {'Vectorized ms':>14} {'Speedup':>8}")
+    for size in POOL_SIZES:
+        pool = synthetic_pool(slate, size, rng)
+
+        # Outputs must match exactly, dtypes included
+        pd.testing.assert_frame_equal(preprocess_player_pool(pool.copy()), legacy_preprocess(pool.copy()))
+
+        legacy_ms = best_ms(legacy_preprocess, pool)
+        vectorized_ms = best_ms(preprocess_player_pool, pool)
+        print(f"{size:>8} {legacy_ms:>10.1f} {vectorized_ms:>14.1f} {legacy_ms / vectorized_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, TEST_DIR)
+
+from synthetic_slate import generate_slate, random_lineups
+from optimizer.lineups import LineupSet
+from optimizer.opto_utils import preprocess_player_pool
+from optimizer.scoring import BOOM_RATIO, SCORE_BIN_WIDTH, score_lineups
+from optimizer.simulation import SlateSimulator
+
+# Set user parameters
+SEED = 2024
+NUM_PLAYERS = 500
+NUM_LINEUPS = 10000
+NUM_SIMS = 100000
+CHECK_LINEUPS = 200
+CHECK_SIMS = 5000
+
+
+def main():
+    player_pool = preprocess_player_pool(generate_slate(NUM_PLAYERS, seed=SEED))
+    lineups = LineupSet(player_pool, random_lineups(player_pool, NUM_LINEUPS, np.random.default_rng(SEED)))
+    simulator = SlateSimulator(player_pool)
+
+    # Full-size run, simulations streamed straight into the scorer
+    tracemalloc.start()
+    start = time.perf_counter()
+    summary = score_lineups(lineups, simulator.iter_batches(NUM_SIMS, seed=SEED))
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    full_bytes = NUM_LINEUPS * NUM_SIMS * 4
+    print(
+        f"{NUM_LINEUPS} lineups x {NUM_SIMS} sims: {seconds:.2f}s including simulation, peak memory "
+        f"{peak / 2 ** 20:.0f} MiB against {full_bytes / 2 ** 30:.1f} GiB for the full score matrix"
+    )
+    print(summary.head())
+    assert peak < full_bytes / 10
+
+    # Against exact statistics from the full score matrix of a sample
+    sample = LineupSet(player_pool, lineups.matrix[:CHECK_LINEUPS])
+    outcomes = simulator.simulate(CHECK_SIMS, seed=SEED + 1)
+    exact = outcomes[:, sample.matrix].sum(axis=2, dtype=np.float64)
+    checked = score_lineups(sample, outcomes)
+
+    assert np.allclose(checked["Mean"], exact.mean(axis=0), rtol=1e-5)
+    assert np.allclose(checked["Std"], exact.std(axis=0), rtol=1e-3)
+    for percentile in [25, 50, 99]:
+        gap = np.abs(checked[f"P{percentile}"] - np.percentile(exact, percentile, axis=0)).max()
+        print(f"P{percentile}: largest gap from exact {gap:.3f} points")
+        assert gap < SCORE_BIN_WIDTH
+    boom = (exact >= BOOM_RATIO * checked["Projected"].to_numpy()).mean(axis=0)
+    assert np.allclose(checked["Boom"], boom, atol=1e-3)
+
+    # Two lineups per sim make the top 1% of 200, so the rates sum to 2
+    top = checked["Top 1%"].sum()
+    print(f"Top 1% rates sum to {top:.3f}")
+    assert abs(top - 2) < 1e-6
+
+
+if __name__ == "__main__":
+    main()
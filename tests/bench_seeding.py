@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.builder import add_flex_flags
+from optimizer.columnar import read_projections
+from optimizer.constants import ROSTER_REQUIREMENTS
+from optimizer.main_opto import run_optimizer_workflow
+from optimizer.opto_utils import preprocess_player_pool
+from optimizer.parallel import _init_worker, _solve_projection_set
+from optimizer.variance import base_projections, generate_projection_matrix, set_seed_sequences
+
+# Set user parameters
+SEED = 2024
+NUM_SETS = 200
+VARIANCE_RANGE = 0.2
+WORKER_COUNTS = [1, 2, 4]
+MIN_SALARY = 49000
+MAX_SALARY = 50000
+MIN_UNIQUES = 3
+
+
+def worker_matrix(player_pool, max_workers):
+    """Projection sets as the parallel workers draw them, gathered back into a matrix."""
+    columns = np.arange(len(player_pool))
+    seed_sequences = set_seed_sequences(SEED, NUM_SETS)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(
+            player_pool, ROSTER_REQUIREMENTS, MIN_SALARY, MAX_SALARY, 0, "bnb", base_projections(player_pool),
+            columns,
+        ),
+    ) as executor:
+        tasks = [(i, seed_sequences[i], VARIANCE_RANGE, 1, ()) for i in range(NUM_SETS)]
+        results = executor.map(_solve_projection_set, tasks, chunksize=7)
+        return np.stack([projections for _, _, projections, _, _, _ in results])
+
+
+def main():
+    player_pool = add_flex_flags(preprocess_player_pool(read_projections(MERGED_PROJECTIONS_FILE)))
+
+    # The serial matrix is a pure function of the seed
+    start = time.perf_counter()
+    serial = generate_projection_matrix(player_pool, NUM_SETS, VARIANCE_RANGE, seed=SEED)
+    print(f"Serial draw of {NUM_SETS} sets: {(time.perf_counter() - start) * 1000:.1f}ms")
+    assert np.array_equal(serial, generate_projection_matrix(player_pool, NUM_SETS, VARIANCE_RANGE, seed=SEED))
+    assert not np.array_equal(serial, generate_projection_matrix(player_pool, NUM_SETS, VARIANCE_RANGE, seed=SEED + 1))
+
+    # A prefix of the sets doesn't depend on how many are drawn
+    assert np.array_equal(serial[:10], generate_projection_matrix(player_pool, 10, VARIANCE_RANGE, seed=SEED))
+
+    # Workers draw the same bits in float32, whatever the pool size or chunking
+    for max_workers in WORKER_COUNTS:
+        parallel = worker_matrix(player_pool, max_workers)
+        identical = parallel.dtype == serial.dtype and np.array_equal(parallel.view(np.uint32), serial.view(np.uint32))
+        print(f"{max_workers} workers: projection matrix bit-identical to serial: {identical}")
+        assert identical
+
+    # Without diversity cuts, serial and parallel builds pick the same lineups
+    builds = {}
+    for max_workers in [1, 2]:
+        lineups, _ = run_optimizer_workflow(
+            player_pool, 20, MIN_SALARY, MAX_SALARY, 0, VARIANCE_RANGE, max_workers=max_workers, backend="bnb",
+            seed=SEED,
+        )
+        builds[max_workers] = lineups
+    same = np.array_equal(np.sort(builds[1].matrix, axis=1), np.sort(builds[2].matrix, axis=1))
+    same_points = np.array_equal(builds[1].projections, builds[2].projections)
+    print(f"Serial and parallel builds: same lineups {same}, same projections {same_points}")
+    assert same_points
+
+    # Diversity cuts hold across the whole build whatever the worker count
+    builds = {}
+    for max_workers in WORKER_COUNTS:
+        lineups, _ = run_optimizer_workflow(
+            player_pool, 30, MIN_SALARY, MAX_SALARY, MIN_UNIQUES, VARIANCE_RANGE, max_workers=max_workers,
+            backend="bnb", seed=SEED,
+        )
+        builds[max_workers] = lineups
+        members = np.zeros((len(lineups), len(player_pool)), dtype=np.int64)
+        np.put_along_axis(members, lineups.matrix, 1, axis=1)
+        shared = members @ members.T
+        np.fill_diagonal(shared, 0)
+        print(f"{max_workers} workers with min_uniques {MIN_UNIQUES}: at most {shared.max()} players shared")
+        assert shared.max() <= lineups.matrix.shape[1] - MIN_UNIQUES
+    for max_workers in WORKER_COUNTS[1:]:
+        assert np.array_equal(builds[1].projections, builds[max_workers].projections)
+
+
+if __name__ == "__main__":
+    main()
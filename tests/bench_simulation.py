@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, TEST_DIR)
+
+from synthetic_slate import generate_slate
+from optimizer.simulation import SIM_POSITIONS, SlateSimulator, load_ratio_tables, opponent_teams
+
+# Set user parameters
+SEED = 2024
+NUM_PLAYERS = 500
+NUM_SIMS = 100000
+CHECK_SIMS = 20000
+CALIBRATION_TOLERANCE = 0.15  # Largest gap from the research ratios; rescaling means to projections shifts them
+
+
+def check_calibration(simulator, outcomes):
+    """Median player's simulated percentile ratios against the research tables, per position."""
+    ratios, _ = load_ratio_tables()
+    active = simulator.projections > 0
+    simulated = np.percentile(outcomes, ratios.columns.to_numpy() * 100, axis=0) / np.where(
+        active, simulator.projections, 1
+    )
+    worst = 0.0
+    for code, position in enumerate(SIM_POSITIONS):
+        players = np.flatnonzero((simulator.position_codes == code) & active)
+        measured = np.median(simulated[:, players], axis=1)
+        gap = np.abs(measured / ratios.loc[position].to_numpy() - 1).max()
+        worst = max(worst, gap)
+        print(f"{position:>4}: simulated {np.round(measured, 2)} research {np.round(ratios.loc[position].to_numpy(), 2)}")
+    print(f"Largest relative calibration gap: {worst:.3f}")
+    assert worst < CALIBRATION_TOLERANCE
+
+
+def pair_correlation(simulator, outcomes, first, second, same_team):
+    """Average outcome correlation between the top projected players of two positions, per team."""
+    pool = simulator.pool
+    teams = pool.teams[pool.team_codes]
+    opponents = opponent_teams(pool)
+    top = {}
+    for code in [SIM_POSITIONS.index(first), SIM_POSITIONS.index(second)]:
+        for team in np.unique(teams):
+            players = np.flatnonzero((simulator.position_codes == code) & (teams == team) & (simulator.projections > 0))
+            if len(players):
+                top[code, team] = players[np.argmax(simulator.projections[players])]
+
+    values = []
+    for team in np.unique(teams):
+        partner = team if same_team else opponents[teams == team][0]
+        pair = top.get((SIM_POSITIONS.index(first), team)), top.get((SIM_POSITIONS.index(second), partner))
+        if None not in pair:
+            values.append(np.corrcoef(outcomes[:, pair[0]], outcomes[:, pair[1]])[0, 1])
+    return float(np.mean(values))
+
+
+def main():
+    player_pool = generate_slate(NUM_PLAYERS, seed=SEED)
+    simulator = SlateSimulator(player_pool)
+
+    # Full-size run, streamed batch by batch so memory stays at one batch
+    tracemalloc.start()
+    start = time.perf_counter()
+    total = np.zeros(len(simulator), dtype=np.float64)
+    for batch in simulator.iter_batches(NUM_SIMS, seed=SEED):
+        total += batch.sum(axis=0)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{NUM_SIMS} sims x {len(simulator)} players: {seconds:.2f}s, peak memory {peak / 2 ** 20:.0f} MiB")
+
+    # Means track projections
+    means = total / NUM_SIMS
+    active = simulator.projections > 0
+    mean_gap = np.abs(means[active] / simulator.projections[active] - 1).max()
+    print(f"Largest relative gap between simulated mean and projection: {mean_gap:.3f}")
+    assert mean_gap < 0.05
+
+    # Same seed, same outcomes
+    outcomes = simulator.simulate(CHECK_SIMS, seed=SEED)
+    assert np.array_equal(outcomes, simulator.simulate(CHECK_SIMS, seed=SEED))
+
+    check_calibration(simulator, outcomes)
+
+    # Stacks move together, defenses move against the offense they face
+    qb_wr = pair_correlation(simulator, outcomes, "QB", "WR", same_team=True)
+    qb_te = pair_correlation(simulator, outcomes, "QB", "TE", same_team=True)
+    qb_opp_wr = pair_correlation(simulator, outcomes, "QB", "WR", same_team=False)
+    dst_opp_qb = pair_correlation(simulator, outcomes, "DST", "QB", same_team=False)
+    print(f"QB-WR {qb_wr:.2f}, QB-TE {qb_te:.2f}, QB-opposing WR {qb_opp_wr:.2f}, DST-opposing QB {dst_opp_qb:.2f}")
+    assert qb_wr > 0.2 and qb_te > 0.2 and qb_opp_wr > 0 and dst_opp_qb < -0.2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Importing the generator also puts the optimizer package on sys.path
+from synthetic_slate import BASE_DIR, TEST_DIR, generate_slate, random_lineups, slate_profile
+
+from opto_utils import format_lineup_for_display
+from optimizer.builder import SolverSession
+from optimizer.constants import ROSTER_REQUIREMENTS
+from optimizer.export import write_dk_upload
+from optimizer.lineups import LineupSet
+from optimizer.opto_utils import calculate_player_exposures, preprocess_player_pool
+from optimizer.variance import generate_projection_sets
+
+# Set user parameters
+POOL_SIZES = [100, 500, 1000, 2500, 5000]
+REPEATS = 3
+NUM_PROJECTION_SETS = 100  # Sets drawn per generate_projection_sets call
+NUM_SOLVES = 3  # Lineups solved per timed session, each adding a diversity cut
+NUM_LINEUPS = 1000  # Size of the random build used for exposures and formatting
+NUM_FORMATTED = 20  # Lineups passed through the per-lineup display formatter
+MIN_SALARY = 49000
+MAX_SALARY = 50000
+MIN_UNIQUES = 2
+RESULTS_DIR = os.path.join(TEST_DIR, "bench_results")
+
+
+def time_stage(run, setup=None, repeats=REPEATS):
+    """
+    Wall times of `run(setup())` over `repeats` runs; only `run` is timed.
+
+    Returns:
+        dict: "min_ms", "median_ms" and "repeats".
+    """
+    times = []
+    for _ in range(repeats):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        run(argument)
+        times.append((time.perf_counter() - start) * 1000)
+    return {"min_ms": round(min(times), 3), "median_ms": round(float(np.median(times)), 3), "repeats": repeats}
+
+
+def bench_pool(slate, backend, repeats):
+    """Times every stage on one synthetic slate, returning {stage: timing}."""
+    timings = {}
+    timings["preprocess_player_pool"] = time_stage(preprocess_player_pool, slate.copy, repeats)
+    player_pool = preprocess_player_pool(slate.copy())
+
+    timings["generate_projection_sets"] = time_stage(
+        lambda _: generate_projection_sets(player_pool, NUM_PROJECTION_SETS, 0.1, seed=0), repeats=repeats
+    )
+
+    # optimize_lineup split into the model build and the solves that follow it
+    def build(_):
+        return SolverSession(player_pool, ROSTER_REQUIREMENTS, MIN_SALARY, MAX_SALARY, MIN_UNIQUES, backend=backend)
+
+    timings["optimize_lineup.build"] = time_stage(build, repeats=repeats)
+    timings["optimize_lineup.solve"] = time_stage(
+        lambda session: session.solve_selections(num_lineups=NUM_SOLVES), lambda: build(None), repeats
+    )
+
+    # Exposures and formatting of a random build, in both lineup representations
+    lineups = LineupSet(player_pool, random_lineups(player_pool, NUM_LINEUPS, np.random.default_rng(1)))
+    frames = list(lineups)
+    timings["calculate_player_exposures.frames"] = time_stage(
+        lambda _: calculate_player_exposures(frames), repeats=repeats
+    )
+    timings["calculate_player_exposures.lineup_set"] = time_stage(
+        lambda _: calculate_player_exposures(lineups), repeats=repeats
+    )
+    timings["format_lineup_for_display"] = time_stage(
+        lambda _: [format_lineup_for_display(frame) for frame in frames[:NUM_FORMATTED]], repeats=repeats
+    )
+    timings["write_dk_upload"] = time_stage(lambda _: write_dk_upload(lineups, os.devnull), repeats=repeats)
+    return timings
+
+
+def git_revision():
+    """Current commit and whether the tree has local changes, or None outside a git checkout."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=BASE_DIR, capture_output=True, text=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+
+def compare(results, baseline_path):
+    """Prints each stage's median time next to a baseline results file's."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    before = {(row["stage"], row["players"]): row["median_ms"] for row in baseline["results"]}
+    print(f"\nCompared with {baseline['commit']} ({baseline_path}):")
+    print(f"{'Stage':<40} {'Players':>8} {'Before ms':>10} {'After ms':>10} {'Ratio':>7}")
+    for row in results:
+        previous = before.get((row["stage"], row["players"]))
+        if previous is None:
+            continue
+        print(
+            f"{row['stage']:<40} {row['players']:>8} {previous:>10.2f} {row['median_ms']:>10.2f} "
+            f"{row['median_ms'] / previous if previous else float('nan'):>6.2f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times the optimizer pipeline on synthetic slates.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=POOL_SIZES, help="Players per synthetic slate")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="Timed runs per stage")
+    parser.add_argument("--backend", default="cbc", help="Solver backend for the optimize_lineup stages")
+    parser.add_argument("--output", help="Results JSON path (default: tests/bench_results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    commit, dirty = git_revision()
+    profile = slate_profile()
+    results = []
+    print(f"{'Stage':<40} {'Players':>8} {'Min ms':>10} {'Median ms':>10}")
+    for size in args.sizes:
+        slate = generate_slate(size, seed=size, profile=profile)
+        for stage, timing in bench_pool(slate, args.backend, args.repeats).items():
+            results.append({"stage": stage, "players": size, **timing})
+            print(f"{stage:<40} {size:>8} {timing['min_ms']:>10.2f} {timing['median_ms']:>10.2f}")
+
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "backend": args.backend,
+        "parameters": {
+            "num_projection_sets": NUM_PROJECTION_SETS,
+            "num_solves": NUM_SOLVES,
+            "num_lineups": NUM_LINEUPS,
+            "num_formatted": NUM_FORMATTED,
+            "salary": [MIN_SALARY, MAX_SALARY],
+            "min_uniques": MIN_UNIQUES,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit or 'results'}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} timings to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Set up file paths and make the optimizer package importable
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TEST_DIR)
+MERGED_PROJECTIONS_FILE = os.path.join(BASE_DIR, "data", "merged_projections.csv")
+sys.path.insert(0, os.path.join(BASE_DIR, "optimizer"))
+
+from optimizer.constants import NFL_TEAMS
+
+# Players per team on a real main slate, and when its games kick off
+PLAYERS_PER_TEAM = 25
+KICKOFFS = {"01:00PM": 0.6, "04:05PM": 0.15, "04:25PM": 0.15, "08:20PM": 0.1}
+SLATE_DATE = "12/01/2024"
+
+
+def slate_profile(path=MERGED_PROJECTIONS_FILE):
+    """
+    Per-position distributions of a real slate, the model for synthetic ones.
+
+    Args:
+        path (str): Merged projections CSV to learn from.
+
+    Returns:
+        dict: Position -> {"share", "salaries", "active", "points_per_k", "own_per_point"}.
+            "active" is the share of players projected above zero, and the ratios are
+            taken over those players only.
+    """
+    slate = pd.read_csv(path)
+    profile = {}
+    for position, players in slate.groupby("Position"):
+        active = players[players["ProjPts"] > 0]
+        profile[position] = {
+            "share": len(players) / len(slate),
+            "salaries": players["Salary"].to_numpy(),
+            "active": len(active) / len(players),
+            "points_per_k": (active["ProjPts"] / active["Salary"] * 1000).to_numpy(),
+            "own_per_point": (active["ProjOwn"] / active["ProjPts"]).to_numpy(),
+        }
+    return profile
+
+
+def team_names(num_teams):
+    """NFL abbreviations, numbered once a slate needs more teams than the league has."""
+    abbreviations = list(NFL_TEAMS)
+    return [
+        abbreviations[i % len(abbreviations)] + (str(i // len(abbreviations) + 1) if i >= len(abbreviations) else "")
+        for i in range(num_teams)
+    ]
+
+
+def generate_slate(num_players, seed=0, profile=None):
+    """
+    Generates a DraftKings-like merged projections table of any size.
+
+    Teams come in pairs playing one game, each with one defense and players drawn in
+    the real slate's position mix. Salaries are sampled from the real salaries of the
+    position; projections scale salary by a real points-per-$1k ratio, with the real
+    share of zero projections; ownership scales the projection the same way.
+
+    Args:
+        num_players (int): Players on the slate.
+        seed (int): Seed for the draws. Equal seeds give identical slates.
+        profile (dict): Output of `slate_profile`. Defaults to the profile of
+            data/merged_projections.csv.
+
+    Returns:
+        pd.DataFrame: Columns "Name + ID", "Name", "Id", "Position", "Salary",
+            "Game Info", "TeamAbbrev", "AvgPointsPerGame", "ProjPts" and "ProjOwn".
+    """
+    profile = slate_profile() if profile is None else profile
+    rng = np.random.default_rng(seed)
+
+    # An even number of teams, each with a defense; the rest follow the real position mix
+    num_teams = max(2, 2 * round(num_players / PLAYERS_PER_TEAM / 2))
+    teams = np.array(team_names(num_teams))
+    skill = [position for position in profile if position != "DST"]
+    shares = np.array([profile[position]["share"] for position in skill])
+    positions = np.concatenate(
+        [np.full(num_teams, "DST"), rng.choice(skill, num_players - num_teams, p=shares / shares.sum())]
+    ).astype(object)
+    team_index = np.concatenate([np.arange(num_teams), rng.integers(num_teams, size=num_players - num_teams)])
+
+    # Salary, projection and ownership drawn from the real position's distributions
+    salary = np.zeros(num_players, dtype=np.int64)
+    points = np.zeros(num_players)
+    ownership = np.zeros(num_players)
+    for position, stats in profile.items():
+        rows = np.flatnonzero(positions == position)
+        salary[rows] = rng.choice(stats["salaries"], len(rows))
+        active = rows[rng.random(len(rows)) < stats["active"]]
+        points[active] = salary[active] / 1000 * rng.choice(stats["points_per_k"], len(active))
+        ownership[active] = points[active] * rng.choice(stats["own_per_point"], len(active))
+
+    # Games pair team 2k with 2k + 1 at one kickoff
+    kickoff = rng.choice(list(KICKOFFS), num_teams // 2, p=list(KICKOFFS.values()))
+    games = np.array(
+        [f"{teams[2 * g]}@{teams[2 * g + 1]} {SLATE_DATE} {kickoff[g]} ET" for g in range(num_teams // 2)]
+    )
+
+    ids = 40000000 + np.arange(num_players)
+    names = np.array([f"Player {i}" for i in range(num_players)], dtype=object)
+    names[:num_teams] = [f"{team} DST" for team in teams]
+    return pd.DataFrame(
+        {
+            "Name + ID": [f"{name} ({player_id})" for name, player_id in zip(names, ids)],
+            "Name": names,
+            "Id": ids,
+            "Position": positions,
+            "Salary": salary,
+            "Game Info": games[team_index // 2],
+            "TeamAbbrev": teams[team_index],
+            "AvgPointsPerGame": (points * rng.uniform(0.8, 1.2, num_players)).round(2),
+            "ProjPts": points.round(2),
+            "ProjOwn": ownership.round(1),
+        }
+    )
+
+
+def random_lineups(player_pool, num_lineups, rng):
+    """
+    Random legal-shape lineups, as a `(num_lineups, 9)` matrix of positional indices.
+
+    Args:
+        player_pool (pd.DataFrame): A preprocessed player pool with the "Is*" flags.
+        num_lineups (int): Lineups to draw.
+        rng (np.random.Generator): Generator to draw from.
+
+    Returns:
+        np.ndarray: One QB, two RBs, three WRs, a TE, a DST and a random RB/WR/TE FLEX per row.
+    """
+    shapes = [(1, 3, 3, 1, 1), (1, 2, 4, 1, 1), (1, 2, 3, 2, 1)]
+    by_position = [
+        np.flatnonzero(player_pool[flag].to_numpy()) for flag in ["IsQB", "IsRB", "IsWR", "IsTE", "IsDST"]
+    ]
+    shape_index = rng.integers(len(shapes), size=num_lineups)
+    matrix = np.empty((num_lineups, 9), dtype=np.int32)
+    for index, shape in enumerate(shapes):
+        rows = np.flatnonzero(shape_index == index)
+        picks = [
+            players[np.argsort(rng.random((len(rows), len(players))), axis=1)[:, :count]]
+            for players, count in zip(by_position, shape)
+        ]
+        matrix[rows] = np.hstack(picks)
+    return matrix
+
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: python tests/synthetic_slate.py NUM_PLAYERS OUTPUT_CSV")
+        return
+    slate = generate_slate(int(sys.argv[1]))
+    slate.to_csv(sys.argv[2], index=False)
+    print(f"Wrote {len(slate)} players on {slate['Game Info'].nunique()} games to {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()